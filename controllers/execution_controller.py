@@ -1,8 +1,11 @@
 import os
+import gzip
 import threading
 import datetime
 import csv
 
+from models import XmlBatchConverter, ShardedXmlConverter
+
 
 class ExecutionController:
     """파일 복사 및 실행 컨트롤러
@@ -15,7 +18,7 @@ class ExecutionController:
         """실행 컨트롤러 초기화
         
         Args:
-            db_manager: 데이터베이스 매니저 객체
+            db_manager: 상태 저장소 객체 (StateStore 구현)
             linux_ssh_client: Linux SSH 클라이언트 객체
             was_ssh_client: WAS SSH 클라이언트 객체
             data_processor: 데이터 프로세서 객체
@@ -32,6 +35,24 @@ class ExecutionController:
         self.parsing_active = False  # 파싱 작업 활성화 상태
         self.parsing_thread = None   # 파싱 작업 스레드
         
+        # XML → CSV 스트리밍 변환 사용 여부 (False면 전체 레코드를 메모리에 읽은 뒤 저장)
+        self.stream_xml_to_csv = True
+        # 변환 후 트리뷰에 표시할 행 수
+        self.parse_preview_count = 10
+        # 일괄 변환 작업 프로세스 수 (None이면 CPU 코어 수)
+        self.batch_max_workers = None
+        self.batch_converter = None  # 진행 중인 일괄 변환기
+        # 이 크기 이상인 XML 파일은 구간으로 나누어 여러 프로세스에서 변환 (CPU 코어가 2개 이상일 때)
+        self.shard_min_size = 256 * 1024 * 1024
+        self.parse_shards = None  # 구간 수 (None이면 CPU 코어 수)
+        self.shard_converter = None  # 진행 중인 구간 분할 변환기
+        
+        # CSV 내보내기 상태
+        self.export_active = False
+        self.export_thread = None
+        self.export_cancel_event = threading.Event()
+        self.export_batch_size = 1000
+        
         # 콜백 함수
         self.progress_callback = None
         self.status_callback = None
@@ -43,7 +64,7 @@ class ExecutionController:
         """종속성 설정
         
         Args:
-            db_manager: 데이터베이스 매니저 객체
+            db_manager: 상태 저장소 객체 (StateStore 구현)
             linux_ssh_client: Linux SSH 클라이언트 객체
             was_ssh_client: WAS SSH 클라이언트 객체
             data_processor: 데이터 프로세서 객체
@@ -206,12 +227,66 @@ class ExecutionController:
             self.log(f"{table_name} 데이터 불러오기 오류: {e}")
             return [], []
     
-    def export_to_csv(self, table_name, file_path):
-        """테이블 데이터를 CSV로 내보내기
+    def load_table_page(self, table_name, cursor=None, page_size=100, sort_column=None,
+                        descending=False, filters=None):
+        """테이블 데이터 한 페이지 조회 (스크롤 시 다음 페이지 조회용)
+        
+        Args:
+            table_name (str): 테이블명
+            cursor (tuple, optional): 다음 페이지 커서 (첫 페이지는 None). Defaults to None.
+            page_size (int, optional): 페이지 행 수. Defaults to 100.
+            sort_column (str, optional): 정렬 컬럼. Defaults to None.
+            descending (bool, optional): 내림차순 여부. Defaults to False.
+            filters (dict, optional): {컬럼명: 값} 조건. Defaults to None.
+        
+        Returns:
+            tuple: (컬럼 목록, 데이터 행 목록, 다음 페이지 커서)
+        """
+        if not self.db_manager:
+            return [], [], None
+        
+        try:
+            columns = [col[0] for col in self.db_manager.get_table_columns(table_name)]
+            rows, next_cursor = self.db_manager.get_table_page(
+                table_name, cursor, page_size, sort_column, descending, filters
+            )
+            return columns, rows, next_cursor
+        except Exception as e:
+            self.log(f"{table_name} 데이터 불러오기 오류: {e}")
+            return [], [], None
+    
+    def search_task_log(self, text, table_nm=None, limit=200):
+        """작업 로그 파일명/오류 메시지 검색
+        
+        Args:
+            text (str): 검색어
+            table_nm (str, optional): 테이블명. Defaults to None.
+            limit (int, optional): 최대 결과 수. Defaults to 200.
+        
+        Returns:
+            tuple: (컬럼 목록, 데이터 행 목록)
+        """
+        columns = ['TABLE_NM', 'FILE_NM', 'START_TIME', 'END_TIME', 'ERROR_MSG']
+        if not self.db_manager or not text.strip():
+            return columns, []
+        
+        try:
+            results = self.db_manager.search_task_log(text, table_nm=table_nm, limit=limit)
+            rows = [(r['table_nm'], r['file_nm'], r['start_time'], r['end_time'], r['error_msg'] or '')
+                    for r in results]
+            return columns, rows
+        except Exception as e:
+            self.log(f"작업 로그 검색 오류: {e}")
+            return columns, []
+    
+    def export_to_csv(self, table_name, file_path, compress=None, progress_callback=None):
+        """테이블 전체 데이터를 CSV로 내보내기 (행 수 제한 없이 배치 단위로 기록)
         
         Args:
             table_name (str): 테이블명
             file_path (str): 저장할 파일 경로
+            compress (bool, optional): gzip 압축 여부. None이면 확장자(.gz)로 판단. Defaults to None.
+            progress_callback (function, optional): (기록한 행 수, 전체 행 수) 콜백. Defaults to None.
         
         Returns:
             bool: 내보내기 성공 여부
@@ -219,40 +294,19 @@ class ExecutionController:
         if not self.db_manager:
             return False
         
+        # 이전 백그라운드 내보내기의 취소 요청이 남아 있지 않도록 초기화
+        self.export_cancel_event.clear()
+        
         try:
-            # SQLite 관리 테이블의 컬럼 정보 조회
-            columns_info = self.db_manager.get_table_columns(table_name)
-            columns = [col[0] for col in columns_info]  # 컬럼명만 추출
-            
-            # 데이터 조회 (전체 데이터)
-            rows = self.db_manager.get_table_data_sample(table_name, limit=1000)
-            
-            # 데이터가 없는 경우
-            if not rows:
+            written = self._write_csv(table_name, file_path, compress, progress_callback)
+            if written is None:
+                self.log(f"{table_name} 테이블 CSV 내보내기가 취소되었습니다.")
+                return False
+            if written == 0:
                 self.log(f"{table_name} 테이블에 표시할 데이터가 없습니다.")
                 return False
             
-            # CSV 파일 생성
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                csv_writer = csv.writer(csvfile)
-                
-                # 헤더 행 추가
-                csv_writer.writerow(columns)
-                
-                # 데이터 행 추가
-                for row_data in rows:
-                    # 데이터 형식 변환
-                    formatted_row = []
-                    for cell_value in row_data:
-                        if cell_value is None:
-                            formatted_row.append("")
-                        elif isinstance(cell_value, datetime.datetime):
-                            formatted_row.append(cell_value.strftime('%Y-%m-%d %H:%M:%S'))
-                        else:
-                            formatted_row.append(str(cell_value))
-                    csv_writer.writerow(formatted_row)
-            
-            self.log(f"{table_name} 테이블이 CSV 파일로 저장되었습니다.\n저장 위치: {file_path}")
+            self.log(f"{table_name} 테이블이 CSV 파일로 저장되었습니다. ({written}행)\n저장 위치: {file_path}")
             return True
             
         except Exception as e:
@@ -265,6 +319,136 @@ class ExecutionController:
         if self.progress_callback:
             self.progress_callback(None, None, "refresh")
     
+    def start_export(self, table_name, file_path, compress=None, progress_callback=None,
+                     finish_callback=None):
+        """백그라운드 스레드에서 CSV 내보내기 시작
+        
+        Args:
+            table_name (str): 테이블명
+            file_path (str): 저장할 파일 경로
+            compress (bool, optional): gzip 압축 여부. None이면 확장자(.gz)로 판단. Defaults to None.
+            progress_callback (function, optional): (기록한 행 수, 전체 행 수) 콜백. Defaults to None.
+            finish_callback (function, optional): (상태, 기록한 행 수) 콜백.
+                상태는 "완료", "데이터 없음", "중단", "오류". Defaults to None.
+        
+        Returns:
+            bool: 작업 시작 성공 여부
+        """
+        if self.export_active:
+            self.log("이미 CSV 내보내기가 진행 중입니다.")
+            return False
+        if not self.db_manager:
+            return False
+        
+        self.export_active = True
+        self.export_cancel_event.clear()
+        self.export_thread = threading.Thread(
+            target=self._run_export,
+            args=(table_name, file_path, compress, progress_callback, finish_callback),
+            daemon=True
+        )
+        self.export_thread.start()
+        return True
+    
+    def cancel_export(self):
+        """진행 중인 CSV 내보내기 취소 요청
+        
+        Returns:
+            bool: 취소 요청 여부
+        """
+        if not self.export_active:
+            return False
+        self.export_cancel_event.set()
+        self.log("CSV 내보내기 취소 요청...")
+        return True
+    
+    def _run_export(self, table_name, file_path, compress, progress_callback, finish_callback):
+        """CSV 내보내기 스레드 실행 (내부 함수)"""
+        status, written = "오류", 0
+        try:
+            written = self._write_csv(table_name, file_path, compress, progress_callback)
+            if written is None:
+                status, written = "중단", 0
+                self.log(f"{table_name} 테이블 CSV 내보내기가 취소되었습니다.")
+            elif written == 0:
+                status = "데이터 없음"
+                self.log(f"{table_name} 테이블에 표시할 데이터가 없습니다.")
+            else:
+                status = "완료"
+                self.log(f"{table_name} 테이블이 CSV 파일로 저장되었습니다. ({written}행)\n저장 위치: {file_path}")
+        except Exception as e:
+            self.log(f"CSV 파일 저장 중 오류 발생: {e}")
+        finally:
+            self.export_active = False
+            if finish_callback:
+                finish_callback(status, written)
+    
+    def _write_csv(self, table_name, file_path, compress=None, progress_callback=None):
+        """테이블 행을 keyset 페이지 단위로 읽어 CSV 파일에 기록 (내부 함수)
+        
+        페이지마다 짧은 읽기로 조회하므로 큰 테이블을 내보내는 동안에도
+        읽기 트랜잭션이 WAL 체크포인트를 막지 않는다 (내보내는 중 추가된 행도 포함될 수 있음).
+        임시 파일(.part)에 기록한 뒤 완료 시 교체하므로 중단/오류 시 기존 파일이 남지 않는다.
+        
+        Returns:
+            int: 기록한 행 수 (데이터가 없으면 0, 취소되면 None)
+        """
+        if compress is None:
+            compress = file_path.lower().endswith('.gz')
+        
+        # SQLite 관리 테이블의 컬럼 정보 조회
+        columns_info = self.db_manager.get_table_columns(table_name)
+        columns = [col[0] for col in columns_info]  # 컬럼명만 추출
+        # 전체 행 수는 진행률 표시용 추정치 (별도의 짧은 읽기)
+        total = self.db_manager.count_table_rows(table_name)
+        
+        part_path = file_path + '.part'
+        opener = gzip.open if compress else open
+        written = 0
+        try:
+            with opener(part_path, 'wt', newline='', encoding='utf-8') as csvfile:
+                csv_writer = csv.writer(csvfile)
+                
+                # 헤더 행 추가
+                csv_writer.writerow(columns)
+                
+                # 데이터 행 추가 (페이지 단위)
+                cursor = None
+                while not self.export_cancel_event.is_set():
+                    rows, cursor = self.db_manager.get_table_page(table_name, cursor, self.export_batch_size)
+                    csv_writer.writerows(self._format_csv_row(row_data) for row_data in rows)
+                    written += len(rows)
+                    if progress_callback:
+                        progress_callback(written, max(total, written))
+                    if cursor is None:
+                        break
+            
+            if self.export_cancel_event.is_set():
+                os.remove(part_path)
+                return None
+            if written == 0:
+                os.remove(part_path)
+                return 0
+            
+            os.replace(part_path, file_path)
+            return written
+        except Exception:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+    
+    def _format_csv_row(self, row_data):
+        """CSV 기록용 데이터 형식 변환"""
+        formatted_row = []
+        for cell_value in row_data:
+            if cell_value is None:
+                formatted_row.append("")
+            elif isinstance(cell_value, datetime.datetime):
+                formatted_row.append(cell_value.strftime('%Y-%m-%d %H:%M:%S'))
+            else:
+                formatted_row.append(str(cell_value))
+        return formatted_row
+
     # ============================================================
     # 오프라인 모드 함수들 (XML 파싱)
     # ============================================================
@@ -309,6 +493,52 @@ class ExecutionController:
         
         return True
     
+    def start_batch_parse(self, source, save_path):
+        """XML 일괄 변환 작업 시작 (오프라인 모드)
+        
+        Args:
+            source (str): XML 파일이 있는 디렉토리 또는 glob 패턴
+            save_path (str): 결과 저장 경로
+            
+        Returns:
+            bool: 작업 시작 성공 여부
+        """
+        # 이미 파싱 작업 중인지 확인
+        if self.parsing_active:
+            self.log("이미 파싱 작업이 진행 중입니다.")
+            return False
+        
+        if not save_path:
+            self.log("저장 경로가 지정되지 않았습니다.")
+            return False
+        
+        xml_files = XmlBatchConverter.collect_files(source)
+        if not xml_files:
+            self.log(f"변환할 XML 파일이 없습니다: {source}")
+            return False
+        
+        # 상태 업데이트
+        self.parsing_active = True
+        self.batch_converter = XmlBatchConverter(
+            max_workers=self.batch_max_workers,
+            callback=self.log,
+            xml_backend=self.data_processor.xml_backend
+        )
+        
+        # 상태 콜백 호출
+        if self.status_callback:
+            self.status_callback("파싱중", True)
+        
+        # 새 스레드에서 일괄 변환 시작 (스레드는 진행 상황만 수집, 변환은 작업 프로세스에서 수행)
+        self.parsing_thread = threading.Thread(
+            target=self._run_batch_parse,
+            args=(xml_files, save_path),
+            daemon=True
+        )
+        self.parsing_thread.start()
+        
+        return True
+    
     def stop_parse(self):
         """XML 파싱 작업 중지 (오프라인 모드)
         
@@ -320,6 +550,10 @@ class ExecutionController:
         
         # 파싱 작업 중지 플래그 설정
         self.parsing_active = False
+        if self.batch_converter:
+            self.batch_converter.cancel()
+        if self.shard_converter:
+            self.shard_converter.cancel()
         self.log("파싱 중지 요청...")
         
         # 상태 콜백 호출
@@ -336,7 +570,16 @@ class ExecutionController:
             save_path (str): 결과 저장 경로
         """
         try:
-            self.log(f"XML 파일 파싱 시작: {xml_file_path}")
+            self.log(f"XML 파일 파싱 시작: {xml_file_path} (파서: {self.data_processor.xml_backend})")
+            
+            # 출력 파일명 생성
+            xml_file_name = os.path.basename(xml_file_path)
+            csv_file_name = os.path.splitext(xml_file_name)[0] + ".csv"
+            csv_file_path = os.path.join(save_path, csv_file_name)
+            
+            if self.stream_xml_to_csv:
+                self._convert_xml_file(xml_file_path, csv_file_path)
+                return
             
             # 파싱 작업 수행
             sorted_columns, parsed_data, total_records = self.data_processor.parse_xml_file(
@@ -365,12 +608,6 @@ class ExecutionController:
             
             # CSV 파일로 저장
             if parsed_data:
-                # 출력 파일명 생성
-                xml_file_name = os.path.basename(xml_file_path)
-                csv_file_name = os.path.splitext(xml_file_name)[0] + ".csv"
-                csv_file_path = os.path.join(save_path, csv_file_name)
-                
-                # CSV 저장
                 self.data_processor.save_to_csv(
                     csv_file_path,
                     sorted_columns,
@@ -385,6 +622,99 @@ class ExecutionController:
             self.log(f"파싱 중 오류 발생: {str(e)}")
             self._finish_parsing("오류")
     
+    def _convert_xml_file(self, xml_file_path, csv_file_path):
+        """XML 파일을 CSV로 스트리밍 변환 (컬럼 수집 → 레코드 기록, 내부 함수)
+        
+        Args:
+            xml_file_path (str): XML 파일 경로
+            csv_file_path (str): 저장할 CSV 파일 경로
+        """
+        shard_count = self.parse_shards or os.cpu_count() or 1
+        if shard_count > 1 and os.path.getsize(xml_file_path) >= self.shard_min_size:
+            # 큰 파일은 DATA_RECORD 경계로 나누어 구간별 프로세스에서 변환
+            self.shard_converter = ShardedXmlConverter(
+                shard_count, callback=self.log, xml_backend=self.data_processor.xml_backend
+            )
+            try:
+                result = self.shard_converter.convert(
+                    xml_file_path,
+                    csv_file_path,
+                    progress_callback=self._update_parse_progress,
+                    preview_count=self.parse_preview_count
+                )
+            finally:
+                self.shard_converter = None
+        else:
+            result = self.data_processor.convert_xml_to_csv(
+                xml_file_path,
+                csv_file_path,
+                callback=self.log,
+                progress_callback=self._update_parse_progress,
+                is_cancelled=lambda: not self.parsing_active,
+                preview_count=self.parse_preview_count
+            )
+        
+        # 중단 요청 확인
+        if result is None or not self.parsing_active:
+            self.log("파싱 강제 종료됨")
+            self._finish_parsing("중단")
+            return
+        
+        # 트리뷰 컬럼 업데이트 및 앞쪽 행 표시
+        columns, _, preview = result
+        if self.tree_update_callback and columns:
+            self.tree_update_callback(columns)
+            for row_values in preview:
+                self.tree_item_callback(row_values)
+        
+        self._finish_parsing("완료")
+    
+    def _run_batch_parse(self, xml_files, save_path):
+        """XML 일괄 변환 작업 실행 (내부 함수)
+        
+        Args:
+            xml_files (list): XML 파일 경로 목록
+            save_path (str): 결과 저장 경로
+        """
+        try:
+            # 트리뷰에 파일별 결과 표시
+            if self.tree_update_callback:
+                self.tree_update_callback(["파일", "상태", "레코드 수", "컬럼 수", "소요 시간(초)", "메시지"])
+            
+            def file_finished(result):
+                # 진행 중 알림(변환중)은 트리뷰에 표시하지 않음
+                if result['status'] == '변환중':
+                    return
+                if self.tree_item_callback:
+                    self.tree_item_callback([
+                        os.path.basename(result['xml_path']),
+                        result['status'],
+                        result['records'],
+                        result['columns'],
+                        f"{result['elapsed']:.1f}",
+                        result['error'] or ""
+                    ])
+            
+            summary = self.batch_converter.convert(
+                xml_files,
+                save_path,
+                file_callback=file_finished,
+                progress_callback=lambda done, total: self._update_parse_progress(done, total, done / total * 100)
+            )
+            
+            if not self.parsing_active or summary['cancelled']:
+                self._finish_parsing("중단")
+            elif summary['failed']:
+                self._finish_parsing("오류")
+            else:
+                self._finish_parsing("완료")
+            
+        except Exception as e:
+            self.log(f"일괄 변환 중 오류 발생: {str(e)}")
+            self._finish_parsing("오류")
+        finally:
+            self.batch_converter = None
+    
     def _update_parse_progress(self, current, total, progress):
         """파싱 진행 상태 업데이트
         
@@ -8,7 +8,7 @@ class SettingsController:
         """설정 컨트롤러 초기화
         
         Args:
-            db_manager: 데이터베이스 매니저 객체
+            db_manager: 상태 저장소 객체 (StateStore 구현)
             linux_ssh_client: Linux SSH 클라이언트 객체
             was_ssh_client: WAS SSH 클라이언트 객체
         """
@@ -23,7 +23,7 @@ class SettingsController:
         """종속성 설정
         
         Args:
-            db_manager: 데이터베이스 매니저 객체
+            db_manager: 상태 저장소 객체 (StateStore 구현)
             linux_ssh_client: Linux SSH 클라이언트 객체
             was_ssh_client: WAS SSH 클라이언트 객체
         """
@@ -0,0 +1,394 @@
+import sys
+import os
+import json
+import time
+import signal
+import logging
+import argparse
+import datetime
+import threading
+import configparser
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+
+# views 모듈(Tkinter)을 임포트하지 않도록 모델만 직접 임포트
+from models.database import DatabaseManager
+from models.ssh_client import SSHClient
+from models.scheduler import SchedulerManager
+from models.shard_coordinator import ShardCoordinator
+from models.snapshot import SnapshotManager
+
+
+DEFAULT_CONFIG = {
+    'database': {
+        'path': 'data.db',
+        'slow_query_ms': '200',
+        'query_report': 'query_report.json',
+        'task_log_partitions': 'no',
+        'task_log_partition_dir': '',
+        'task_log_archive_dir': '',
+    },
+    'scheduler': {
+        'drain_timeout': '10',
+        'staging_dir': '',
+        'max_parallel_tables': '5',
+        'startup_ramp_interval': '2',
+    },
+    'shard': {
+        'enabled': 'no',
+        'instance_id': '',
+        'lease_ttl': '30',
+    },
+    'retention': {
+        'enabled': 'yes',
+        'days': '90',
+        'interval': '60',
+        'convert_auto_vacuum': 'no',
+    },
+    'snapshot': {
+        'enabled': 'no',
+        'dir': 'snapshots',
+        'interval': '360',
+        'keep': '14',
+    },
+    'daemon': {
+        'log_dir': 'logs',
+        'status_file': 'status.json',
+        'status_interval': '5',
+    },
+}
+
+
+# 설정 파일 로드
+def load_config(config_path):
+    """INI 설정 파일 로드
+
+    Args:
+        config_path (str): 설정 파일 경로
+
+    Returns:
+        configparser.ConfigParser: 기본값이 채워진 설정 객체
+    """
+    config = configparser.ConfigParser()
+    config.read_dict(DEFAULT_CONFIG)
+
+    if not config.read(config_path, encoding='utf-8'):
+        raise FileNotFoundError(f"설정 파일을 찾을 수 없습니다: {config_path}")
+
+    for section in ('linux', 'was'):
+        if not config.has_section(section):
+            raise ValueError(f"설정 파일에 [{section}] 섹션이 없습니다.")
+
+    return config
+
+
+# 로그 설정 (파일 전용)
+def setup_logging(log_dir):
+    if not os.path.isabs(log_dir):
+        log_dir = os.path.join(current_dir, log_dir)
+    os.makedirs(log_dir, exist_ok=True)
+
+    log_filename = os.path.join(log_dir, f'daemon_{datetime.datetime.now().strftime("%Y%m%d")}.log')
+
+    # 로그 포맷 설정
+    log_format = '%(asctime)s [%(levelname)s] - %(name)s - %(message)s'
+    formatter = logging.Formatter(log_format)
+
+    # 파일 핸들러 설정
+    file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+    file_handler.setFormatter(formatter)
+
+    # 루트 로거 설정
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(file_handler)
+
+    return root_logger
+
+
+def create_ssh_client(config, section):
+    """설정 섹션으로 SSH 클라이언트 생성
+
+    Args:
+        config (configparser.ConfigParser): 설정 객체
+        section (str): 섹션명 ('linux' 또는 'was')
+
+    Returns:
+        SSHClient: 접속 정보가 설정된 SSH 클라이언트
+    """
+    client = SSHClient()
+    client.set_connection_info(
+        config.get(section, 'ip'),
+        config.getint(section, 'port', fallback=22),
+        config.get(section, 'username'),
+        config.get(section, 'password', fallback=''),
+        config.getint(section, 'timeout', fallback=3)
+    )
+    return client
+
+
+class StatusWriter:
+    """스케줄러 상태를 JSON 파일로 주기적으로 기록하는 클래스
+
+    UI나 모니터링 도구는 이 파일을 읽어 데몬 상태를 관찰할 수 있다.
+    """
+
+    def __init__(self, scheduler_manager, status_file, interval=5):
+        """상태 기록기 초기화
+
+        Args:
+            scheduler_manager: 스케줄러 매니저 객체
+            status_file (str): 상태 파일 경로
+            interval (int, optional): 기록 주기(초). Defaults to 5.
+        """
+        self.scheduler_manager = scheduler_manager
+        self.status_file = status_file
+        self.interval = interval
+        self.started_at = datetime.datetime.now()
+
+        # 최근 파일 처리 결과 (테이블별 마지막 이벤트)
+        self.last_events = {}
+        self._lock = threading.Lock()
+
+        self.thread = None
+        self.running = False
+
+    def on_progress(self, table_nm, file_name, status, current=0, total=100):
+        """스케줄러 진행 콜백 (테이블별 마지막 이벤트 저장)"""
+        if table_nm is None:
+            return
+        with self._lock:
+            self.last_events[table_nm] = {
+                'file_name': file_name,
+                'status': status,
+                'time': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            }
+
+    def write(self):
+        """현재 상태를 파일에 기록 (임시 파일 후 교체)"""
+        with self._lock:
+            status = self.scheduler_manager.get_status()
+            status['pid'] = os.getpid()
+            status['started_at'] = self.started_at.strftime('%Y-%m-%d %H:%M:%S')
+            status['updated_at'] = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            status['last_events'] = dict(self.last_events)
+
+        tmp_file = self.status_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(status, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, self.status_file)
+
+    def start(self):
+        """상태 기록 스레드 시작"""
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """상태 기록 스레드 중지 (마지막 상태 기록)"""
+        self.running = False
+        if self.thread:
+            self.thread.join(timeout=self.interval + 1)
+        self.write()
+
+    def _run(self):
+        while self.running:
+            try:
+                self.write()
+            except Exception as e:
+                logging.getLogger('StatusWriter').error(f"상태 파일 기록 오류: {e}")
+
+            # 다음 기록까지 대기
+            for _ in range(self.interval * 10):
+                if not self.running:
+                    break
+                time.sleep(0.1)
+
+
+def read_status(status_file):
+    """상태 파일 조회 (관찰자용)
+
+    Args:
+        status_file (str): 상태 파일 경로
+
+    Returns:
+        dict: 상태 정보 (파일이 없으면 None)
+    """
+    if not os.path.exists(status_file):
+        return None
+    with open(status_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def resolve_path(path):
+    """상대 경로를 프로젝트 루트 기준 절대 경로로 변환"""
+    return path if os.path.isabs(path) else os.path.join(current_dir, path)
+
+
+def create_snapshot_manager(config, db_manager):
+    """설정으로 스냅샷 관리자 생성"""
+    return SnapshotManager(
+        db_manager,
+        resolve_path(config.get('snapshot', 'dir')),
+        keep=config.getint('snapshot', 'keep')
+    )
+
+
+def restore_snapshot(config, snapshot_path):
+    """스냅샷으로 상태 데이터베이스 복원 (데몬이 중지된 상태에서 실행)
+
+    Args:
+        config (configparser.ConfigParser): 설정 객체
+        snapshot_path (str): 복원할 스냅샷 경로
+
+    Returns:
+        int: 프로세스 종료 코드
+    """
+    ok, message = DatabaseManager.validate_backup(snapshot_path)
+    if not ok:
+        print(f"스냅샷 검사 실패: {message}", file=sys.stderr)
+        return 1
+
+    db_manager = DatabaseManager(resolve_path(config.get('database', 'path')))
+    try:
+        before_path = create_snapshot_manager(config, db_manager).restore(snapshot_path)
+    except Exception as e:
+        print(f"복원 실패: {e}", file=sys.stderr)
+        return 1
+    finally:
+        db_manager.close_all_connections()
+
+    print(f"복원 완료: {snapshot_path}")
+    print(f"복원 전 데이터베이스: {before_path}")
+    return 0
+
+
+def run_daemon(config):
+    """헤드리스 스케줄러 실행 (종료 신호까지 대기)
+
+    Args:
+        config (configparser.ConfigParser): 설정 객체
+
+    Returns:
+        int: 프로세스 종료 코드
+    """
+    logger = setup_logging(config.get('daemon', 'log_dir'))
+    logger.info("데몬 시작")
+
+    # 모델 객체 생성
+    db_manager = DatabaseManager(resolve_path(config.get('database', 'path')))
+    db_manager.query_stats.slow_query_ms = config.getfloat('database', 'slow_query_ms')
+    query_report_file = resolve_path(config.get('database', 'query_report'))
+    if config.getboolean('database', 'task_log_partitions'):
+        partition_dir = config.get('database', 'task_log_partition_dir')
+        archive_dir = config.get('database', 'task_log_archive_dir')
+        db_manager.enable_task_log_partitions(
+            resolve_path(partition_dir) if partition_dir else None,
+            resolve_path(archive_dir) if archive_dir else None
+        )
+    linux_ssh_client = create_ssh_client(config, 'linux')
+    was_ssh_client = create_ssh_client(config, 'was')
+    scheduler_manager = SchedulerManager(db_manager, linux_ssh_client, was_ssh_client)
+    scheduler_manager.drain_timeout = config.getfloat('scheduler', 'drain_timeout')
+    scheduler_manager.max_parallel_tables = config.getint('scheduler', 'max_parallel_tables')
+    scheduler_manager.startup_ramp_interval = config.getfloat('scheduler', 'startup_ramp_interval')
+    if config.get('scheduler', 'staging_dir'):
+        scheduler_manager.staging_dir = resolve_path(config.get('scheduler', 'staging_dir'))
+
+    # 다중 인스턴스 테이블 분배 (공유 DB 파일 사용)
+    if config.getboolean('shard', 'enabled'):
+        scheduler_manager.set_shard_coordinator(ShardCoordinator(
+            db_manager,
+            instance_id=config.get('shard', 'instance_id') or None,
+            lease_ttl=config.getfloat('shard', 'lease_ttl')
+        ))
+
+    # 작업 로그 보존 (일간 집계 후 오래된 로그 삭제)
+    if config.getboolean('retention', 'enabled'):
+        scheduler_manager.retention_manager.retention_days = config.getint('retention', 'days')
+        scheduler_manager.retention_manager.convert_auto_vacuum = config.getboolean('retention', 'convert_auto_vacuum')
+        scheduler_manager.retention_interval = config.getint('retention', 'interval')
+    else:
+        scheduler_manager.retention_manager = None
+
+    # 상태 데이터베이스 주기적 스냅샷
+    if config.getboolean('snapshot', 'enabled'):
+        scheduler_manager.snapshot_manager = create_snapshot_manager(config, db_manager)
+        scheduler_manager.snapshot_interval = config.getint('snapshot', 'interval')
+
+    status_writer = StatusWriter(
+        scheduler_manager,
+        resolve_path(config.get('daemon', 'status_file')),
+        config.getint('daemon', 'status_interval')
+    )
+    scheduler_manager.set_callbacks(progress_callback=status_writer.on_progress)
+
+    # 종료 신호 처리
+    stop_event = threading.Event()
+
+    def on_signal(signum, frame):
+        logger.info(f"종료 신호 수신: {signum}")
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, on_signal)
+    signal.signal(signal.SIGINT, on_signal)
+    
+    # 쿼리 통계 보고서 저장 요청 (SIGUSR1, Windows 제외)
+    def on_report_signal(signum, frame):
+        try:
+            db_manager.dump_query_report(query_report_file)
+            logger.info(f"쿼리 통계 보고서 저장: {query_report_file}")
+        except Exception as e:
+            logger.error(f"쿼리 통계 보고서 저장 오류: {e}")
+    
+    if hasattr(signal, 'SIGUSR1'):
+        signal.signal(signal.SIGUSR1, on_report_signal)
+
+    if not scheduler_manager.start_scheduler():
+        logger.error("스케줄러를 시작할 수 없습니다. 데몬을 종료합니다.")
+        return 1
+
+    status_writer.start()
+
+    while not stop_event.is_set():
+        stop_event.wait(1)
+
+    scheduler_manager.stop_scheduler(wait=True)
+    status_writer.stop()
+    on_report_signal(None, None)
+    db_manager.close_all_connections()
+    logger.info("데몬 종료")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="K-water 파일 복사 스케줄러 (헤드리스 모드)")
+    parser.add_argument('-c', '--config', default='daemon.ini', help="설정 파일 경로")
+    parser.add_argument('--status', action='store_true', help="실행 중인 데몬의 상태를 출력하고 종료")
+    parser.add_argument('--restore', metavar='SNAPSHOT', help="스냅샷을 검사한 뒤 상태 데이터베이스를 교체하고 종료 (데몬 중지 후 실행)")
+    args = parser.parse_args(argv)
+
+    try:
+        config = load_config(args.config)
+    except Exception as e:
+        print(f"설정 파일 오류: {e}", file=sys.stderr)
+        return 2
+
+    if args.status:
+        status = read_status(resolve_path(config.get('daemon', 'status_file')))
+        if status is None:
+            print("상태 파일이 없습니다. 데몬이 실행 중인지 확인하세요.", file=sys.stderr)
+            return 1
+        print(json.dumps(status, ensure_ascii=False, indent=2))
+        return 0
+
+    if args.restore:
+        return restore_snapshot(config, args.restore)
+
+    return run_daemon(config)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 import tkinter as tk
 import sys
+import multiprocessing
 import os
 import logging
 import datetime
@@ -72,6 +73,10 @@ def main():
             logger.error("SQLite 설정 실패. 애플리케이션을 종료합니다.")
             return
         
+        # XML 파서 백엔드 (lxml 미설치 시 ElementTree)
+        from models.data_processor import DEFAULT_XML_BACKEND
+        logger.info(f"XML 파서 백엔드: {DEFAULT_XML_BACKEND}")
+        
         # 메인 애플리케이션 임포트 및 실행
         from views import DataInsertApp
         
@@ -84,6 +89,7 @@ def main():
         # 애플리케이션 종료 시 처리
         def on_closing():
             logger.info("애플리케이션 종료")
+            app.db_manager.close_all_connections()
             root.destroy()
         
         root.protocol("WM_DELETE_WINDOW", on_closing)
@@ -95,4 +101,6 @@ def main():
         logger.exception(f"애플리케이션 실행 중 오류 발생: {e}")
 
 if __name__ == "__main__":
+    # 실행 파일(frozen)에서 XML 일괄 변환 작업 프로세스 지원
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
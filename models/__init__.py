@@ -1,12 +1,30 @@
+from models.state_store import StateStore
 from models.database import DatabaseManager
+from models.memory_store import MemoryStateStore
+from models.sql_store import SqlStateStore
 from models.ssh_client import SSHClient
 from models.data_processor import DataProcessor
 from models.scheduler import SchedulerManager
+from models.cancel_token import CancelToken, TransferCancelled
+from models.shard_coordinator import ShardCoordinator
+from models.retention import RetentionManager
+from models.snapshot import SnapshotManager
+from models.xml_batch import XmlBatchConverter, ShardedXmlConverter
 
 # 모델 클래스들을 직접 임포트할 수 있도록 노출
 __all__ = [
+    'StateStore',
     'DatabaseManager',
+    'MemoryStateStore',
+    'SqlStateStore',
     'SSHClient',
     'DataProcessor',
-    'SchedulerManager'
+    'SchedulerManager',
+    'CancelToken',
+    'TransferCancelled',
+    'ShardCoordinator',
+    'RetentionManager',
+    'SnapshotManager',
+    'XmlBatchConverter',
+    'ShardedXmlConverter'
 ]
\ No newline at end of file
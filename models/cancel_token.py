@@ -0,0 +1,90 @@
+import threading
+import time
+
+
+class TransferCancelled(Exception):
+    """스케줄러 중지로 파일 전송이 중단되었을 때 발생하는 예외"""
+
+    def __init__(self, message="스케줄러 중지로 인한 전송 중단", transferred=0, total=0):
+        super().__init__(message)
+        self.transferred = transferred
+        self.total = total
+
+
+class CancelToken:
+    """협조적 취소 토큰
+
+    전송 루프가 청크 단위로 check()를 호출하여 중지 요청을 확인한다.
+    drain 시간이 지정된 경우, 남은 시간 안에 끝날 것으로 예상되는 전송은
+    계속 진행하고 나머지는 TransferCancelled 예외로 중단한다.
+    """
+
+    def __init__(self):
+        """취소 토큰 초기화"""
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._drain_deadline = None  # time.monotonic() 기준 마감 시각
+
+    def cancel(self, drain_timeout=0):
+        """취소 요청
+
+        Args:
+            drain_timeout (float, optional): 완료 직전 전송을 기다려 줄 시간(초). Defaults to 0.
+        """
+        with self._lock:
+            self._cancelled = True
+            if drain_timeout and drain_timeout > 0:
+                self._drain_deadline = time.monotonic() + drain_timeout
+            else:
+                self._drain_deadline = None
+
+    def is_cancelled(self):
+        """취소 요청 여부 반환"""
+        return self._cancelled
+
+    def remaining_drain_time(self):
+        """drain 마감까지 남은 시간(초) 반환 (drain 모드가 아니면 0)"""
+        with self._lock:
+            if self._drain_deadline is None:
+                return 0
+            return max(0, self._drain_deadline - time.monotonic())
+
+    def check(self, transferred=0, total=0, started_at=None, offset=0):
+        """청크 단위 취소 확인
+
+        Args:
+            transferred (int, optional): 현재까지 전송한 바이트 수. Defaults to 0.
+            total (int, optional): 전체 바이트 수. Defaults to 0.
+            started_at (float, optional): 전송 시작 시각 (time.monotonic()). Defaults to None.
+            offset (int, optional): 이어받기 시작 위치 (이전 실행분은 속도 계산에서 제외). Defaults to 0.
+
+        Raises:
+            TransferCancelled: 전송을 중단해야 하는 경우
+        """
+        if not self._cancelled:
+            return
+
+        # drain 모드: 현재 속도로 마감 전에 끝날 전송은 계속 진행
+        remaining = self.remaining_drain_time()
+        sent = transferred - offset
+        if remaining > 0 and started_at is not None and 0 < sent and transferred <= total:
+            elapsed = time.monotonic() - started_at
+            if elapsed > 0:
+                eta = (total - transferred) / (sent / elapsed)
+                if eta <= remaining:
+                    return
+
+        raise TransferCancelled(transferred=transferred, total=total)
+
+    def make_sftp_callback(self):
+        """paramiko sftp.get/put 진행 콜백 생성
+
+        Returns:
+            function: (transferred, total)을 받아 check()를 호출하는 콜백
+        """
+        started_at = time.monotonic()
+
+        def _callback(transferred, total):
+            self.check(transferred, total, started_at)
+
+        return _callback
@@ -1,20 +1,298 @@
 import os
+import re
+import mmap
+import itertools
 import xml.etree.ElementTree as ET
 import csv
 import datetime
 from decimal import Decimal, InvalidOperation
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+# 기본 XML 파서 백엔드 (lxml이 설치되어 있으면 lxml, 없으면 ElementTree)
+DEFAULT_XML_BACKEND = 'lxml' if lxml_etree is not None else 'etree'
+
+
+class _EntityDeclarations(Exception):
+    """lxml 백엔드에서 DTD 엔티티 선언을 발견했을 때 발생 (ElementTree로 다시 읽기 위한 내부 예외)"""
+
+
+class _ShardReader:
+    """XML 파일의 머리(첫 레코드 전까지) + 레코드 구간 + 꼬리(루트 종료 태그부터)를 이어 읽는 파일 객체
+    
+    구간마다 원래 선언/루트 요소가 그대로 붙으므로 iterparse가 하나의 온전한 문서로 읽는다.
+    """
+    
+    def __init__(self, xml_file, shard):
+        prolog_end, start, end, epilog_start = shard
+        xml_file.seek(0, os.SEEK_END)
+        self._segments = [(0, prolog_end), (start, end), (epilog_start, xml_file.tell())]
+        self._file = xml_file
+        self._index = 0
+        self._offset = 0  # 현재 구간 안에서 읽은 바이트 수
+        self._position = 0
+        self.size = sum(segment_end - segment_start for segment_start, segment_end in self._segments)
+    
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.size - self._position
+        chunks = []
+        while size > 0 and self._index < len(self._segments):
+            segment_start, segment_end = self._segments[self._index]
+            remaining = segment_end - segment_start - self._offset
+            if remaining <= 0:
+                self._index += 1
+                self._offset = 0
+                continue
+            self._file.seek(segment_start + self._offset)
+            chunk = self._file.read(min(size, remaining))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            self._offset += len(chunk)
+            self._position += len(chunk)
+            size -= len(chunk)
+        return b''.join(chunks)
+    
+    def tell(self):
+        return self._position
+
 
 class DataProcessor:
     """XML 파일 처리 및 데이터 가공 기능을 제공하는 클래스"""
     
-    def __init__(self, db_manager=None):
+    def __init__(self, db_manager=None, xml_backend=None):
         """데이터 프로세서 초기화
         
         Args:
-            db_manager: 데이터베이스 매니저 객체 (선택적)
+            db_manager: 상태 저장소 객체 (StateStore 구현, 선택적)
+            xml_backend (str, optional): XML 파서 백엔드 ('lxml' 또는 'etree'). 기본값은 DEFAULT_XML_BACKEND.
+            
+        Raises:
+            ValueError: 알 수 없는 백엔드이거나 lxml이 설치되어 있지 않은 경우
         """
         self.db_manager = db_manager
+        
+        xml_backend = xml_backend or DEFAULT_XML_BACKEND
+        if xml_backend not in ('lxml', 'etree'):
+            raise ValueError(f"알 수 없는 XML 파서 백엔드: {xml_backend}")
+        if xml_backend == 'lxml' and lxml_etree is None:
+            raise ValueError("lxml이 설치되어 있지 않습니다.")
+        self.xml_backend = xml_backend
+    
+    # 데이터 레코드 태그
+    RECORD_TAG = 'DATA_RECORD'
+    
+    # 진행률 확인 간격 (레코드 수)
+    PROGRESS_CHECK_RECORDS = 1000
+    
+    def iter_xml_records(self, file_path, progress_callback=None, shard=None):
+        """XML 파일의 DATA_RECORD를 하나씩 읽어 반환하는 제너레이터 (iterparse)
+        
+        DATA_RECORD가 끝날 때마다 하위 요소의 {태그: 텍스트}를 반환하고 처리한 요소는
+        부모에서 제거하므로, 파일 크기와 관계없이 메모리 사용량이 일정하다.
+        같은 태그가 여러 번 나오면 마지막 값을 사용한다 (ET.parse 후 findall과 같은 결과).
+        xml_backend에 따라 lxml 또는 ElementTree로 읽으며 결과는 같다.
+        
+        Args:
+            file_path (str): XML 파일 경로
+            progress_callback (function, optional): 진행률 콜백 (읽은 바이트, 파일 크기, 진행률). Defaults to None.
+            shard (tuple, optional): split_xml_records가 반환한 구간. 지정하면 그 구간의 레코드만 읽는다. Defaults to None.
+            
+        Yields:
+            dict: {태그: 텍스트 (없으면 None)}
+            
+        Raises:
+            FileNotFoundError: 파일이 없는 경우
+            xml.etree.ElementTree.ParseError: XML 형식 오류 (lxml 백엔드도 같은 예외로 변환)
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+        
+        with open(file_path, 'rb') as raw_file:
+            xml_file = raw_file if shard is None else _ShardReader(raw_file, shard)
+            total_bytes = os.path.getsize(file_path) if shard is None else xml_file.size
+            report_step = max(1, total_bytes // 10)
+            next_report = report_step
+            if progress_callback:
+                progress_callback(0, total_bytes, 0)
+            
+            if self.xml_backend == 'lxml':
+                records = self._iter_lxml_records(xml_file)
+                try:
+                    first = next(records, None)
+                except _EntityDeclarations:
+                    # lxml은 엔티티를 확장하지 않으므로 엔티티를 선언한 문서는 처음부터 ElementTree로 읽음
+                    raw_file.seek(0)
+                    xml_file = raw_file if shard is None else _ShardReader(raw_file, shard)
+                    records = self._iter_etree_records(xml_file)
+                else:
+                    if first is not None:
+                        records = itertools.chain([first], records)
+            else:
+                records = self._iter_etree_records(xml_file)
+            
+            count = 0
+            for record in records:
+                yield record
+                
+                count += 1
+                if progress_callback and count % self.PROGRESS_CHECK_RECORDS == 0:
+                    position = xml_file.tell()
+                    if position >= next_report:
+                        progress_callback(position, total_bytes, position / total_bytes * 100)
+                        next_report = position + report_step
+    
+    def _iter_etree_records(self, xml_file):
+        """ElementTree iterparse로 DATA_RECORD 읽기 (iter_xml_records 백엔드)"""
+        record_tag = self.RECORD_TAG
+        # 열린 요소 (처리한 레코드를 부모에서 제거하기 위해 유지)
+        stack = []
+        # 바깥 레코드가 끝날 때까지 시작 순서대로 보관하는 레코드 (중첩 레코드도 문서 순서로 반환)
+        pending = []
+        # 열린 DATA_RECORD의 pending 위치
+        open_slots = []
+        
+        for event, element in ET.iterparse(xml_file, events=('start', 'end')):
+            if event == 'start':
+                # 루트 요소는 레코드로 보지 않음 (findall(".//DATA_RECORD")와 동일)
+                if element.tag == record_tag and stack:
+                    open_slots.append(len(pending))
+                    pending.append(None)
+                stack.append(element)
+                continue
+            
+            stack.pop()
+            if element.tag != record_tag or not stack:
+                continue
+            
+            record = {}
+            for child in element:
+                record[child.tag] = child.text
+            pending[open_slots.pop()] = record
+            
+            if not open_slots:
+                yield from pending
+                pending = []
+                del stack[-1][:]
+    
+    def _iter_lxml_records(self, xml_file):
+        """lxml iterparse로 DATA_RECORD 읽기 (iter_xml_records 백엔드)
+        
+        tag 필터로 DATA_RECORD 이벤트만 받고, 주석/처리 지시문은 ElementTree처럼 제외한다.
+        외부에서 받은 파일이므로 엔티티를 확장하지 않고(resolve_entities=False) 네트워크 접근도
+        막는다(no_network). 엔티티를 선언한 문서는 첫 레코드 전에 _EntityDeclarations를
+        발생시켜 ElementTree로 읽게 한다. huge_tree는 의도적으로 켠다: 엔티티를 확장하지 않으므로
+        엔티티 폭증 위험은 없고, 크기/깊이 제한이 없는 expat처럼 큰 텍스트 노드를 허용하기 위함이다.
+        형식 오류는 ElementTree와 같은 ParseError로 바꾸어 발생시킨다
+        (XMLSyntaxError는 작업 프로세스 간에 전달할 수 없음).
+        
+        Raises:
+            _EntityDeclarations: 내부 DTD에 엔티티 선언이 있는 경우 (레코드를 반환하기 전)
+        """
+        # 바깥 레코드가 끝날 때까지 시작 순서대로 보관하는 레코드 (중첩 레코드도 문서 순서로 반환)
+        pending = []
+        # 열린 DATA_RECORD의 pending 위치
+        open_slots = []
+        checked_dtd = False
+        
+        events = lxml_etree.iterparse(xml_file, events=('start', 'end'), tag=self.RECORD_TAG,
+                                      huge_tree=True, resolve_entities=False, no_network=True,
+                                      remove_comments=True, remove_pis=True)
+        while True:
+            try:
+                event, element = next(events)
+            except StopIteration:
+                return
+            except lxml_etree.XMLSyntaxError as e:
+                error = ET.ParseError(str(e))
+                error.position = e.position
+                raise error from None
+            
+            if not checked_dtd:
+                # DOCTYPE은 첫 레코드 전에 읽히므로 여기서 한 번만 확인
+                dtd = element.getroottree().docinfo.internalDTD
+                if dtd is not None and any(True for _ in dtd.iterentities()):
+                    raise _EntityDeclarations()
+                checked_dtd = True
+            
+            parent = element.getparent()
+            # 루트 요소는 레코드로 보지 않음 (findall(".//DATA_RECORD")와 동일)
+            if parent is None:
+                continue
+            
+            if event == 'start':
+                open_slots.append(len(pending))
+                pending.append(None)
+                continue
+            
+            record = {}
+            for child in element:
+                record[child.tag] = child.text
+            pending[open_slots.pop()] = record
+            
+            if not open_slots:
+                yield from pending
+                pending = []
+                # 처리한 레코드와 앞선 형제 요소 제거
+                element.clear()
+                while element.getprevious() is not None:
+                    del parent[0]
+    
+    def split_xml_records(self, file_path, shard_count):
+        """XML 파일을 DATA_RECORD 경계에서 shard_count개 이하의 바이트 구간으로 분할
+        
+        파일을 메모리 매핑하고 균등 분할 위치 뒤의 첫 <DATA_RECORD 시작 태그를 경계로 삼는다.
+        각 구간은 (첫 레코드 시작, 구간 시작, 구간 끝, 루트 종료 태그 시작) 튜플이며
+        iter_xml_records(shard=...)로 읽으면 구간 순서대로 전체 파일과 같은 레코드가 나온다.
+        레코드가 루트 바로 아래에 나열된 구조를 가정하며, 경계가 주석/CDATA나 중첩된 레코드
+        안에 걸리면 해당 구간 파싱에서 ParseError가 발생한다.
+        
+        Args:
+            file_path (str): XML 파일 경로
+            shard_count (int): 최대 구간 수
+            
+        Returns:
+            list: 구간 튜플 목록. 분할할 수 없으면 (레코드 없음, UTF-16 등) None.
+        """
+        if os.path.getsize(file_path) == 0:
+            return None
+        
+        record_start = re.compile(rb'<' + self.RECORD_TAG.encode('ascii') + rb'[\s/>]')
+        with open(file_path, 'rb') as xml_file, \
+                mmap.mmap(xml_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # 태그를 바이트로 찾으므로 ASCII 호환 인코딩만 분할
+            if mapped[:2] in (b'\xff\xfe', b'\xfe\xff'):
+                return None
+            
+            first = record_start.search(mapped)
+            if not first:
+                return None
+            prolog_end = first.start()
+            # 첫 레코드 앞에 루트 요소가 있어야 함 (루트가 DATA_RECORD면 분할하지 않음)
+            if not re.search(rb'<[^?!/]', mapped[:prolog_end]):
+                return None
+            epilog_start = mapped.rfind(b'</')
+            if epilog_start <= prolog_end:
+                return None
+            
+            boundaries = [prolog_end]
+            step = (epilog_start - prolog_end) / shard_count
+            for index in range(1, shard_count):
+                match = record_start.search(mapped, int(prolog_end + step * index), epilog_start)
+                if not match:
+                    break
+                if match.start() > boundaries[-1]:
+                    boundaries.append(match.start())
+            boundaries.append(epilog_start)
+        
+        return [
+            (prolog_end, start, end, epilog_start)
+            for start, end in zip(boundaries, boundaries[1:])
+        ]
     
     def parse_xml_file(self, file_path, callback=None, progress_callback=None):
         """XML 파일 파싱 및 데이터 추출
@@ -22,7 +300,7 @@ class DataProcessor:
         Args:
             file_path (str): XML 파일 경로
             callback (function, optional): 진행 중 호출할 콜백 함수. Defaults to None.
-            progress_callback (function, optional): 진행률 업데이트 콜백. Defaults to None.
+            progress_callback (function, optional): 진행률 업데이트 콜백 (읽은 바이트, 파일 크기, 진행률). Defaults to None.
             
         Returns:
             tuple: (컬럼 목록, 데이터 행 목록, 전체 레코드 수)
@@ -31,21 +309,13 @@ class DataProcessor:
             Exception: XML 파싱 오류 발생 시 예외 발생
         """
         try:
-            # 파일 존재 확인
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
-            
-            # XML 파일 파싱
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            # 테이블 이름 추출 (파일명 기반)
-            file_name = os.path.basename(file_path)
-            table_name = file_name.split('_')[0] if '_' in file_name else file_name.replace('.xml', '')
-            
-            # 데이터 레코드 탐색
-            data_records = root.findall(".//DATA_RECORD")
-            total_records = len(data_records)
+            # 레코드를 스트리밍으로 읽으면서 컬럼 목록 수집 (XML 트리 전체를 메모리에 두지 않음)
+            parsed_data = []
+            all_columns = set()
+            for record in self.iter_xml_records(file_path, progress_callback):
+                all_columns.update(record)
+                parsed_data.append(record)
+            total_records = len(parsed_data)
             
             if total_records == 0:
                 if callback:
@@ -55,31 +325,15 @@ class DataProcessor:
             if callback:
                 callback(f"총 {total_records}개의 DATA_RECORD 태그를 찾았습니다.")
             
-            # 컬럼 목록 수집
-            all_columns = set()
-            for record in data_records:
-                for element in record:
-                    all_columns.add(element.tag)
-            
             # 컬럼 알파벳순 정렬
-            sorted_columns = sorted(list(all_columns))
+            sorted_columns = sorted(all_columns)
             
-            # 데이터 추출
-            parsed_data = []
-            
-            for i, record in enumerate(data_records):
-                # 진행률 업데이트
-                if progress_callback and i % max(1, total_records // 10) == 0:
-                    progress = (i / total_records) * 100
-                    progress_callback(i, total_records, progress)
-                
-                # 레코드 데이터 추출
-                record_data = {col: "" for col in sorted_columns}
-                
-                for element in record:
-                    record_data[element.tag] = element.text if element.text else ""
-                
-                parsed_data.append(record_data)
+            # 모든 컬럼을 가진 행으로 변환 (없는 컬럼과 빈 값은 "")
+            for i, record in enumerate(parsed_data):
+                record_data = dict.fromkeys(sorted_columns, "")
+                for tag, text in record.items():
+                    record_data[tag] = text if text else ""
+                parsed_data[i] = record_data
             
             return sorted_columns, parsed_data, total_records
             
@@ -125,15 +379,8 @@ class DataProcessor:
                     row_values = [row_data.get(column_name, "") for column_name in columns]
                     csv_writer.writerow(row_values)
             
-            # 파일 크기 정보
-            file_size = os.path.getsize(file_path)
-            file_size_kb = file_size / 1024
-            file_size_mb = file_size_kb / 1024
-            
-            size_info = f"{file_size_mb:.2f} MB" if file_size_mb >= 1 else f"{file_size_kb:.2f} KB"
-            
             if callback:
-                callback(f"CSV 파일 저장 완료: {file_path} (크기: {size_info})")
+                callback(f"CSV 파일 저장 완료: {file_path} (크기: {self._format_file_size(file_path)})")
             
             return True
             
@@ -142,6 +389,135 @@ class DataProcessor:
                 callback(f"CSV 저장 중 오류 발생: {str(e)}")
             raise
     
+    @staticmethod
+    def _format_file_size(file_path):
+        """파일 크기 표시 문자열 (1MB 이상은 MB, 미만은 KB)"""
+        file_size_kb = os.path.getsize(file_path) / 1024
+        file_size_mb = file_size_kb / 1024
+        return f"{file_size_mb:.2f} MB" if file_size_mb >= 1 else f"{file_size_kb:.2f} KB"
+    
+    def discover_xml_columns(self, file_path, progress_callback=None, is_cancelled=None, shard=None):
+        """XML 파일의 DATA_RECORD 하위 태그 목록 수집 (스트리밍 1차 패스)
+        
+        Args:
+            file_path (str): XML 파일 경로
+            progress_callback (function, optional): 진행률 콜백 (읽은 바이트, 파일 크기, 진행률). Defaults to None.
+            is_cancelled (function, optional): 중단 여부를 반환하는 함수. Defaults to None.
+            shard (tuple, optional): 읽을 구간 (split_xml_records 참고). Defaults to None.
+            
+        Returns:
+            tuple: (정렬된 컬럼 목록, 레코드 수). 중단되면 None.
+        """
+        all_columns = set()
+        total_records = 0
+        for record in self.iter_xml_records(file_path, progress_callback, shard):
+            all_columns.update(record)
+            total_records += 1
+            if is_cancelled and is_cancelled():
+                return None
+        return sorted(all_columns), total_records
+    
+    def convert_xml_to_csv(self, file_path, csv_path, columns=None, callback=None,
+                           progress_callback=None, is_cancelled=None, preview_count=0, batch_size=1000,
+                           shard=None, header=True):
+        """XML 파일을 CSV 파일로 변환 (레코드 수와 관계없이 메모리 사용량 일정)
+        
+        columns가 없으면 1차 패스에서 컬럼 목록을 수집하고, 2차 패스에서 레코드를
+        batch_size개씩 csv.writer.writerows로 바로 기록한다. 결과는 parse_xml_file 후
+        save_to_csv와 같다. columns를 지정하면 한 번만 읽고, 목록에 없는 태그는 기록하지 않는다.
+        임시 파일(.part)에 쓴 뒤 완료되면 이름을 바꾸므로 중단/오류 시 CSV가 남지 않는다.
+        
+        Args:
+            file_path (str): XML 파일 경로
+            csv_path (str): 저장할 CSV 파일 경로
+            columns (list, optional): CSV 컬럼 목록 (스키마). Defaults to None.
+            callback (function, optional): 로그 메시지 콜백. Defaults to None.
+            progress_callback (function, optional): 진행률 콜백 (처리량, 전체량, 진행률). Defaults to None.
+            is_cancelled (function, optional): 중단 여부를 반환하는 함수. Defaults to None.
+            preview_count (int, optional): 반환할 앞쪽 행 수 (미리보기). Defaults to 0.
+            batch_size (int, optional): 한 번에 기록할 행 수. Defaults to 1000.
+            shard (tuple, optional): 변환할 구간 (split_xml_records 참고). Defaults to None.
+            header (bool, optional): 헤더 행 기록 여부. Defaults to True.
+            
+        Returns:
+            tuple: (컬럼 목록, 레코드 수, 미리보기 행 목록). 중단되면 None.
+            
+        Raises:
+            Exception: XML 파싱 또는 파일 저장 오류
+        """
+        try:
+            passes = 1 if columns else 2
+            
+            def pass_progress(index):
+                # 패스별 진행률을 전체 진행률로 변환
+                if not progress_callback:
+                    return None
+                return lambda current, total, progress: progress_callback(
+                    index * total + current, passes * total, (index * 100 + progress) / passes
+                )
+            
+            if columns is None:
+                discovered = self.discover_xml_columns(file_path, pass_progress(0), is_cancelled, shard)
+                if discovered is None:
+                    return None
+                columns, total_records = discovered
+                if total_records == 0:
+                    if callback:
+                        callback(f"XML 파일에 DATA_RECORD 태그가 없습니다: {file_path}")
+                    return [], 0, []
+                if callback:
+                    callback(f"총 {total_records}개의 DATA_RECORD 태그를 찾았습니다.")
+            columns = list(columns)
+            
+            directory = os.path.dirname(csv_path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory, exist_ok=True)
+            if callback:
+                callback(f"CSV 파일 생성 중: {csv_path}")
+            
+            part_path = csv_path + '.part'
+            preview = []
+            count = 0
+            try:
+                with open(part_path, 'w', newline='', encoding='utf-8') as csvfile:
+                    csv_writer = csv.writer(csvfile)
+                    if header:
+                        csv_writer.writerow(columns)
+                    
+                    batch = []
+                    for record in self.iter_xml_records(file_path, pass_progress(passes - 1), shard):
+                        if is_cancelled and is_cancelled():
+                            return None
+                        batch.append([record.get(column) or "" for column in columns])
+                        if len(batch) >= batch_size:
+                            csv_writer.writerows(batch)
+                            count += len(batch)
+                            if len(preview) < preview_count:
+                                preview.extend(batch[:preview_count - len(preview)])
+                            batch = []
+                    csv_writer.writerows(batch)
+                    count += len(batch)
+                    if len(preview) < preview_count:
+                        preview.extend(batch[:preview_count - len(preview)])
+                
+                if count == 0:
+                    if callback:
+                        callback(f"XML 파일에 DATA_RECORD 태그가 없습니다: {file_path}")
+                    return columns, 0, []
+                os.replace(part_path, csv_path)
+            finally:
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+            
+            if callback:
+                callback(f"CSV 파일 저장 완료: {csv_path} (크기: {self._format_file_size(csv_path)})")
+            return columns, count, preview
+            
+        except Exception as e:
+            if callback:
+                callback(f"XML 변환 중 오류 발생: {str(e)}")
+            raise
+    
     def process_xml_for_insert(self, file_path, table_nm, progress_callback=None):
         """XML 파일을 처리하여 데이터베이스 삽입용 데이터 생성
         
@@ -160,14 +536,6 @@ class DataProcessor:
             if not self.db_manager:
                 raise ValueError("데이터베이스 매니저가 설정되지 않았습니다.")
             
-            # XML 파일 파싱
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            # 데이터 레코드 탐색
-            data_records = root.findall(".//DATA_RECORD")
-            total_records = len(data_records)
-            
             # 컬럼 매핑 정보 조회
             mapping_rows = self.db_manager.get_column_mappings(table_nm)
             
@@ -190,25 +558,21 @@ class DataProcessor:
             column_rows = self.db_manager.get_table_columns(table_nm)
             column_types = {row[0]: row[1] for row in column_rows}
             
-            # 데이터 레코드 추출
+            # 데이터 레코드 추출 (스트리밍, 진행률은 읽은 바이트 기준)
             data_records_list = []
             
-            for i, record in enumerate(data_records):
-                # 진행률 업데이트
-                if progress_callback and i % max(1, total_records // 10) == 0:
-                    progress = (i / total_records) * 100
-                    progress_callback(i, total_records, progress)
-                
+            for record in self.iter_xml_records(file_path, progress_callback):
                 # XML 태그를 DB 컬럼으로 매핑하여 레코드 데이터 생성
                 record_data = {}
-                for element in record:
+                for tag, text in record.items():
                     # XML 태그명에 해당하는 DB 컬럼명 확인
-                    db_col = col_mapping.get(element.tag)
+                    db_col = col_mapping.get(tag)
                     if db_col:
-                        record_data[db_col] = element.text
+                        record_data[db_col] = text
                 
                 data_records_list.append(record_data)
-                
+            
+            total_records = len(data_records_list)
             return col_mapping, dup_check_columns, column_types, data_records_list, total_records
             
         except Exception as e:
@@ -1,99 +1,454 @@
 import sqlite3
 import datetime
 import os
+import time
+import json
+import threading
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 
+from models.db_writer import DatabaseWriter
+from models.query_stats import QueryStats
+from models.task_log_partition import TaskLogPartitions
+from models.state_store import (
+    StateStore, FILE_STATE_DISCOVERED, FILE_STATE_STAGED, FILE_STATE_UPLOADING,
+    FILE_STATE_UPLOADED, FILE_STATE_VERIFIED, FILE_STATE_FAILED
+)
 
-class DatabaseManager:
-    """SQLite 데이터베이스 연결 및 쿼리 관련 기능을 제공하는 클래스"""
+
+class _BackupRestarted(Exception):
+    """단계별 백업 중 원본 변경으로 처음부터 다시 시작됨 (backup_to 내부용)"""
+
+
+class DatabaseManager(StateStore):
+    """SQLite 데이터베이스 연결 및 쿼리 관련 기능을 제공하는 클래스 (SQLite 파일 상태 저장소)"""
+    
+    # 연결별 PRAGMA 설정
+    BUSY_TIMEOUT_MS = 5000
+    CACHE_SIZE_KB = 8192
+    
+    # 쓰기 스레드 커밋을 기다리는 최대 시간(초, 초과 시 TimeoutError)
+    WRITE_WAIT_TIMEOUT = 30
+    
+    # 스키마 마이그레이션 ((적용 후 PRAGMA user_version, 메서드명), 순서대로 한 번씩 적용)
+    MIGRATIONS = (
+        (1, '_migrate_base_tables'),
+        (2, '_migrate_shard_tables'),
+        (3, '_migrate_transfer_state'),
+        (4, '_migrate_hot_path_indexes'),
+        (5, '_migrate_config_version'),
+        (6, '_migrate_task_log_rollup'),
+        (7, '_migrate_task_log_metrics'),
+        (8, '_migrate_search_index'),
+        (9, '_migrate_config_version_columns'),
+    )
+    
+    # 전문 검색 인덱스 ({FTS5 테이블: (원본 테이블, 검색 컬럼)}, 트리거로 원본과 동기화)
+    SEARCH_INDEXES = {
+        'TASK_LOG_FTS': ('TASK_LOG', ('FILE_NM', 'ERROR_MSG')),
+        'FILE_INFO_FTS': ('FILE_INFO', ('FILE_NM',)),
+    }
+    
+    # 설정 캐시 대상 테이블 (변경 시 CONFIG_VERSION 증가)
+    CONFIG_TABLES = ('TABLE_INFO', 'AUTO_CONFIG', 'COL_MAPPING')
+    
+    # UPDATE 시 CONFIG_VERSION을 올리는 컬럼 (없으면 모든 컬럼, 실행 기록용 LAST_TIMESTAMP 제외)
+    CONFIG_UPDATE_COLUMNS = {
+        'AUTO_CONFIG': ('SRC_PATH', 'DEST_PATH', 'AUTO_INTERVAL', 'USE_YN'),
+    }
     
     def __init__(self, db_path="data.db"):
         """데이터베이스 매니저 초기화"""
         self.db_path = db_path
+        
+        # 스레드별 장기 연결 ({스레드 객체: 연결})
+        self._local = threading.local()
+        self._connections = {}
+        self._connections_lock = threading.Lock()
+        
+        # 백그라운드 쓰기 스레드 (처음 쓰기 요청 시 시작)
+        self.use_background_writer = True
+        self._writer = None
+        self._writer_lock = threading.Lock()
+        
+        # 설정 테이블 캐시 ({키: 조회 결과})
+        self._config_cache = {}
+        self._config_version = None
+        self._config_cache_generation = 0
+        self._config_cache_lock = threading.Lock()
+        
+        # TASK_LOG 월별 분할 (None이면 main.TASK_LOG만 사용, enable_task_log_partitions로 설정)
+        self.task_log_partitions = None
+        
+        # 검색 인덱스 토크나이저 ({FTS5 테이블: 토크나이저})
+        self._search_tokenizers = {}
+        
+        # 쿼리 계측 (실행 시간/행 수/호출 메서드, 느린 쿼리 로그)
+        self.query_stats = QueryStats()
+        
         # 데이터베이스 초기화
         self.initialize_database()
 
     def initialize_database(self):
-        """데이터베이스 및 테이블 초기화"""
+        """데이터베이스 스키마 초기화
+        
+        PRAGMA user_version에 기록된 버전 이후의 마이그레이션만 순서대로 적용한다.
+        스키마가 최신이면 DDL을 실행하지 않는다.
+        """
+        conn = self.get_connection()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= self.MIGRATIONS[-1][0]:
+            return
+        
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            # TABLE_INFO 테이블 생성
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS TABLE_INFO (
-                    TABLE_NM TEXT PRIMARY KEY,
-                    TABLE_DC TEXT,
-                    TABLE_OWNERSHIP TEXT
-                )
-            ''')
-            
-            # FILE_INFO 테이블 생성 (INSERT_YN -> COPY_YN으로 변경)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS FILE_INFO (
-                    TABLE_NM TEXT NOT NULL,
-                    FILE_NM TEXT PRIMARY KEY,
-                    COPY_YN TEXT,
-                    DELETE_YN TEXT,
-                    FOREIGN KEY (TABLE_NM) REFERENCES TABLE_INFO (TABLE_NM)
-                )
-            ''')
-            
-            # AUTO_CONFIG 테이블 생성 (DELETE_INTERVAL 제거, TABLE_NM을 PRIMARY KEY로 설정)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS AUTO_CONFIG (
-                    TABLE_NM TEXT PRIMARY KEY,
-                    SRC_PATH TEXT,
-                    DEST_PATH TEXT,
-                    AUTO_INTERVAL INTEGER,
-                    LAST_TIMESTAMP TEXT,
-                    USE_YN TEXT,
-                    FOREIGN KEY (TABLE_NM) REFERENCES TABLE_INFO (TABLE_NM)
-                )
-            ''')
-            
-            # COL_MAPPING 테이블 생성
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS COL_MAPPING (
-                    TABLE_NM TEXT NOT NULL,
-                    DB_COL_NM TEXT NOT NULL,
-                    XML_COL_NM TEXT NOT NULL,
-                    FOREIGN KEY (TABLE_NM) REFERENCES TABLE_INFO (TABLE_NM)
-                )
-            ''')
-            
-            # TASK_LOG 테이블 생성 (ERROR_MSG 컬럼 추가)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS TASK_LOG (
-                    TABLE_NM TEXT NOT NULL,
-                    FILE_NM TEXT NOT NULL,
-                    START_TIME TEXT,
-                    END_TIME TEXT,
-                    ERROR_MSG TEXT,
-                    FOREIGN KEY (TABLE_NM) REFERENCES TABLE_INFO (TABLE_NM),
-                    FOREIGN KEY (FILE_NM) REFERENCES FILE_INFO (FILE_NM)
-                )
-            ''')
+            for target_version, method_name in self.MIGRATIONS:
+                if target_version > version:
+                    self._apply_migration(conn, target_version, getattr(self, method_name))
+            print(f"SQLite 데이터베이스 초기화 완료 (스키마 버전 {self.MIGRATIONS[-1][0]})")
+        except Exception as e:
+            print(f"데이터베이스 초기화 오류: {e}")
+            raise
+    
+    def _apply_migration(self, conn, target_version, migrate):
+        """마이그레이션 한 단계를 한 트랜잭션으로 적용
+        
+        다른 프로세스가 동시에 시작한 경우를 위해 쓰기 잠금을 잡은 뒤 버전을 다시 확인한다.
+        
+        Args:
+            conn: 데이터베이스 연결
+            target_version (int): 적용 후 스키마 버전
+            migrate (function): 커서를 받아 DDL을 실행하는 함수
             
-            # 기존 테이블에 ERROR_MSG 컬럼이 없는 경우 추가
-            try:
-                cursor.execute('ALTER TABLE TASK_LOG ADD COLUMN ERROR_MSG TEXT')
-                print("TASK_LOG 테이블에 ERROR_MSG 컬럼을 추가했습니다.")
-            except Exception:
-                # 컬럼이 이미 존재하는 경우 무시
-                pass
+        Returns:
+            bool: 적용 여부 (이미 적용된 경우 False)
+        """
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            if cursor.execute("PRAGMA user_version").fetchone()[0] >= target_version:
+                conn.rollback()
+                return False
             
+            migrate(cursor)
+            cursor.execute(f"PRAGMA user_version = {int(target_version)}")
             conn.commit()
-            print("SQLite 데이터베이스 초기화 완료")
-        except Exception as e:
-            print(f"데이터베이스 초기화 오류: {e}")
+            return True
+        except Exception:
+            if conn.in_transaction:
+                conn.rollback()
             raise
         finally:
-            if conn:
-                conn.close()
+            cursor.close()
+    
+    def _add_column_if_missing(self, cursor, table_name, column_def):
+        """컬럼이 없는 경우에만 추가"""
+        column_name = column_def.split()[0]
+        columns = {row[1].upper() for row in cursor.execute(f"PRAGMA table_info({table_name})")}
+        if column_name.upper() not in columns:
+            cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {column_def}")
+            print(f"{table_name} 테이블에 {column_name} 컬럼을 추가했습니다.")
+    
+    # ============================================================
+    # 스키마 마이그레이션 단계들
+    # ============================================================
+    def _migrate_base_tables(self, cursor):
+        """1: 기본 테이블 생성"""
+        # TABLE_INFO 테이블 생성
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS TABLE_INFO (
+                TABLE_NM TEXT PRIMARY KEY,
+                TABLE_DC TEXT,
+                TABLE_OWNERSHIP TEXT
+            )
+        ''')
+        
+        # FILE_INFO 테이블 생성 (INSERT_YN -> COPY_YN으로 변경)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS FILE_INFO (
+                TABLE_NM TEXT NOT NULL,
+                FILE_NM TEXT PRIMARY KEY,
+                COPY_YN TEXT,
+                DELETE_YN TEXT,
+                FOREIGN KEY (TABLE_NM) REFERENCES TABLE_INFO (TABLE_NM)
+            )
+        ''')
+        
+        # AUTO_CONFIG 테이블 생성 (DELETE_INTERVAL 제거, TABLE_NM을 PRIMARY KEY로 설정)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS AUTO_CONFIG (
+                TABLE_NM TEXT PRIMARY KEY,
+                SRC_PATH TEXT,
+                DEST_PATH TEXT,
+                AUTO_INTERVAL INTEGER,
+                LAST_TIMESTAMP TEXT,
+                USE_YN TEXT,
+                FOREIGN KEY (TABLE_NM) REFERENCES TABLE_INFO (TABLE_NM)
+            )
+        ''')
+        
+        # COL_MAPPING 테이블 생성
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS COL_MAPPING (
+                TABLE_NM TEXT NOT NULL,
+                DB_COL_NM TEXT NOT NULL,
+                XML_COL_NM TEXT NOT NULL,
+                FOREIGN KEY (TABLE_NM) REFERENCES TABLE_INFO (TABLE_NM)
+            )
+        ''')
+        
+        # TASK_LOG 테이블 생성
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS TASK_LOG (
+                TABLE_NM TEXT NOT NULL,
+                FILE_NM TEXT NOT NULL,
+                START_TIME TEXT,
+                END_TIME TEXT,
+                ERROR_MSG TEXT,
+                FOREIGN KEY (TABLE_NM) REFERENCES TABLE_INFO (TABLE_NM),
+                FOREIGN KEY (FILE_NM) REFERENCES FILE_INFO (FILE_NM)
+            )
+        ''')
+        
+        # ERROR_MSG 컬럼이 없던 이전 버전 데이터베이스
+        self._add_column_if_missing(cursor, 'TASK_LOG', 'ERROR_MSG TEXT')
+    
+    def _migrate_shard_tables(self, cursor):
+        """2: 다중 인스턴스 하트비트/테이블 임대 테이블 생성"""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS SCHEDULER_INSTANCE (
+                INSTANCE_ID TEXT PRIMARY KEY,
+                HEARTBEAT REAL NOT NULL
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS TABLE_LEASE (
+                TABLE_NM TEXT PRIMARY KEY,
+                OWNER_ID TEXT NOT NULL,
+                EXPIRES_AT REAL NOT NULL
+            )
+        ''')
+    
+    def _migrate_transfer_state(self, cursor):
+        """3: FILE_INFO 전송 상태 컬럼 추가 (상태, 상태 변경 시각, 전송 위치, 파일 크기)"""
+        for column_def in ('TRANSFER_STATE TEXT', 'STATE_TIME REAL',
+                           'BYTE_OFFSET INTEGER DEFAULT 0', 'FILE_SIZE INTEGER'):
+            self._add_column_if_missing(cursor, 'FILE_INFO', column_def)
+        
+        # 기존 데이터 상태 채우기 (COPY_YN 기준)
+        cursor.execute(f"""
+            UPDATE FILE_INFO SET TRANSFER_STATE = CASE WHEN COPY_YN = 'Y'
+                THEN '{FILE_STATE_VERIFIED}' ELSE '{FILE_STATE_DISCOVERED}' END
+            WHERE TRANSFER_STATE IS NULL
+        """)
+    
+    def _migrate_hot_path_indexes(self, cursor):
+        """4: 자주 쓰는 조회용 복합 인덱스 생성
+        
+        FILE_INFO: 테이블별 대기/등록 파일 조회 (TABLE_NM, COPY_YN 필터, FILE_NM 정렬)
+        TASK_LOG: 테이블별 시간 범위 조회
+        """
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS IDX_FILE_INFO_TABLE_COPY "
+            "ON FILE_INFO (TABLE_NM, COPY_YN, FILE_NM)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS IDX_TASK_LOG_TABLE_TIME "
+            "ON TASK_LOG (TABLE_NM, START_TIME)"
+        )
+    
+    def _migrate_config_version(self, cursor):
+        """5: 설정 테이블 변경 카운터 (다른 프로세스의 설정 변경 감지용)"""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS CONFIG_VERSION (
+                ID INTEGER PRIMARY KEY CHECK (ID = 1),
+                VERSION INTEGER NOT NULL
+            )
+        ''')
+        cursor.execute("INSERT OR IGNORE INTO CONFIG_VERSION (ID, VERSION) VALUES (1, 0)")
+        
+        for table_name in self.CONFIG_TABLES:
+            for event in ('INSERT', 'UPDATE', 'DELETE'):
+                self._create_config_version_trigger(cursor, table_name, event)
+    
+    def _create_config_version_trigger(self, cursor, table_name, event):
+        """설정 테이블 변경 시 CONFIG_VERSION을 올리는 트리거 생성"""
+        columns = self.CONFIG_UPDATE_COLUMNS.get(table_name) if event == 'UPDATE' else None
+        target = f"UPDATE OF {', '.join(columns)}" if columns else event
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS TRG_{table_name}_{event}_VERSION
+            AFTER {target} ON {table_name}
+            BEGIN
+                UPDATE CONFIG_VERSION SET VERSION = VERSION + 1 WHERE ID = 1;
+            END
+        """)
+    
+    def _migrate_config_version_columns(self, cursor):
+        """9: 설정 UPDATE 트리거를 설정 컬럼 변경으로 제한 (LAST_TIMESTAMP 갱신은 다른 프로세스 캐시를 비우지 않음)"""
+        for table_name in self.CONFIG_UPDATE_COLUMNS:
+            cursor.execute(f"DROP TRIGGER IF EXISTS TRG_{table_name}_UPDATE_VERSION")
+            self._create_config_version_trigger(cursor, table_name, 'UPDATE')
+    
+    def _migrate_task_log_rollup(self, cursor):
+        """6: TASK_LOG 일간 집계 테이블 및 집계 여부 컬럼"""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS TASK_LOG_DAILY (
+                TABLE_NM TEXT NOT NULL,
+                LOG_DATE TEXT NOT NULL,
+                TASK_CNT INTEGER NOT NULL DEFAULT 0,
+                FAIL_CNT INTEGER NOT NULL DEFAULT 0,
+                TOTAL_BYTES INTEGER NOT NULL DEFAULT 0,
+                TOTAL_DURATION_SEC REAL NOT NULL DEFAULT 0,
+                MAX_DURATION_SEC REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (TABLE_NM, LOG_DATE)
+            )
+        ''')
+        self._add_column_if_missing(cursor, 'TASK_LOG', 'ROLLED_UP INTEGER DEFAULT 0')
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS IDX_TASK_LOG_PENDING_ROLLUP "
+            "ON TASK_LOG (ROLLED_UP) WHERE ROLLED_UP = 0"
+        )
+    
+    def _migrate_task_log_metrics(self, cursor):
+        """7: TASK_LOG 전송 성능 컬럼 및 FILE_INFO 재시도 횟수
+        
+        BYTES: 파일 크기, *_MS: 단계별 소요 시간(밀리초), RETRY_CNT: 이전 실패 횟수,
+        STRATEGY: full/resume/retry/verify, START_TS/END_TS: epoch 초
+        """
+        for column_def in ('BYTES INTEGER', 'LIST_MS INTEGER', 'DOWNLOAD_MS INTEGER',
+                           'UPLOAD_MS INTEGER', 'DB_MS INTEGER', 'RETRY_CNT INTEGER DEFAULT 0',
+                           'STRATEGY TEXT', 'START_TS REAL', 'END_TS REAL'):
+            self._add_column_if_missing(cursor, 'TASK_LOG', column_def)
+        self._add_column_if_missing(cursor, 'FILE_INFO', 'RETRY_CNT INTEGER DEFAULT 0')
+        
+        # 기존 로그의 문자열 시각(로컬 시간)을 epoch 초로 채우기
+        cursor.execute("""
+            UPDATE TASK_LOG SET
+                START_TS = CAST(strftime('%s', START_TIME, 'utc') AS REAL),
+                END_TS = CAST(strftime('%s', END_TIME, 'utc') AS REAL)
+            WHERE START_TS IS NULL
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS IDX_TASK_LOG_START_TS ON TASK_LOG (START_TS)")
+    
+    def _migrate_search_index(self, cursor):
+        """8: TASK_LOG 파일명/오류 메시지, FILE_INFO 파일명 전문 검색 인덱스 (FTS5 external content)
+        
+        trigram 토크나이저로 LIKE '%...%'와 같은 부분 문자열 검색을 인덱스로 처리한다.
+        trigram을 지원하지 않는 SQLite는 unicode61(접두어 검색)을, FTS5가 없으면 인덱스 없이 둔다.
+        """
+        for fts_table, (table_name, columns) in self.SEARCH_INDEXES.items():
+            if not self._create_search_index(cursor, fts_table, table_name, columns):
+                return
+            # 기존 행 색인
+            cursor.execute(f"INSERT INTO {fts_table} ({fts_table}) VALUES ('rebuild')")
+    
+    def _create_search_index(self, cursor, fts_table, table_name, columns):
+        """FTS5 external content 인덱스와 동기화 트리거 생성 (TASK_LOG 월별 파일에서도 사용)
+        
+        Returns:
+            bool: 생성 여부 (FTS5를 지원하지 않으면 False)
+        """
+        column_list = ', '.join(columns)
+        try:
+            try:
+                cursor.execute(f"""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table}
+                    USING fts5({column_list}, content='{table_name}', content_rowid='rowid', tokenize='trigram')
+                """)
+            except sqlite3.OperationalError as e:
+                if 'trigram' not in str(e):
+                    raise
+                cursor.execute(f"""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table}
+                    USING fts5({column_list}, content='{table_name}', content_rowid='rowid')
+                """)
+        except sqlite3.OperationalError as e:
+            print(f"전문 검색 인덱스를 만들 수 없습니다 (LIKE 검색 사용): {e}")
+            return False
+        
+        new_values = ', '.join(f"new.{col}" for col in columns)
+        old_values = ', '.join(f"old.{col}" for col in columns)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS TRG_{fts_table}_INSERT AFTER INSERT ON {table_name}
+            BEGIN
+                INSERT INTO {fts_table} (rowid, {column_list}) VALUES (new.rowid, {new_values});
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS TRG_{fts_table}_DELETE AFTER DELETE ON {table_name}
+            BEGIN
+                INSERT INTO {fts_table} ({fts_table}, rowid, {column_list}) VALUES ('delete', old.rowid, {old_values});
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS TRG_{fts_table}_UPDATE AFTER UPDATE OF {column_list} ON {table_name}
+            BEGIN
+                INSERT INTO {fts_table} ({fts_table}, rowid, {column_list}) VALUES ('delete', old.rowid, {old_values});
+                INSERT INTO {fts_table} (rowid, {column_list}) VALUES (new.rowid, {new_values});
+            END
+        """)
+        return True
 
     def get_connection(self):
-        """데이터베이스 연결 객체 반환"""
-        return sqlite3.connect(self.db_path)
+        """현재 스레드의 데이터베이스 연결 객체 반환
+        
+        스레드마다 하나의 연결을 열어 재사용한다. 새 연결은 WAL 모드,
+        synchronous=NORMAL, 캐시 크기, busy timeout을 설정하며,
+        종료된 스레드의 연결은 새 연결을 만들 때 정리한다.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            if (self.task_log_partitions is not None
+                    and self._local.partition_generation != self.task_log_partitions.generation):
+                self._sync_task_log_partitions(conn)
+            return conn
+        
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False  # 종료 시 다른 스레드에서 닫기 위함
+        )
+        # 새 파일에만 적용됨 (WAL 전환 전에 설정, 기존 파일은 enable_incremental_vacuum 필요)
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size=-{self.CACHE_SIZE_KB}")
+        conn.execute(f"PRAGMA busy_timeout={self.BUSY_TIMEOUT_MS}")
+        
+        with self._connections_lock:
+            self._close_dead_thread_connections()
+            self._connections[threading.current_thread()] = conn
+        self._local.conn = conn
+        self._local.partition_generation = None
+        if self.task_log_partitions is not None:
+            self._sync_task_log_partitions(conn)
+        return conn
+    
+    def _sync_task_log_partitions(self, conn):
+        """현재 스레드 연결의 월별 TASK_LOG ATTACH 동기화"""
+        generation = self.task_log_partitions.generation
+        if self.task_log_partitions.sync_connection(conn):
+            self._local.partition_generation = generation
+    
+    def _close_dead_thread_connections(self):
+        """종료된 스레드의 연결 닫기 (_connections_lock 보유 상태에서 호출)"""
+        for thread in [t for t in self._connections if not t.is_alive()]:
+            try:
+                self._connections.pop(thread).close()
+            except Exception:
+                pass
+    
+    def close_all_connections(self):
+        """쓰기 스레드 종료 후 모든 스레드의 연결 닫기 (애플리케이션 종료 시 호출)"""
+        self.stop_writer()
+        with self._connections_lock:
+            for conn in self._connections.values():
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._connections.clear()
+        # 이후 호출 시 스레드별로 새 연결 생성
+        self._local = threading.local()
     
     def test_connection(self):
         """데이터베이스 연결 테스트
@@ -102,8 +457,7 @@ class DatabaseManager:
             tuple: (연결 성공 여부, 오류 메시지)
         """
         try:
-            conn = self.get_connection()
-            conn.close()
+            self.get_connection().execute("SELECT 1").fetchone()
             return True, ""
         except Exception as e:
             return False, str(e)
@@ -127,6 +481,7 @@ class DatabaseManager:
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
+            started = self.query_stats.timer()
             
             if params:
                 cursor.execute(query, params)
@@ -144,17 +499,22 @@ class DatabaseManager:
                 
             if commit:
                 conn.commit()
+            
+            if started is not None:
+                self._record_query(query, params, started, len(result), conn)
+                
+            if not commit and conn.in_transaction:
+                # 커밋하지 않은 변경은 버림 (연결 재사용 시 쓰기 잠금 유지 방지)
+                conn.rollback()
                 
             return result
         except Exception as e:
-            if conn and commit:
+            if conn and conn.in_transaction:
                 conn.rollback()
             raise e
         finally:
             if cursor:
                 cursor.close()
-            if conn:
-                conn.close()
     
     def execute_non_select_query(self, query, params=None, commit=True):
         """SELECT가 아닌 쿼리 실행 (INSERT, UPDATE, DELETE 등)
@@ -172,6 +532,7 @@ class DatabaseManager:
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
+            started = self.query_stats.timer()
             
             if params:
                 cursor.execute(query, params)
@@ -182,34 +543,219 @@ class DatabaseManager:
                 
             if commit:
                 conn.commit()
+            
+            if started is not None:
+                self._record_query(query, params, started, result, conn)
+                
+            if not commit and conn.in_transaction:
+                # 커밋하지 않은 변경은 버림 (연결 재사용 시 쓰기 잠금 유지 방지)
+                conn.rollback()
                 
             return result
         except Exception as e:
-            if conn and commit:
+            if conn and conn.in_transaction:
                 conn.rollback()
             raise e
         finally:
             if cursor:
                 cursor.close()
-            if conn:
-                conn.close()
+    
+    def execute_many(self, query, seq_of_params):
+        """같은 쿼리를 여러 파라미터로 한 트랜잭션에서 실행
+        
+        Args:
+            query (str): 실행할 SQL 쿼리
+            seq_of_params (iterable): 쿼리 파라미터 목록
+            
+        Returns:
+            int: 영향받은 행 수
+        """
+        conn = None
+        cursor = None
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            started = self.query_stats.timer()
+            cursor.executemany(query, seq_of_params)
+            result = cursor.rowcount
+            conn.commit()
+            if started is not None:
+                self._record_query(query, None, started, result)
+            return result
+        except Exception as e:
+            if conn and conn.in_transaction:
+                conn.rollback()
+            raise e
+        finally:
+            if cursor:
+                cursor.close()
+    
+    def _record_query(self, query, params, started, rows, conn=None):
+        """쿼리 실행 시간 기록 (느린 쿼리는 conn으로 실행 계획 조회)"""
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.query_stats.record(query, elapsed_ms, rows, self.query_stats.find_caller(), conn, params)
+    
+    def get_query_report(self, sort_by='total_ms', limit=30):
+        """쿼리 형태별 실행 통계 보고서 (텍스트)
+        
+        Args:
+            sort_by (str, optional): 정렬 기준 (total_ms, max_ms, avg_ms, count, rows). Defaults to 'total_ms'.
+            limit (int, optional): 최대 항목 수. Defaults to 30.
+            
+        Returns:
+            str: 보고서 텍스트
+        """
+        return self.query_stats.format_report(sort_by, limit)
+    
+    def dump_query_report(self, file_path, sort_by='total_ms'):
+        """쿼리 실행 통계와 최근 느린 쿼리를 JSON 파일로 저장"""
+        self.query_stats.dump_report(file_path, sort_by)
+    
+    # ============================================================
+    # 백그라운드 쓰기 함수들
+    # ============================================================
+    def _get_writer(self):
+        """쓰기 스레드 반환 (없으면 시작, 사용하지 않으면 None)"""
+        if not self.use_background_writer:
+            return None
+        with self._writer_lock:
+            if self._writer is not None and not self._writer.is_alive():
+                # 오류로 종료된 쓰기 스레드 교체 (남은 쓰기는 종료 시 실패 처리됨)
+                print("쓰기 스레드가 종료되어 다시 시작합니다.")
+                self._writer = None
+            if self._writer is None:
+                self._writer = DatabaseWriter(self)
+                self._writer.start()
+            return self._writer
+    
+    def submit_write(self, query, params=None, durable=False):
+        """쓰기 쿼리를 쓰기 스레드로 전달
+        
+        쓰기 스레드를 사용하지 않거나 종료 중이면 현재 스레드에서 바로 실행한다.
+        
+        Args:
+            query (str): 실행할 SQL 쿼리
+            params (tuple, optional): 쿼리 파라미터. Defaults to None.
+            durable (bool, optional): 커밋을 기다릴 쓰기인지 여부 (즉시 커밋). Defaults to False.
+            
+        Returns:
+            Future: 커밋 후 영향받은 행 수
+        """
+        writer = self._get_writer()
+        if writer is not None:
+            # 쓰기 스레드에서는 호출 메서드를 알 수 없으므로 큐에 넣을 때 찾아 둔다
+            caller = self.query_stats.find_caller() if self.query_stats.enabled else None
+            try:
+                return writer.submit(query, params, durable, caller)
+            except RuntimeError:
+                pass
+        
+        future = Future()
+        try:
+            future.set_result(self.execute_non_select_query(query, params))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    
+    def _wait_write(self, future):
+        """쓰기 스레드 커밋 대기 (WRITE_WAIT_TIMEOUT 초과 시 TimeoutError)"""
+        try:
+            return future.result(self.WRITE_WAIT_TIMEOUT)
+        except FutureTimeoutError:
+            raise TimeoutError(f"쓰기 스레드 커밋 대기 시간 초과 ({self.WRITE_WAIT_TIMEOUT}초)") from None
+    
+    def flush_writes(self, timeout=None):
+        """쓰기 스레드에 전달된 쓰기가 모두 커밋될 때까지 대기
+        
+        Returns:
+            bool: 제시간에 완료되었는지 여부
+        """
+        writer = self._writer
+        return writer.flush(timeout) if writer else True
+    
+    def stop_writer(self, timeout=10):
+        """남은 쓰기를 커밋하고 쓰기 스레드 종료 (다음 쓰기 요청 시 다시 시작)"""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer:
+            writer.stop(timeout)
+    
+    # ============================================================
+    # 설정 캐시 함수들 (TABLE_INFO, AUTO_CONFIG, COL_MAPPING)
+    # ============================================================
+    def invalidate_config_cache(self):
+        """설정 캐시 비우기 (설정 저장/삭제 시 호출)"""
+        with self._config_cache_lock:
+            self._config_cache.clear()
+            self._config_version = None
+            self._config_cache_generation += 1
+    
+    def _evict_config_cache(self, key):
+        """설정 캐시에서 키 하나만 제거 (설정이 아닌 값만 바뀐 경우)"""
+        with self._config_cache_lock:
+            self._config_cache.pop(key, None)
+            self._config_cache_generation += 1
+    
+    def _check_config_version(self):
+        """다른 연결(다른 프로세스 포함)의 설정 변경 확인
+        
+        현재 연결의 PRAGMA data_version이 그대로면 다른 연결의 커밋이 없으므로 조회 없이 통과하고,
+        바뀌었으면 CONFIG_VERSION을 읽어 설정 테이블이 바뀐 경우에만 캐시를 비운다.
+        """
+        conn = self.get_connection()
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if getattr(self._local, 'data_version', None) == data_version:
+            return
+        
+        version = conn.execute("SELECT VERSION FROM CONFIG_VERSION WHERE ID = 1").fetchone()[0]
+        with self._config_cache_lock:
+            if version != self._config_version:
+                self._config_cache.clear()
+                self._config_version = version
+                self._config_cache_generation += 1
+        self._local.data_version = data_version
+    
+    def _cached_query(self, key, query, params=None):
+        """설정 테이블 조회 (캐시에 있으면 캐시 결과 반환)
+        
+        Args:
+            key (tuple): 캐시 키
+            query (str): 캐시에 없을 때 실행할 SQL 쿼리
+            params (tuple, optional): 쿼리 파라미터. Defaults to None.
+            
+        Returns:
+            list: 쿼리 결과 행 목록 (복사본)
+        """
+        self._check_config_version()
+        with self._config_cache_lock:
+            if key in self._config_cache:
+                return list(self._config_cache[key])
+            generation = self._config_cache_generation
+        
+        result = self.execute_query(query, params)
+        
+        with self._config_cache_lock:
+            # 조회 중에 캐시가 비워졌으면 저장하지 않음 (이전 값일 수 있음)
+            if generation == self._config_cache_generation:
+                self._config_cache[key] = list(result)
+        return result
     
     # ============================================================
     # 테이블 정보 관련 함수들
     # ============================================================
     def get_table_list(self):
-        query = "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"  # 실제 테이블들
-        return [row[0] for row in self.execute_query(query)]
+        """조회 가능한 테이블 목록 (내부 관리/FTS 테이블 제외)"""
+        return sorted(self.BROWSABLE_TABLES)
     
     def get_table_info_list(self):
         """TABLE_INFO 테이블에서 테이블 목록 조회"""
         query = "SELECT TABLE_NM FROM TABLE_INFO ORDER BY TABLE_NM"
-        return [row[0] for row in self.execute_query(query)]
+        return [row[0] for row in self._cached_query(('table_info_list',), query)]
     
     def get_table_details(self, table_nm):
         """특정 테이블의 상세 정보 조회"""
         query = "SELECT TABLE_NM, TABLE_DC, TABLE_OWNERSHIP FROM TABLE_INFO WHERE TABLE_NM = ?"
-        result = self.execute_query(query, (table_nm,))
+        result = self._cached_query(('table_details', table_nm), query, (table_nm,))
         return result[0] if result else None
     
     def save_table_info(self, table_nm, table_dc, table_ownership):
@@ -222,12 +768,16 @@ class DatabaseManager:
                 TABLE_DC = excluded.TABLE_DC,
                 TABLE_OWNERSHIP = excluded.TABLE_OWNERSHIP
         """
-        return self.execute_non_select_query(query, (table_nm, table_dc, table_ownership))
+        result = self.execute_non_select_query(query, (table_nm, table_dc, table_ownership))
+        self.invalidate_config_cache()
+        return result
     
     def delete_table_info(self, table_nm):
         """테이블 정보 삭제"""
         query = "DELETE FROM TABLE_INFO WHERE TABLE_NM = ?"
-        return self.execute_non_select_query(query, (table_nm,))
+        result = self.execute_non_select_query(query, (table_nm,))
+        self.invalidate_config_cache()
+        return result
     
     def save_auto_config(self, table_nm, src_path, dest_path, auto_interval, use_yn):
         """자동화 설정 정보 저장 (DELETE_INTERVAL 제거)"""
@@ -240,18 +790,25 @@ class DatabaseManager:
                 AUTO_INTERVAL = excluded.AUTO_INTERVAL,
                 USE_YN = excluded.USE_YN
         """
-        return self.execute_non_select_query(query, (table_nm, src_path, dest_path, auto_interval, use_yn))
+        result = self.execute_non_select_query(query, (table_nm, src_path, dest_path, auto_interval, use_yn))
+        self.invalidate_config_cache()
+        return result
     
     def delete_auto_config(self, table_nm):
         """자동화 설정 정보 삭제"""
         query = "DELETE FROM AUTO_CONFIG WHERE TABLE_NM = ?"
-        return self.execute_non_select_query(query, (table_nm,))
+        result = self.execute_non_select_query(query, (table_nm,))
+        self.invalidate_config_cache()
+        return result
     
     def update_auto_config_timestamp(self, table_nm):
         """마지막 실행 시간 업데이트"""
         current_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         query = "UPDATE AUTO_CONFIG SET LAST_TIMESTAMP = ? WHERE TABLE_NM = ?"
-        return self.execute_non_select_query(query, (current_time, table_nm))
+        result = self.execute_non_select_query(query, (current_time, table_nm))
+        # 실행 시간은 설정이 아니므로 이를 포함한 스케줄러용 목록만 다시 읽음
+        self._evict_config_cache(('all_auto_configs',))
+        return result
     
     def register_file(self, table_nm, file_nm):
         """새 파일 정보 등록"""
@@ -275,30 +832,12 @@ class DatabaseManager:
         query = "UPDATE FILE_INFO SET DELETE_YN = 'Y' WHERE FILE_NM = ?"
         return self.execute_non_select_query(query, (file_name,))
     
-    def log_task(self, table_nm, file_name, start_time, error_msg=None):
-        """작업 로그 저장 (ERROR_MSG 포함)
-        
-        Args:
-            table_nm (str): 테이블명
-            file_name (str): 파일명
-            start_time (str): 시작 시간
-            error_msg (str, optional): 오류 메시지. Defaults to None.
-            
-        Returns:
-            int: 영향받은 행 수
-        """
-        current_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        query = """
-            INSERT INTO TASK_LOG (TABLE_NM, FILE_NM, START_TIME, END_TIME, ERROR_MSG)
-            VALUES (?, ?, ?, ?, ?)
-        """
-        return self.execute_non_select_query(query, (table_nm, file_name, start_time, current_time, error_msg))
-    
     def delete_column_mappings(self, table_nm):
         """특정 테이블의 컬럼 매핑 정보 삭제"""
         query = "DELETE FROM COL_MAPPING WHERE TABLE_NM = ?"
-        return self.execute_non_select_query(query, (table_nm,))
+        result = self.execute_non_select_query(query, (table_nm,))
+        self.invalidate_config_cache()
+        return result
     
     # ============================================================
     # 자동화 설정 관련 함수들 (DELETE_INTERVAL 제거)
@@ -306,12 +845,12 @@ class DatabaseManager:
     def get_auto_config_list(self):
         """자동화 설정 테이블에서 테이블 목록 조회"""
         query = "SELECT TABLE_NM FROM AUTO_CONFIG ORDER BY TABLE_NM"
-        return [row[0] for row in self.execute_query(query)]
+        return [row[0] for row in self._cached_query(('auto_config_list',), query)]
     
     def get_auto_config_details(self, table_nm):
         """특정 테이블의 자동화 설정 정보 조회"""
         query = "SELECT SRC_PATH, DEST_PATH, AUTO_INTERVAL, USE_YN FROM AUTO_CONFIG WHERE TABLE_NM = ?"
-        result = self.execute_query(query, (table_nm,))
+        result = self._cached_query(('auto_config_details', table_nm), query, (table_nm,))
         return result[0] if result else None
     
     def save_auto_config(self, table_nm, src_path, dest_path, auto_interval, use_yn):
@@ -325,18 +864,25 @@ class DatabaseManager:
                 AUTO_INTERVAL = excluded.AUTO_INTERVAL,
                 USE_YN = excluded.USE_YN
         """
-        return self.execute_query(query, (table_nm, src_path, dest_path, auto_interval, use_yn), commit=True)
+        result = self.execute_query(query, (table_nm, src_path, dest_path, auto_interval, use_yn), commit=True)
+        self.invalidate_config_cache()
+        return result
     
     def delete_auto_config(self, table_nm):
         """자동화 설정 정보 삭제"""
         query = "DELETE FROM AUTO_CONFIG WHERE TABLE_NM = ?"
-        return self.execute_query(query, (table_nm,), commit=True)
+        result = self.execute_query(query, (table_nm,), commit=True)
+        self.invalidate_config_cache()
+        return result
     
     def update_auto_config_timestamp(self, table_nm):
         """마지막 실행 시간 업데이트"""
         current_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         query = "UPDATE AUTO_CONFIG SET LAST_TIMESTAMP = ? WHERE TABLE_NM = ?"
-        return self.execute_query(query, (current_time, table_nm), commit=True)
+        result = self.execute_query(query, (current_time, table_nm), commit=True)
+        # 실행 시간은 설정이 아니므로 이를 포함한 스케줄러용 목록만 다시 읽음
+        self._evict_config_cache(('all_auto_configs',))
+        return result
     
     def get_all_auto_configs(self):
         """모든 자동화 설정 정보 조회 (스케줄러용)"""
@@ -345,7 +891,7 @@ class DatabaseManager:
             FROM AUTO_CONFIG 
             WHERE auto_interval IS NOT NULL AND auto_interval > 0
         """
-        return self.execute_query(query)
+        return self._cached_query(('all_auto_configs',), query)
     
     # ============================================================
     # 파일 정보 관련 함수들 (INSERT_YN -> COPY_YN 변경)
@@ -370,27 +916,200 @@ class DatabaseManager:
         return result[0][0] if result else 0
     
     def register_file(self, table_nm, file_nm):
-        """새 파일 정보 등록"""
-        query = """
-            INSERT INTO FILE_INFO (table_nm, file_nm, copy_yn, delete_yn)
-            VALUES (?, ?, 'N', 'N')
+        """새 파일 정보 등록 (전송 상태 DISCOVERED)"""
+        query = f"""
+            INSERT INTO FILE_INFO (table_nm, file_nm, copy_yn, delete_yn,
+                                   transfer_state, state_time, byte_offset, file_size)
+            VALUES (?, ?, 'N', 'N', '{FILE_STATE_DISCOVERED}', ?, 0, NULL)
             ON CONFLICT(file_nm) DO UPDATE SET
                 table_nm = excluded.table_nm,
                 copy_yn = 'N',
-                delete_yn = 'N'
+                delete_yn = 'N',
+                transfer_state = excluded.transfer_state,
+                state_time = excluded.state_time,
+                byte_offset = 0,
+                file_size = NULL,
+                retry_cnt = 0
         """
-        return self.execute_query(query, (table_nm, file_nm), commit=True)
+        return self.execute_query(query, (table_nm, file_nm, time.time()), commit=True)
     
     def update_file_status(self, file_name, copy_status='Y'):
-        """파일 처리 상태 업데이트 (INSERT_YN -> COPY_YN)"""
+        """파일 처리 상태 업데이트 (INSERT_YN -> COPY_YN, 쓰기 스레드에서 즉시 커밋)
+        
+        Returns:
+            Future: 커밋 후 영향받은 행 수
+        """
         query = "UPDATE FILE_INFO SET COPY_YN = ? WHERE FILE_NM = ?"
-        return self.execute_query(query, (copy_status, file_name), commit=True)
+        return self.submit_write(query, (copy_status, file_name), durable=True)
     
     def update_file_delete_status(self, file_name):
         """파일 삭제 상태 업데이트"""
         query = "UPDATE FILE_INFO SET DELETE_YN = 'Y' WHERE FILE_NM = ?"
         return self.execute_query(query, (file_name,), commit=True)
     
+    def register_files(self, table_nm, file_names):
+        """여러 파일 정보를 한 트랜잭션으로 등록 (register_file 일괄 버전)
+        
+        Args:
+            table_nm (str): 테이블명
+            file_names (iterable): 파일명 목록
+            
+        Returns:
+            int: 영향받은 행 수
+        """
+        query = f"""
+            INSERT INTO FILE_INFO (table_nm, file_nm, copy_yn, delete_yn,
+                                   transfer_state, state_time, byte_offset, file_size)
+            VALUES (?, ?, 'N', 'N', '{FILE_STATE_DISCOVERED}', ?, 0, NULL)
+            ON CONFLICT(file_nm) DO UPDATE SET
+                table_nm = excluded.table_nm,
+                copy_yn = 'N',
+                delete_yn = 'N',
+                transfer_state = excluded.transfer_state,
+                state_time = excluded.state_time,
+                byte_offset = 0,
+                file_size = NULL,
+                retry_cnt = 0
+        """
+        now = time.time()
+        # 같은 파일명은 한 번만 등록 (중복이면 UPSERT가 두 번 실행되어 행 수가 늘어남)
+        return self.execute_many(query, ((table_nm, file_nm, now) for file_nm in dict.fromkeys(file_names)))
+    
+    def update_files_transfer_state(self, file_names, state):
+        """여러 파일의 전송 상태를 한 문장으로 전이 (update_transfer_state 일괄 버전)
+        
+        파일 목록은 JSON 배열 하나로 넘겨 파라미터 개수 제한 없이 처리한다.
+        전송 위치는 0으로 초기화하고 파일 크기는 그대로 둔다.
+        
+        Args:
+            file_names (list): 파일명 목록
+            state (str): 전송 상태 (FILE_STATE_*)
+            
+        Returns:
+            int: 영향받은 행 수
+            
+        Raises:
+            TimeoutError: WRITE_WAIT_TIMEOUT 안에 커밋되지 않은 경우
+        """
+        if not file_names:
+            return 0
+        query = f"""
+            UPDATE FILE_INFO SET
+                TRANSFER_STATE = ?,
+                STATE_TIME = ?,
+                BYTE_OFFSET = 0,
+                COPY_YN = CASE WHEN ? = '{FILE_STATE_VERIFIED}' THEN 'Y' ELSE 'N' END
+            WHERE FILE_NM IN (SELECT value FROM json_each(?))
+        """
+        return self._wait_write(self.submit_write(
+            query, (state, time.time(), state, json.dumps(list(file_names))), durable=True
+        ))
+    
+    def update_transfer_state(self, file_name, state, byte_offset=0, file_size=None, wait=True):
+        """파일 전송 상태 전이 기록 (쓰기 스레드에서 커밋될 때까지 대기)
+        
+        COPY_YN은 VERIFIED일 때만 'Y'로 맞추고, FAILED이면 RETRY_CNT를 1 증가시킨다.
+        wait가 False이면 커밋을 기다리지 않고 다른 쓰기와 모아서 커밋한다 (주기적 전송 위치 기록용,
+        기록이 늦거나 유실되어도 이전 위치부터 이어받을 뿐이다).
+        
+        Args:
+            file_name (str): 파일명
+            state (str): 전송 상태 (FILE_STATE_*)
+            byte_offset (int, optional): 현재 단계의 전송 위치. Defaults to 0.
+            file_size (int, optional): 파일 크기 (None이면 기존 값 유지). Defaults to None.
+            wait (bool, optional): 커밋까지 대기 여부. Defaults to True.
+            
+        Returns:
+            int: 영향받은 행 수 (wait가 False이면 Future)
+            
+        Raises:
+            TimeoutError: WRITE_WAIT_TIMEOUT 안에 커밋되지 않은 경우
+        """
+        query = f"""
+            UPDATE FILE_INFO SET
+                TRANSFER_STATE = ?,
+                STATE_TIME = ?,
+                BYTE_OFFSET = ?,
+                FILE_SIZE = COALESCE(?, FILE_SIZE),
+                COPY_YN = CASE WHEN ? = '{FILE_STATE_VERIFIED}' THEN 'Y' ELSE 'N' END,
+                RETRY_CNT = COALESCE(RETRY_CNT, 0) + CASE WHEN ? = '{FILE_STATE_FAILED}' THEN 1 ELSE 0 END
+            WHERE FILE_NM = ?
+        """
+        future = self.submit_write(
+            query, (state, time.time(), byte_offset, file_size, state, state, file_name), durable=wait
+        )
+        return self._wait_write(future) if wait else future
+    
+    def get_pending_transfers(self, table_nm):
+        """전송 대기 중인 파일과 마지막 전송 상태 조회
+        
+        Args:
+            table_nm (str): 테이블명
+            
+        Returns:
+            list: [(파일명, 전송 상태, 전송 위치, 파일 크기, 재시도 횟수), ...]
+        """
+        query = f"""
+            SELECT fi.file_nm, COALESCE(fi.transfer_state, '{FILE_STATE_DISCOVERED}'),
+                   COALESCE(fi.byte_offset, 0), fi.file_size, COALESCE(fi.retry_cnt, 0)
+            FROM FILE_INFO fi
+            JOIN AUTO_CONFIG ac ON fi.table_nm = ac.table_nm
+            WHERE ac.table_nm = ?
+            AND ac.use_yn = 'Y'
+            AND (fi.copy_yn IS NULL OR fi.copy_yn = 'N')
+            ORDER BY fi.file_nm ASC
+        """
+        return self.execute_query(query, (table_nm,))
+    
+    def find_new_files(self, file_names):
+        """등록되지 않은 파일만 골라내기 (SQL anti-join)
+        
+        파일명을 연결 전용 임시 테이블에 넣고 FILE_INFO 기본키와 anti-join하므로
+        등록 이력 전체를 메모리로 읽지 않는다. 임시 테이블 내용은 조회 후 롤백으로 비운다.
+        
+        Args:
+            file_names (iterable): 원격 파일명 목록
+            
+        Returns:
+            list: 등록되지 않은 파일명 목록 (정렬)
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS REMOTE_FILE (FILE_NM TEXT PRIMARY KEY)")
+            cursor.executemany(
+                "INSERT OR IGNORE INTO temp.REMOTE_FILE (FILE_NM) VALUES (?)",
+                ((file_nm,) for file_nm in file_names)
+            )
+            cursor.execute("""
+                SELECT rf.FILE_NM FROM temp.REMOTE_FILE rf
+                WHERE NOT EXISTS (SELECT 1 FROM FILE_INFO fi WHERE fi.FILE_NM = rf.FILE_NM)
+                ORDER BY rf.FILE_NM
+            """)
+            return [row[0] for row in cursor.fetchall()]
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            cursor.close()
+    
+    def get_file_watermark(self, table_nm):
+        """'테이블명_숫자...' 형식으로 등록된 파일 중 가장 큰 파일명 (파일명 기본키 범위 조회)
+        
+        Args:
+            table_nm (str): 테이블명
+            
+        Returns:
+            str: 가장 큰 파일명 (없으면 None)
+        """
+        # '0' ~ '9' 다음 문자(':') 범위로 접두어 뒤가 숫자인 파일만 조회
+        # (범위에 'A_1'과 'A_1_B_...'처럼 다른 테이블 파일이 섞일 수 있어 TABLE_NM으로 다시 거른다)
+        query = """
+            SELECT MAX(FILE_NM) FROM FILE_INFO
+            WHERE FILE_NM >= ? AND FILE_NM < ? AND TABLE_NM = ?
+        """
+        result = self.execute_query(query, (f"{table_nm}_0", f"{table_nm}_:", table_nm))
+        return result[0][0] if result else None
+    
     def get_existing_files(self, table_nm):
         """기존에 등록된 파일 목록 조회"""
         query = "SELECT file_nm FROM FILE_INFO WHERE table_nm = ?"
@@ -412,15 +1131,287 @@ class DatabaseManager:
     # ============================================================
     # 로그 관련 함수들 (INSERT_CNT 제거)
     # ============================================================
-    def log_task(self, table_nm, file_name, start_time, error_msg=None):
-        """작업 로그 저장 (INSERT_CNT 제거)"""
-        current_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    def log_task(self, table_nm, file_name, start_time, error_msg=None, metrics=None):
+        """작업 로그 저장 (ERROR_MSG 및 전송 성능 정보 포함, 쓰기 스레드에서 모아서 커밋)
+        
+        Args:
+            table_nm (str): 테이블명
+            file_name (str): 파일명
+            start_time (str): 시작 시간 ('YYYY-MM-DD HH:MM:SS')
+            error_msg (str, optional): 오류 메시지 (성공 시 None). Defaults to None.
+            metrics (dict, optional): 전송 성능 정보. 키: start_ts, end_ts(없으면 현재 시각), bytes,
+                list_ms, download_ms, upload_ms, db_ms, retry_cnt, strategy. Defaults to None.
+            
+        Returns:
+            Future: 커밋 후 영향받은 행 수
+        """
+        metrics = metrics or {}
+        end_ts = metrics.get('end_ts') or time.time()
+        current_time = datetime.datetime.fromtimestamp(end_ts).strftime('%Y-%m-%d %H:%M:%S')
+        
+        start_ts = metrics.get('start_ts')
+        if start_ts is None:
+            try:
+                start_ts = datetime.datetime.strptime(start_time, '%Y-%m-%d %H:%M:%S').timestamp()
+            except (TypeError, ValueError):
+                start_ts = None
+        
+        query = f"""
+            INSERT INTO {self._task_log_table()} (TABLE_NM, FILE_NM, START_TIME, END_TIME, ERROR_MSG,
+                                  BYTES, LIST_MS, DOWNLOAD_MS, UPLOAD_MS, DB_MS,
+                                  RETRY_CNT, STRATEGY, START_TS, END_TS)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        return self.submit_write(query, (
+            table_nm, file_name, start_time, current_time, error_msg,
+            metrics.get('bytes'), metrics.get('list_ms'), metrics.get('download_ms'),
+            metrics.get('upload_ms'), metrics.get('db_ms'), metrics.get('retry_cnt', 0),
+            metrics.get('strategy'), start_ts, end_ts
+        ))
+    
+    def get_transfer_stats(self, start_ts=None, end_ts=None, table_nm=None):
+        """테이블별 전송 처리량 및 소요 시간 백분위수 조회
+        
+        백분위수는 성공한 전송의 (END_TS - START_TS)에 대한 nearest-rank 값이다.
+        
+        Args:
+            start_ts (float, optional): 조회 시작 epoch 초 (포함). 기본값은 end_ts 24시간 전.
+            end_ts (float, optional): 조회 종료 epoch 초 (미포함). 기본값은 현재 시각.
+            table_nm (str, optional): 테이블명 (None이면 전체). Defaults to None.
+            
+        Returns:
+            list: 테이블별 dict (table_nm, count, failures, retries, bytes, mb_per_sec,
+                  p50_ms, p95_ms, p99_ms, avg_download_ms, avg_upload_ms, avg_db_ms)
+        """
+        end_ts = time.time() if end_ts is None else end_ts
+        start_ts = end_ts - 86400 if start_ts is None else start_ts
         
         query = """
-            INSERT INTO TASK_LOG (TABLE_NM, FILE_NM, START_TIME, END_TIME)
-            VALUES (?, ?, ?, ?)
+            WITH W AS (
+                SELECT TABLE_NM, ERROR_MSG, BYTES, DOWNLOAD_MS, UPLOAD_MS, DB_MS,
+                       COALESCE(RETRY_CNT, 0) AS RETRY_CNT,
+                       (END_TS - START_TS) * 1000.0 AS DURATION_MS
+                FROM {source}
+                WHERE START_TS >= ? AND START_TS < ?
+                AND (? IS NULL OR TABLE_NM = ?)
+            ),
+            RANKED AS (
+                SELECT TABLE_NM, DURATION_MS,
+                       ROW_NUMBER() OVER (PARTITION BY TABLE_NM ORDER BY DURATION_MS) AS RN,
+                       COUNT(*) OVER (PARTITION BY TABLE_NM) AS CNT
+                FROM W
+                WHERE ERROR_MSG IS NULL AND DURATION_MS IS NOT NULL
+            ),
+            PCT AS (
+                SELECT TABLE_NM,
+                       MIN(CASE WHEN RN >= 0.50 * CNT THEN DURATION_MS END) AS P50,
+                       MIN(CASE WHEN RN >= 0.95 * CNT THEN DURATION_MS END) AS P95,
+                       MIN(CASE WHEN RN >= 0.99 * CNT THEN DURATION_MS END) AS P99
+                FROM RANKED
+                GROUP BY TABLE_NM
+            )
+            SELECT W.TABLE_NM,
+                   COUNT(*),
+                   SUM(CASE WHEN W.ERROR_MSG IS NOT NULL THEN 1 ELSE 0 END),
+                   SUM(W.RETRY_CNT),
+                   SUM(CASE WHEN W.ERROR_MSG IS NULL THEN COALESCE(W.BYTES, 0) ELSE 0 END),
+                   SUM(CASE WHEN W.ERROR_MSG IS NULL THEN W.DURATION_MS ELSE 0 END),
+                   PCT.P50, PCT.P95, PCT.P99,
+                   AVG(W.DOWNLOAD_MS), AVG(W.UPLOAD_MS), AVG(W.DB_MS)
+            FROM W
+            LEFT JOIN PCT ON PCT.TABLE_NM = W.TABLE_NM
+            GROUP BY W.TABLE_NM
+            ORDER BY W.TABLE_NM
+        """
+        with self.task_log_view(start_ts, end_ts) as source:
+            result = self.execute_query(query.format(source=source), (start_ts, end_ts, table_nm, table_nm))
+        
+        stats = []
+        for row in result:
+            (name, count, failures, retries, total_bytes, total_ms,
+             p50, p95, p99, avg_download, avg_upload, avg_db) = row
+            stats.append({
+                'table_nm': name,
+                'count': count,
+                'failures': failures,
+                'retries': retries,
+                'bytes': total_bytes,
+                'mb_per_sec': (total_bytes / 1048576) / (total_ms / 1000) if total_ms else None,
+                'p50_ms': p50,
+                'p95_ms': p95,
+                'p99_ms': p99,
+                'avg_download_ms': avg_download,
+                'avg_upload_ms': avg_upload,
+                'avg_db_ms': avg_db,
+            })
+        return stats
+    
+    # ============================================================
+    # 전문 검색 함수들 (TASK_LOG_FTS, FILE_INFO_FTS)
+    # ============================================================
+    def _search_tokenizer(self, fts_table, schema='main'):
+        """검색 인덱스 토크나이저 ('trigram', 'unicode61', 인덱스가 없으면 None)"""
+        cache = self._search_tokenizers
+        key = f"{schema}.{fts_table}"
+        if key not in cache:
+            row = self.execute_query(
+                f"SELECT sql FROM {schema}.sqlite_master WHERE type = 'table' AND name = ?", (fts_table,)
+            )
+            if not row:
+                cache[key] = None
+            else:
+                cache[key] = 'trigram' if 'trigram' in row[0][0] else 'unicode61'
+        return cache[key]
+    
+    def _search_match_expression(self, fts_table, text, schema='main'):
+        """검색어를 FTS5 MATCH 식으로 변환 (모든 단어 포함)
+        
+        Returns:
+            str: MATCH 식 (인덱스를 쓸 수 없으면 None → LIKE 검색)
+        """
+        tokenizer = self._search_tokenizer(fts_table, schema)
+        terms = text.split()
+        if tokenizer is None or not terms:
+            return None
+        # trigram은 3글자 미만 검색어를 인덱스로 찾지 못함
+        if tokenizer == 'trigram' and any(len(term) < 3 for term in terms):
+            return None
+        suffix = '*' if tokenizer == 'unicode61' else ''
+        return ' AND '.join('"{}"{}'.format(term.replace('"', '""'), suffix) for term in terms)
+    
+    def _search_like_condition(self, alias, columns, text):
+        """검색어별 LIKE 조건 (인덱스를 쓸 수 없을 때)
+        
+        Returns:
+            tuple: (조건 목록, 파라미터 목록)
+        """
+        conditions, params = [], []
+        for term in text.split():
+            pattern = '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            conditions.append('(' + ' OR '.join(f"{alias}.{col} LIKE ? ESCAPE '\\'" for col in columns) + ')')
+            params.extend([pattern] * len(columns))
+        return conditions, params
+    
+    def search_task_log(self, text, start_ts=None, end_ts=None, table_nm=None, limit=100):
+        """작업 로그 파일명/오류 메시지 검색 (관련도 순)
+        
+        월별 분할 시 main.TASK_LOG와 기간에 해당하는 월별 로그를 각각 검색해 합친다.
+        
+        Args:
+            text (str): 검색어 (공백으로 구분한 단어를 모두 포함하는 로그)
+            start_ts (float, optional): 시작 epoch 초 (포함). Defaults to None.
+            end_ts (float, optional): 종료 epoch 초 (미포함). Defaults to None.
+            table_nm (str, optional): 테이블명. Defaults to None.
+            limit (int, optional): 최대 결과 수. Defaults to 100.
+            
+        Returns:
+            list: dict 목록 (table_nm, file_nm, start_time, end_time, error_msg)
+        """
+        if self.task_log_partitions is None:
+            rows = self._search_task_log_schema('main', text, start_ts, end_ts, table_nm, limit)
+        else:
+            conn = self.get_connection()
+            rows = []
+            with self.task_log_partitions.attached_range(conn, start_ts, end_ts) as schemas:
+                for schema in ['main'] + schemas:
+                    rows.extend(self._search_task_log_schema(schema, text, start_ts, end_ts, table_nm, limit))
+            # 관련도 순 (인덱스 없이 찾은 결과는 최근 순으로 뒤에)
+            rows.sort(key=lambda row: (0, row[5]) if row[5] is not None else (1, -(row[6] or 0)))
+            rows = rows[:limit]
+        
+        return [
+            {'table_nm': row[0], 'file_nm': row[1], 'start_time': row[2], 'end_time': row[3], 'error_msg': row[4]}
+            for row in rows
+        ]
+    
+    def _search_task_log_schema(self, schema, text, start_ts, end_ts, table_nm, limit):
+        """한 스키마의 TASK_LOG 검색 (search_task_log 내부 함수)
+        
+        Returns:
+            list: (TABLE_NM, FILE_NM, START_TIME, END_TIME, ERROR_MSG, 관련도, START_TS) 목록
+        """
+        conditions, params = [], []
+        match = self._search_match_expression('TASK_LOG_FTS', text, schema)
+        if match is not None:
+            source = f"{schema}.TASK_LOG_FTS f JOIN {schema}.TASK_LOG t ON t.rowid = f.rowid"
+            conditions.append("TASK_LOG_FTS MATCH ?")
+            params.append(match)
+            rank, order = "f.rank", "f.rank"
+        else:
+            source = f"{schema}.TASK_LOG t"
+            like_conditions, like_params = self._search_like_condition('t', ('FILE_NM', 'ERROR_MSG'), text)
+            conditions.extend(like_conditions)
+            params.extend(like_params)
+            rank, order = "NULL", "t.START_TS DESC"
+        
+        if start_ts is not None:
+            conditions.append("t.START_TS >= ?")
+            params.append(start_ts)
+        if end_ts is not None:
+            conditions.append("t.START_TS < ?")
+            params.append(end_ts)
+        if table_nm:
+            conditions.append("t.TABLE_NM = ?")
+            params.append(table_nm)
+        
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        query = f"""
+            SELECT t.TABLE_NM, t.FILE_NM, t.START_TIME, t.END_TIME, t.ERROR_MSG, {rank}, t.START_TS
+            FROM {source}{where}
+            ORDER BY {order}
+            LIMIT ?
         """
-        return self.execute_query(query, (table_nm, file_name, start_time, current_time), commit=True)
+        params.append(limit)
+        return self.execute_query(query, tuple(params))
+    
+    def search_files(self, text, table_nm=None, limit=100):
+        """등록 파일명 검색 (관련도 순)
+        
+        Args:
+            text (str): 검색어 (공백으로 구분한 단어를 모두 포함하는 파일명)
+            table_nm (str, optional): 테이블명. Defaults to None.
+            limit (int, optional): 최대 결과 수. Defaults to 100.
+            
+        Returns:
+            list: dict 목록 (table_nm, file_nm, copy_yn, transfer_state)
+        """
+        conditions, params = [], []
+        match = self._search_match_expression('FILE_INFO_FTS', text)
+        if match is not None:
+            source = "FILE_INFO_FTS f JOIN FILE_INFO fi ON fi.rowid = f.rowid"
+            conditions.append("FILE_INFO_FTS MATCH ?")
+            params.append(match)
+            order = "f.rank"
+        else:
+            source = "FILE_INFO fi"
+            like_conditions, like_params = self._search_like_condition('fi', ('FILE_NM',), text)
+            conditions.extend(like_conditions)
+            params.extend(like_params)
+            order = "fi.FILE_NM DESC"
+        
+        if table_nm:
+            conditions.append("fi.TABLE_NM = ?")
+            params.append(table_nm)
+        
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        query = f"""
+            SELECT fi.TABLE_NM, fi.FILE_NM, fi.COPY_YN, fi.TRANSFER_STATE
+            FROM {source}{where}
+            ORDER BY {order}
+            LIMIT ?
+        """
+        params.append(limit)
+        
+        return [
+            {'table_nm': row[0], 'file_nm': row[1], 'copy_yn': row[2], 'transfer_state': row[3]}
+            for row in self.execute_query(query, tuple(params))
+        ]
+    
+    def rebuild_search_index(self):
+        """검색 인덱스를 원본 테이블로부터 다시 생성"""
+        for fts_table in self.SEARCH_INDEXES:
+            if self._search_tokenizer(fts_table) is not None:
+                self.execute_non_select_query(f"INSERT INTO {fts_table} ({fts_table}) VALUES ('rebuild')")
     
     # ============================================================
     # 컬럼 매핑 관련 함수들 (사용하지 않지만 호환성 유지)
@@ -428,12 +1419,12 @@ class DatabaseManager:
     def get_col_mapping_tables(self):
         """컬럼 매핑이 설정된 테이블 목록 조회"""
         query = "SELECT DISTINCT TABLE_NM FROM COL_MAPPING ORDER BY TABLE_NM"
-        return [row[0] for row in self.execute_query(query)]
+        return [row[0] for row in self._cached_query(('col_mapping_tables',), query)]
     
     def get_column_mappings(self, table_nm):
         """특정 테이블의 컬럼 매핑 정보 조회"""
         query = "SELECT DB_COL_NM, XML_COL_NM FROM COL_MAPPING WHERE TABLE_NM = ?"
-        return self.execute_query(query, (table_nm,))
+        return self._cached_query(('column_mappings', table_nm), query, (table_nm,))
     
     def save_column_mappings(self, table_nm, mappings):
         """컬럼 매핑 정보 저장"""
@@ -463,33 +1454,516 @@ class DatabaseManager:
         finally:
             if cursor:
                 cursor.close()
-            if conn:
-                conn.close()
+            self.invalidate_config_cache()
     
     def delete_column_mappings(self, table_nm):
         """특정 테이블의 컬럼 매핑 정보 삭제"""
         query = "DELETE FROM COL_MAPPING WHERE TABLE_NM = ?"
-        return self.execute_query(query, (table_nm,), commit=True)
+        result = self.execute_query(query, (table_nm,), commit=True)
+        self.invalidate_config_cache()
+        return result
     
     # ============================================================
-    # 데이터 조회 및 참조 함수들 (호환성 유지)
+    # TASK_LOG 월별 분할 관련 함수들
     # ============================================================
-    def get_table_data_sample(self, table_name, limit=10):
-        """테이블 데이터 샘플 조회 (SQLite에서는 관리 테이블 데이터 반환)"""
-        if table_name in ['TABLE_INFO', 'FILE_INFO', 'AUTO_CONFIG', 'COL_MAPPING', 'TASK_LOG']:
+    def enable_task_log_partitions(self, partition_dir=None, archive_dir=None):
+        """새 작업 로그를 월별 파일에 기록하도록 설정 (이전 로그는 main.TASK_LOG에 유지)
+        
+        Args:
+            partition_dir (str, optional): 월별 파일 디렉토리. None이면 DB 파일과 같은 디렉토리.
+            archive_dir (str, optional): 보존 기간이 지난 월의 압축 보관 디렉토리. None이면 삭제.
+        """
+        self.flush_writes()
+        self.task_log_partitions = TaskLogPartitions(self, partition_dir, archive_dir)
+        self.task_log_partitions.current_schema()
+    
+    def _task_log_table(self):
+        """새 작업 로그를 기록할 테이블 (분할 시 현재 월 파일의 TASK_LOG)"""
+        if self.task_log_partitions is None:
+            return 'TASK_LOG'
+        return f"{self.task_log_partitions.current_schema()}.TASK_LOG"
+    
+    def _task_log_schemas(self):
+        """쓰기 가능한 TASK_LOG 스키마 목록 (main과 쓰는 중인 월)"""
+        if self.task_log_partitions is None:
+            return ['main']
+        self.get_connection()
+        return ['main'] + [self.task_log_partitions.schema_name(m) for m in self.task_log_partitions.hot_months()]
+    
+    @contextmanager
+    def task_log_view(self, start_ts=None, end_ts=None, row_keys=False):
+        """기간의 작업 로그 전체를 조회하는 뷰 이름 제공
+        
+        분할하지 않으면 TASK_LOG를, 분할하면 main.TASK_LOG와 기간에 해당하는 월별 TASK_LOG를
+        합친 임시 뷰(TASK_LOG_RANGE)를 만든다. 지난 월 파일은 블록 안에서만 ATTACH한다.
+        
+        Args:
+            start_ts (float, optional): 시작 epoch 초. None이면 처음부터.
+            end_ts (float, optional): 종료 epoch 초. None이면 현재까지.
+            row_keys (bool, optional): 분할 시 행 위치 컬럼(PART_NO: main 0, 월 순서대로 1부터,
+                ROW_NO: 원본 rowid)을 앞에 추가. Defaults to False.
+            
+        Yields:
+            str: FROM 절에 사용할 이름
+        """
+        if self.task_log_partitions is None:
+            yield 'TASK_LOG'
+            return
+        
+        conn = self.get_connection()
+        with self.task_log_partitions.attached_range(conn, start_ts, end_ts) as schemas:
+            columns = [col[0] for col in self.get_table_columns('TASK_LOG')]
+            keys = "0 AS PART_NO, rowid AS ROW_NO, " if row_keys else ""
+            selects = [f"SELECT {keys}{', '.join(columns)} FROM main.TASK_LOG"]
+            for part_no, schema in enumerate(schemas, 1):
+                # 월별 파일 생성 후 추가된 컬럼은 NULL
+                existing = {row[1] for row in conn.execute(f"PRAGMA {schema}.table_info(TASK_LOG)")}
+                select_list = ', '.join(col if col in existing else f"NULL AS {col}" for col in columns)
+                keys = f"{part_no} AS PART_NO, rowid AS ROW_NO, " if row_keys else ""
+                selects.append(f"SELECT {keys}{select_list} FROM {schema}.TASK_LOG")
+            
+            conn.execute("DROP VIEW IF EXISTS temp.TASK_LOG_RANGE")
+            conn.execute(f"CREATE TEMP VIEW TASK_LOG_RANGE AS {' UNION ALL '.join(selects)}")
             try:
-                query = f"SELECT * FROM {table_name} LIMIT {limit}"
-                result = self.execute_query(query)
-                # execute_query가 SELECT 쿼리에 대해 list를 반환하는지 확인
-                if isinstance(result, list):
-                    return result
-                else:
-                    return []
-            except Exception as e:
-                print(f"테이블 {table_name} 데이터 조회 오류: {e}")
-                return []
+                yield 'TASK_LOG_RANGE'
+            finally:
+                conn.execute("DROP VIEW IF EXISTS temp.TASK_LOG_RANGE")
+    
+    # ============================================================
+    # 작업 로그 보존 관련 함수들 (일간 집계, 삭제, 공간 반환)
+    # ============================================================
+    def rollup_task_log(self, batch_size=1000):
+        """집계되지 않은 TASK_LOG 행을 TASK_LOG_DAILY에 누적 (스키마별 한 트랜잭션)
+        
+        누적과 집계 표시를 같은 트랜잭션에서 처리하므로 여러 인스턴스가 동시에
+        실행해도 중복 집계되지 않는다. 바이트 수는 성공한 행의 BYTES(없으면 FILE_INFO.FILE_SIZE)를 사용한다.
+        월별 분할 시 main.TASK_LOG와 쓰는 중인 월의 TASK_LOG를 각각 집계한다.
+        
+        Args:
+            batch_size (int, optional): 스키마별로 한 번에 집계할 최대 행 수. Defaults to 1000.
+            
+        Returns:
+            int: 집계한 행 수
+        """
+        return sum(self._rollup_task_log_schema(schema, batch_size) for schema in self._task_log_schemas())
+    
+    def _rollup_task_log_schema(self, schema, batch_size):
+        """한 스키마의 TASK_LOG 집계 (rollup_task_log 내부 함수)"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            upper = cursor.execute(f"""
+                SELECT MAX(rowid) FROM (
+                    SELECT rowid FROM {schema}.TASK_LOG WHERE ROLLED_UP = 0 ORDER BY rowid LIMIT ?
+                )
+            """, (batch_size,)).fetchone()[0]
+            if upper is None:
+                conn.rollback()
+                return 0
+            
+            cursor.execute(f"""
+                INSERT INTO main.TASK_LOG_DAILY (TABLE_NM, LOG_DATE, TASK_CNT, FAIL_CNT,
+                                            TOTAL_BYTES, TOTAL_DURATION_SEC, MAX_DURATION_SEC)
+                SELECT tl.TABLE_NM,
+                       substr(tl.START_TIME, 1, 10),
+                       COUNT(*),
+                       SUM(CASE WHEN tl.ERROR_MSG IS NOT NULL THEN 1 ELSE 0 END),
+                       SUM(CASE WHEN tl.ERROR_MSG IS NULL
+                                THEN COALESCE(tl.BYTES, fi.FILE_SIZE, 0) ELSE 0 END),
+                       SUM(MAX(0, COALESCE(tl.END_TS - tl.START_TS,
+                           (julianday(tl.END_TIME) - julianday(tl.START_TIME)) * 86400, 0))),
+                       MAX(MAX(0, COALESCE(tl.END_TS - tl.START_TS,
+                           (julianday(tl.END_TIME) - julianday(tl.START_TIME)) * 86400, 0)))
+                FROM {schema}.TASK_LOG tl
+                LEFT JOIN main.FILE_INFO fi ON fi.FILE_NM = tl.FILE_NM
+                WHERE tl.ROLLED_UP = 0 AND tl.rowid <= ?
+                GROUP BY tl.TABLE_NM, substr(tl.START_TIME, 1, 10)
+                ON CONFLICT(TABLE_NM, LOG_DATE) DO UPDATE SET
+                    TASK_CNT = TASK_CNT + excluded.TASK_CNT,
+                    FAIL_CNT = FAIL_CNT + excluded.FAIL_CNT,
+                    TOTAL_BYTES = TOTAL_BYTES + excluded.TOTAL_BYTES,
+                    TOTAL_DURATION_SEC = TOTAL_DURATION_SEC + excluded.TOTAL_DURATION_SEC,
+                    MAX_DURATION_SEC = MAX(MAX_DURATION_SEC, excluded.MAX_DURATION_SEC)
+            """, (upper,))
+            cursor.execute(f"UPDATE {schema}.TASK_LOG SET ROLLED_UP = 1 WHERE ROLLED_UP = 0 AND rowid <= ?", (upper,))
+            count = cursor.rowcount
+            conn.commit()
+            return count
+        except Exception:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        finally:
+            cursor.close()
+    
+    def purge_task_log(self, before_time, batch_size=1000):
+        """집계 완료된 오래된 TASK_LOG 행 삭제 (한 배치)
+        
+        Args:
+            before_time (str): 이 시각('YYYY-MM-DD HH:MM:SS') 이전에 시작한 행 삭제
+            batch_size (int, optional): 한 번에 삭제할 최대 행 수. Defaults to 1000.
+            
+        Returns:
+            int: 삭제한 행 수
+        """
+        query = """
+            DELETE FROM TASK_LOG WHERE rowid IN (
+                SELECT rowid FROM TASK_LOG
+                WHERE ROLLED_UP = 1 AND START_TIME < ?
+                ORDER BY rowid LIMIT ?
+            )
+        """
+        return self.execute_non_select_query(query, (before_time, batch_size))
+    
+    def get_task_log_daily(self, table_nm=None, start_date=None, end_date=None):
+        """일간 작업 집계 조회
+        
+        Args:
+            table_nm (str, optional): 테이블명 (None이면 전체). Defaults to None.
+            start_date (str, optional): 시작일 'YYYY-MM-DD' (포함). Defaults to None.
+            end_date (str, optional): 종료일 'YYYY-MM-DD' (포함). Defaults to None.
+            
+        Returns:
+            list: [(테이블명, 날짜, 작업 수, 실패 수, 바이트, 총 소요(초), 최대 소요(초)), ...]
+        """
+        query = """
+            SELECT TABLE_NM, LOG_DATE, TASK_CNT, FAIL_CNT, TOTAL_BYTES,
+                   TOTAL_DURATION_SEC, MAX_DURATION_SEC
+            FROM TASK_LOG_DAILY
+            WHERE (? IS NULL OR TABLE_NM = ?)
+            AND (? IS NULL OR LOG_DATE >= ?)
+            AND (? IS NULL OR LOG_DATE <= ?)
+            ORDER BY LOG_DATE, TABLE_NM
+        """
+        return self.execute_query(
+            query, (table_nm, table_nm, start_date, start_date, end_date, end_date)
+        )
+    
+    def is_incremental_vacuum(self):
+        """auto_vacuum이 INCREMENTAL인지 여부"""
+        return self.get_connection().execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    
+    def enable_incremental_vacuum(self):
+        """auto_vacuum을 INCREMENTAL로 전환 (전체 VACUUM 실행, 기존 데이터베이스용)"""
+        conn = self.get_connection()
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+        # VACUUM은 INTEGER PRIMARY KEY가 없는 테이블의 rowid를 바꿀 수 있으므로 검색 인덱스 재생성
+        self.rebuild_search_index()
+    
+    def incremental_vacuum(self, pages):
+        """빈 페이지를 최대 pages개 파일 시스템에 반환
+        
+        Returns:
+            int: 반환한 페이지 수
+        """
+        conn = self.get_connection()
+        before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        # execute()는 한 단계(1페이지)만 실행하므로 executescript로 끝까지 실행
+        conn.executescript(f"PRAGMA incremental_vacuum({int(pages)});")
+        after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return before - after
+    
+    # ============================================================
+    # 백업/복원 함수들
+    # ============================================================
+    def backup_to(self, dest_path, pages=256, pause=0.005, max_restarts=3):
+        """온라인 백업 (SQLite backup API, pages 단위로 나누어 복사)
+        
+        단계 사이에 잠금을 놓으므로 쓰기 작업을 오래 막지 않는다. 다른 연결의 쓰기로
+        백업이 max_restarts번 넘게 다시 시작되면 한 번에 복사한다 (WAL 모드라 쓰기는 계속 가능).
+        
+        Args:
+            dest_path (str): 백업 파일 경로 (있으면 덮어씀)
+            pages (int, optional): 한 단계에서 복사할 페이지 수. Defaults to 256.
+            pause (float, optional): 단계 사이 대기 시간(초). Defaults to 0.005.
+            max_restarts (int, optional): 단계별 백업 재시작 허용 횟수. Defaults to 3.
+            
+        Returns:
+            int: 복사한 전체 페이지 수
+        """
+        progress = {'remaining': None, 'restarts': 0, 'total': 0}
+        
+        def on_progress(status, remaining, total):
+            if progress['remaining'] is not None and remaining > progress['remaining']:
+                progress['restarts'] += 1
+                if progress['restarts'] > max_restarts:
+                    raise _BackupRestarted()
+            progress['remaining'] = remaining
+            progress['total'] = total
+        
+        src = sqlite3.connect(self.db_path, timeout=self.BUSY_TIMEOUT_MS / 1000)
+        try:
+            dst = sqlite3.connect(dest_path)
+            try:
+                try:
+                    src.backup(dst, pages=pages, progress=on_progress, sleep=pause)
+                except _BackupRestarted:
+                    src.backup(dst)
+                    progress['total'] = src.execute("PRAGMA page_count").fetchone()[0]
+                # 백업 파일은 단독 파일로 사용하도록 롤백 저널 모드로 전환
+                dst.execute("PRAGMA journal_mode=DELETE")
+            finally:
+                dst.close()
+        finally:
+            src.close()
+        return progress['total']
+    
+    def restore_from(self, src_path):
+        """백업 파일 내용으로 현재 데이터베이스 교체 (backup API로 전체 복사)
+        
+        파일을 직접 바꾸지 않고 현재 연결에 복사하므로 WAL 파일과 어긋나지 않는다.
+        스케줄러가 중지된 상태에서 호출해야 하며, 복원 후 스키마를 최신 버전으로 맞춘다.
+        
+        Args:
+            src_path (str): 백업 파일 경로
+        """
+        self.stop_writer()
+        src = sqlite3.connect(f"file:{src_path}?mode=ro", uri=True)
+        try:
+            src.backup(self.get_connection())
+        finally:
+            src.close()
+        self.invalidate_config_cache()
+        self._config_version = None
+        self._search_tokenizers.clear()
+        self.initialize_database()
+    
+    @staticmethod
+    def validate_backup(path):
+        """백업 파일 검사 (무결성, 스키마 버전, 필수 테이블)
+        
+        Args:
+            path (str): 백업 파일 경로
+            
+        Returns:
+            tuple: (사용 가능 여부, 오류 메시지)
+        """
+        if not os.path.isfile(path):
+            return False, f"파일이 없습니다: {path}"
+        try:
+            conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            try:
+                check = conn.execute("PRAGMA quick_check").fetchone()[0]
+                if check != 'ok':
+                    return False, f"무결성 검사 실패: {check}"
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if version > DatabaseManager.MIGRATIONS[-1][0]:
+                    return False, f"지원하지 않는 스키마 버전입니다: {version}"
+                tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+                missing = {'FILE_INFO', 'TASK_LOG', 'AUTO_CONFIG'} - tables
+                if missing:
+                    return False, f"필수 테이블이 없습니다: {', '.join(sorted(missing))}"
+            finally:
+                conn.close()
+            return True, ""
+        except sqlite3.DatabaseError as e:
+            return False, str(e)
+    
+    # ============================================================
+    # 다중 인스턴스 소유권(임대) 관련 함수들
+    # ============================================================
+    def update_instance_heartbeat(self, instance_id, now):
+        """인스턴스 하트비트 갱신"""
+        query = """
+            INSERT INTO SCHEDULER_INSTANCE (INSTANCE_ID, HEARTBEAT)
+            VALUES (?, ?)
+            ON CONFLICT(INSTANCE_ID) DO UPDATE SET HEARTBEAT = excluded.HEARTBEAT
+        """
+        return self.execute_non_select_query(query, (instance_id, now))
+    
+    def get_live_instances(self, min_heartbeat):
+        """하트비트가 유효한 인스턴스 목록 조회"""
+        query = "SELECT INSTANCE_ID FROM SCHEDULER_INSTANCE WHERE HEARTBEAT >= ? ORDER BY INSTANCE_ID"
+        return [row[0] for row in self.execute_query(query, (min_heartbeat,))]
+    
+    def delete_stale_instances(self, min_heartbeat):
+        """하트비트가 끊긴 인스턴스 삭제"""
+        query = "DELETE FROM SCHEDULER_INSTANCE WHERE HEARTBEAT < ?"
+        return self.execute_non_select_query(query, (min_heartbeat,))
+    
+    def delete_instance(self, instance_id):
+        """인스턴스 등록 해제"""
+        query = "DELETE FROM SCHEDULER_INSTANCE WHERE INSTANCE_ID = ?"
+        return self.execute_non_select_query(query, (instance_id,))
+    
+    def try_acquire_table_lease(self, table_nm, owner_id, now, lease_ttl):
+        """테이블 소유권 획득 또는 갱신
+        
+        비어 있거나, 이미 자신이 소유했거나, 만료된 임대만 가져온다.
+        
+        Args:
+            table_nm (str): 테이블명
+            owner_id (str): 인스턴스 ID
+            now (float): 현재 시각 (epoch 초)
+            lease_ttl (float): 임대 유효 시간(초)
+            
+        Returns:
+            bool: 소유권 획득 여부
+        """
+        query = """
+            INSERT INTO TABLE_LEASE (TABLE_NM, OWNER_ID, EXPIRES_AT)
+            VALUES (?, ?, ?)
+            ON CONFLICT(TABLE_NM) DO UPDATE SET
+                OWNER_ID = excluded.OWNER_ID,
+                EXPIRES_AT = excluded.EXPIRES_AT
+            WHERE TABLE_LEASE.OWNER_ID = excluded.OWNER_ID OR TABLE_LEASE.EXPIRES_AT < ?
+        """
+        return self.execute_non_select_query(query, (table_nm, owner_id, now + lease_ttl, now)) > 0
+    
+    def release_table_lease(self, table_nm, owner_id):
+        """테이블 소유권 반납"""
+        query = "DELETE FROM TABLE_LEASE WHERE TABLE_NM = ? AND OWNER_ID = ?"
+        return self.execute_non_select_query(query, (table_nm, owner_id))
+    
+    def release_all_table_leases(self, owner_id):
+        """인스턴스가 가진 모든 테이블 소유권 반납"""
+        query = "DELETE FROM TABLE_LEASE WHERE OWNER_ID = ?"
+        return self.execute_non_select_query(query, (owner_id,))
+    
+    def get_owned_tables(self, owner_id, now):
+        """유효한 임대를 가진 테이블 목록 조회"""
+        query = "SELECT TABLE_NM FROM TABLE_LEASE WHERE OWNER_ID = ? AND EXPIRES_AT >= ?"
+        return {row[0] for row in self.execute_query(query, (owner_id, now))}
+    
+    # ============================================================
+    # 데이터 조회 및 참조 함수들 (호환성 유지)
+    # ============================================================
+    def count_table_rows(self, table_name):
+        """관리 테이블 전체 행 수 조회 (월별 분할 시 TASK_LOG는 모든 월 포함)"""
+        if table_name not in self.BROWSABLE_TABLES:
+            raise ValueError(f"조회할 수 없는 테이블입니다: {table_name}")
+        if table_name == 'TASK_LOG':
+            with self.task_log_view() as source:
+                return self.execute_query(f"SELECT COUNT(*) FROM {source}")[0][0]
+        return self.execute_query(f"SELECT COUNT(*) FROM {table_name}")[0][0]
+    
+    def iter_table_rows(self, table_name, batch_size=1000):
+        """관리 테이블 전체 행을 배치 단위로 조회 (fetchmany, 메모리 사용량 일정)
+        
+        월별 분할 시 TASK_LOG는 main.TASK_LOG부터 월 순서대로 모든 월을 조회한다.
+        
+        Args:
+            table_name (str): 테이블명 (BROWSABLE_TABLES 중 하나)
+            batch_size (int, optional): 한 번에 읽는 행 수. Defaults to 1000.
+            
+        Yields:
+            list: 행 목록 (최대 batch_size개)
+        """
+        if table_name not in self.BROWSABLE_TABLES:
+            raise ValueError(f"조회할 수 없는 테이블입니다: {table_name}")
+        
+        if table_name == 'TASK_LOG' and self.task_log_partitions is not None:
+            with self.task_log_view() as source:
+                yield from self._iter_query_rows(f"SELECT * FROM {source}", batch_size)
         else:
-            return []
+            yield from self._iter_query_rows(f"SELECT * FROM {table_name} ORDER BY rowid", batch_size)
+    
+    def _iter_query_rows(self, query, batch_size):
+        """쿼리 결과를 배치 단위로 조회 (iter_table_rows 내부 함수)"""
+        cursor = self.get_connection().cursor()
+        try:
+            cursor.execute(query)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            cursor.close()
+    
+    def get_table_page(self, table_name, cursor=None, page_size=100, sort_column=None,
+                       descending=False, filters=None):
+        """관리 테이블 한 페이지 조회 (keyset 페이지네이션)
+        
+        OFFSET 대신 마지막 행의 (정렬 컬럼 값, 행 위치) 다음부터 조회하므로
+        뒤쪽 페이지도 앞쪽 페이지와 같은 비용으로 읽는다. 행 위치는 rowid이며,
+        월별 분할 시 TASK_LOG는 count_table_rows/iter_table_rows와 같이 모든 월을
+        task_log_view로 조회하고 (PART_NO, ROW_NO)를 행 위치로 쓴다.
+        
+        Args:
+            table_name (str): 테이블명 (BROWSABLE_TABLES 중 하나)
+            cursor (tuple, optional): 이전 페이지가 반환한 다음 페이지 커서. Defaults to None.
+            page_size (int, optional): 페이지 행 수. Defaults to 100.
+            sort_column (str, optional): 정렬 컬럼 (None이면 rowid 순). Defaults to None.
+            descending (bool, optional): 내림차순 여부. Defaults to False.
+            filters (dict, optional): {컬럼명: 값} 조건. 값에 '%'가 있으면 LIKE, None이면 IS NULL.
+            
+        Returns:
+            tuple: (행 목록, 다음 페이지 커서 (마지막 페이지면 None))
+        """
+        if table_name not in self.BROWSABLE_TABLES:
+            raise ValueError(f"조회할 수 없는 테이블입니다: {table_name}")
+        
+        # 컬럼명은 실제 테이블 컬럼만 허용 (쿼리에 직접 들어감)
+        columns = [col[0] for col in self.get_table_columns(table_name)]
+        for column in [sort_column, *(filters or {})]:
+            if column is not None and column not in columns:
+                raise ValueError(f"{table_name} 테이블에 없는 컬럼입니다: {column}")
+        
+        conditions = []
+        params = []
+        for column, value in (filters or {}).items():
+            if value is None:
+                conditions.append(f"{column} IS NULL")
+            elif isinstance(value, str) and '%' in value:
+                conditions.append(f"{column} LIKE ?")
+                params.append(value)
+            else:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        
+        # 행 위치 (분할된 TASK_LOG는 월마다 rowid가 겹치므로 (PART_NO, ROW_NO))
+        partitioned = table_name == 'TASK_LOG' and self.task_log_partitions is not None
+        key_columns = ['PART_NO', 'ROW_NO'] if partitioned else ['rowid']
+        key = f"({', '.join(key_columns)})" if partitioned else 'rowid'
+        key_marks = f"({', '.join('?' * len(key_columns))})" if partitioned else '?'
+        
+        op = '<' if descending else '>'
+        direction = 'DESC' if descending else 'ASC'
+        key_order = ', '.join(f"{column} {direction}" for column in key_columns)
+        if sort_column is None:
+            if cursor is not None:
+                conditions.append(f"{key} {op} {key_marks}")
+                params.extend(cursor[1])
+            order_by = key_order
+        else:
+            # NULL은 오름차순에서 가장 앞, 내림차순에서 가장 뒤
+            if cursor is not None:
+                value, last_key = cursor
+                if value is None:
+                    if descending:
+                        conditions.append(f"({sort_column} IS NULL AND {key} < {key_marks})")
+                        params.extend(last_key)
+                    else:
+                        conditions.append(
+                            f"(({sort_column} IS NULL AND {key} > {key_marks}) OR {sort_column} IS NOT NULL)"
+                        )
+                        params.extend(last_key)
+                else:
+                    condition = f"({sort_column} {op} ? OR ({sort_column} = ? AND {key} {op} {key_marks})"
+                    condition += f" OR {sort_column} IS NULL)" if descending else ")"
+                    conditions.append(condition)
+                    params.extend([value, value, *last_key])
+            order_by = f"{sort_column} {direction}, {key_order}"
+        
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params.append(page_size)
+        # 컬럼은 명시적으로 나열 (월별 파일의 컬럼 순서/누락과 관계없이 같은 순서)
+        select_list = ', '.join(key_columns + columns)
+        with (self.task_log_view(row_keys=True) if partitioned else nullcontext(table_name)) as source:
+            query = f"SELECT {select_list} FROM {source} {where} ORDER BY {order_by} LIMIT ?"
+            result = self.execute_query(query, tuple(params))
+        
+        key_count = len(key_columns)
+        rows = [row[key_count:] for row in result]
+        next_cursor = None
+        if len(result) == page_size:
+            last = result[-1]
+            sort_value = last[key_count + columns.index(sort_column)] if sort_column else None
+            next_cursor = (sort_value, tuple(last[:key_count]))
+        return rows, next_cursor
     
     def get_table_columns(self, table_name):
         """테이블 컬럼 정보 조회 (SQLite PRAGMA 사용)"""
@@ -536,7 +2010,7 @@ class DatabaseManager:
             FROM AUTO_CONFIG 
             WHERE auto_interval IS NOT NULL AND auto_interval > 0
         """
-        return self.execute_query(query)
+        return self._cached_query(('all_auto_configs',), query)
 
     def update_file_copy_status(self, file_name, copy_status='Y'):
         """파일 복사 상태 업데이트 (호환성용 - update_file_status와 동일)
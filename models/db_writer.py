@@ -0,0 +1,205 @@
+import time
+import queue
+import logging
+import threading
+from concurrent.futures import Future
+
+
+class DatabaseWriter:
+    """단일 쓰기 스레드 클래스
+
+    여러 작업 스레드의 쓰기 쿼리를 큐로 받아 하나의 연결에서 묶어서 커밋한다.
+    SQLite 쓰기 잠금 경합(database is locked)을 없애고 커밋 횟수를 줄인다.
+
+    durable 쓰기가 배치에 있으면 큐가 비는 즉시 커밋하고 (그룹 커밋),
+    로그처럼 기다리는 호출자가 없는 쓰기만 있으면 flush_interval 동안 더 모은다.
+    """
+
+    _STOP = object()
+
+    def __init__(self, db_manager, batch_size=500, flush_interval=0.5):
+        """쓰기 스레드 초기화
+
+        Args:
+            db_manager: 데이터베이스 매니저 객체 (쓰기 스레드 연결 생성용)
+            batch_size (int, optional): 한 번에 커밋할 최대 쿼리 수. Defaults to 500.
+            flush_interval (float, optional): durable 쓰기가 없을 때 모으는 최대 시간(초). Defaults to 0.5.
+        """
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self.running = False
+
+        # 통계
+        self.write_count = 0
+        self.commit_count = 0
+
+        self.logger = logging.getLogger('DatabaseWriter')
+
+    def start(self):
+        """쓰기 스레드 시작"""
+        with self._lock:
+            if self.running:
+                return
+            self.running = True
+            self._thread = threading.Thread(target=self._run, name='DatabaseWriter', daemon=True)
+            self._thread.start()
+
+    def submit(self, query, params=None, durable=False, caller=None):
+        """쓰기 쿼리 전달
+
+        Args:
+            query (str): 실행할 SQL 쿼리
+            params (tuple, optional): 쿼리 파라미터. Defaults to None.
+            durable (bool, optional): 호출자가 커밋을 기다리는지 여부 (즉시 커밋). Defaults to False.
+            caller (str, optional): 쿼리 통계에 기록할 호출 메서드명. Defaults to None.
+
+        Returns:
+            Future: 커밋 후 영향받은 행 수 (실패 시 예외)
+
+        Raises:
+            RuntimeError: 쓰기 스레드가 실행 중이 아닌 경우
+        """
+        future = Future()
+        with self._lock:
+            if not self.running:
+                raise RuntimeError("쓰기 스레드가 실행 중이 아닙니다.")
+            self._queue.put((query, params, future, durable, caller))
+        return future
+
+    def is_alive(self):
+        """쓰기 스레드가 살아 있는지 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def flush(self, timeout=None):
+        """지금까지 전달된 쓰기가 모두 커밋될 때까지 대기
+
+        Returns:
+            bool: 제시간에 완료되었는지 여부
+        """
+        try:
+            self.submit(None, durable=True).result(timeout)
+            return True
+        except RuntimeError:
+            # 이미 중지됨 (남은 쓰기는 stop에서 처리)
+            return True
+        except Exception:
+            return False
+
+    def stop(self, timeout=None):
+        """남은 쓰기를 커밋하고 쓰기 스레드 종료"""
+        with self._lock:
+            if not self.running:
+                return
+            self.running = False
+            self._queue.put(self._STOP)
+        self._thread.join(timeout)
+
+    def _run(self):
+        try:
+            self._run_loop()
+        except Exception as e:
+            # 배치 밖의 오류로 종료 → 기다리는 호출자가 멈추지 않도록 남은 쓰기를 모두 실패 처리
+            self.logger.error(f"쓰기 스레드 오류로 종료: {e}")
+            with self._lock:
+                self.running = False
+            self._fail_pending(e)
+
+    def _run_loop(self):
+        # 쓰기 스레드 전용 연결
+        conn = self.db_manager.get_connection()
+        stopping = False
+
+        while not stopping:
+            item = self._queue.get()
+            if item is self._STOP:
+                break
+
+            batch = [item]
+            durable = item[3]
+            deadline = time.monotonic() + self.flush_interval
+
+            # 큐에 쌓인 쓰기를 배치 크기까지 모음
+            while len(batch) < self.batch_size:
+                try:
+                    if durable:
+                        item = self._queue.get_nowait()
+                    else:
+                        item = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+                durable = durable or item[3]
+
+            try:
+                # 같은 연결을 반환하되 월별 TASK_LOG ATTACH 변경을 반영
+                conn = self.db_manager.get_connection()
+                self._write_batch(conn, batch)
+            except Exception as e:
+                # 연결 오류 등은 해당 배치만 실패 처리하고 계속 실행
+                self.logger.error(f"배치 처리 오류 ({len(batch)}건): {e}")
+                self._fail_batch(batch, e)
+
+    def _fail_batch(self, batch, error):
+        """배치에서 아직 완료되지 않은 Future를 모두 실패 처리"""
+        for _, _, future, _, _ in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    def _fail_pending(self, error):
+        """큐에 남은 쓰기를 모두 실패 처리 (running=False 설정 후 호출)"""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not self._STOP:
+                self._fail_batch([item], error)
+
+    def _write_batch(self, conn, batch):
+        """배치를 한 트랜잭션으로 실행 후 Future 결과 설정"""
+        results = []
+        stats = self.db_manager.query_stats
+        cursor = conn.cursor()
+        try:
+            for query, params, future, _, caller in batch:
+                if query is None:
+                    # flush 표시
+                    results.append((future, None, None))
+                    continue
+                try:
+                    started = stats.timer()
+                    cursor.execute(query, params or ())
+                    results.append((future, cursor.rowcount, None))
+                    if started is not None:
+                        elapsed_ms = (time.perf_counter() - started) * 1000
+                        stats.record(query, elapsed_ms, cursor.rowcount, caller or 'DatabaseWriter', conn, params)
+                except Exception as e:
+                    # 해당 쿼리만 실패 처리 (나머지는 계속 커밋)
+                    self.logger.error(f"쓰기 쿼리 오류: {e}")
+                    results.append((future, None, e))
+            conn.commit()
+            self.commit_count += 1
+            self.write_count += len(batch)
+        except Exception as e:
+            if conn.in_transaction:
+                conn.rollback()
+            self.logger.error(f"배치 커밋 오류 ({len(batch)}건): {e}")
+            for _, _, future, _, _ in batch:
+                future.set_exception(e)
+            return
+        finally:
+            cursor.close()
+
+        for future, result, error in results:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
@@ -0,0 +1,482 @@
+import re
+import time
+import datetime
+import itertools
+import threading
+
+from models.state_store import (
+    StateStore, STATE_TABLE_COLUMNS, completed_future, summarize_transfer_stats, summarize_daily,
+    FILE_STATE_DISCOVERED, FILE_STATE_VERIFIED, FILE_STATE_FAILED
+)
+
+
+def _like_pattern(pattern):
+    """SQL LIKE 패턴('%', '_')을 정규식으로 변환 (SQLite처럼 대소문자 무시)"""
+    regex = ''.join('.*' if ch == '%' else '.' if ch == '_' else re.escape(ch) for ch in pattern)
+    return re.compile(f"^{regex}$", re.IGNORECASE | re.DOTALL)
+
+
+class MemoryStateStore(StateStore):
+    """메모리 상태 저장소 (벤치마크, 디스크 없이 스케줄러 흐름 실행용)
+
+    관리 테이블을 {기본키: 행 dict} 형태로 보관하고 하나의 잠금으로 보호한다.
+    파일 상태 전이, 재시도 횟수, 워터마크, 임대 규칙은 DatabaseManager와 같다.
+    프로세스가 끝나면 내용이 사라진다.
+    """
+
+    def __init__(self):
+        """메모리 상태 저장소 초기화"""
+        self._tables = {table_name: {} for table_name in STATE_TABLE_COLUMNS}
+        # TASK_LOG 기본키 (기록 순서)
+        self._log_ids = itertools.count(1)
+        self._lock = threading.RLock()
+
+    def _row(self, table_name, **values):
+        """컬럼 전체를 가진 행 dict (지정하지 않은 컬럼은 None)"""
+        row = dict.fromkeys(name for name, _ in STATE_TABLE_COLUMNS[table_name])
+        row.update(values)
+        return row
+
+    # ============================================================
+    # 연결/수명
+    # ============================================================
+    def test_connection(self):
+        return True, ""
+
+    # ============================================================
+    # 테이블 정보/자동화 설정/컬럼 매핑
+    # ============================================================
+    def get_table_info_list(self):
+        with self._lock:
+            return sorted(self._tables['TABLE_INFO'])
+
+    def get_table_details(self, table_nm):
+        with self._lock:
+            row = self._tables['TABLE_INFO'].get(table_nm)
+            return (row['TABLE_NM'], row['TABLE_DC'], row['TABLE_OWNERSHIP']) if row else None
+
+    def save_table_info(self, table_nm, table_dc, table_ownership):
+        with self._lock:
+            self._tables['TABLE_INFO'][table_nm] = self._row(
+                'TABLE_INFO', TABLE_NM=table_nm, TABLE_DC=table_dc, TABLE_OWNERSHIP=table_ownership
+            )
+            return 1
+
+    def delete_table_info(self, table_nm):
+        with self._lock:
+            return 1 if self._tables['TABLE_INFO'].pop(table_nm, None) else 0
+
+    def get_auto_config_list(self):
+        with self._lock:
+            return sorted(self._tables['AUTO_CONFIG'])
+
+    def get_auto_config_details(self, table_nm):
+        with self._lock:
+            row = self._tables['AUTO_CONFIG'].get(table_nm)
+            if not row:
+                return None
+            return (row['SRC_PATH'], row['DEST_PATH'], row['AUTO_INTERVAL'], row['USE_YN'])
+
+    def save_auto_config(self, table_nm, src_path, dest_path, auto_interval, use_yn):
+        with self._lock:
+            configs = self._tables['AUTO_CONFIG']
+            row = configs.get(table_nm) or self._row('AUTO_CONFIG', TABLE_NM=table_nm)
+            row.update(SRC_PATH=src_path, DEST_PATH=dest_path, AUTO_INTERVAL=auto_interval, USE_YN=use_yn)
+            configs[table_nm] = row
+            return 1
+
+    def delete_auto_config(self, table_nm):
+        with self._lock:
+            return 1 if self._tables['AUTO_CONFIG'].pop(table_nm, None) else 0
+
+    def update_auto_config_timestamp(self, table_nm):
+        with self._lock:
+            row = self._tables['AUTO_CONFIG'].get(table_nm)
+            if not row:
+                return 0
+            row['LAST_TIMESTAMP'] = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            return 1
+
+    def get_all_auto_configs(self):
+        with self._lock:
+            return [
+                (row['TABLE_NM'], row['DEST_PATH'], row['AUTO_INTERVAL'], row['LAST_TIMESTAMP'])
+                for row in self._tables['AUTO_CONFIG'].values()
+                if row['AUTO_INTERVAL'] is not None and row['AUTO_INTERVAL'] > 0
+            ]
+
+    def get_col_mapping_tables(self):
+        with self._lock:
+            return sorted({table_nm for table_nm, _ in self._tables['COL_MAPPING']})
+
+    def get_column_mappings(self, table_nm):
+        with self._lock:
+            return [(row['DB_COL_NM'], row['XML_COL_NM'])
+                    for (name, _), row in self._tables['COL_MAPPING'].items() if name == table_nm]
+
+    def save_column_mappings(self, table_nm, mappings):
+        with self._lock:
+            self.delete_column_mappings(table_nm)
+            for db_col_nm, xml_col_nm, _ in mappings or []:  # dup_check_yn 무시
+                self._tables['COL_MAPPING'][(table_nm, db_col_nm)] = self._row(
+                    'COL_MAPPING', TABLE_NM=table_nm, DB_COL_NM=db_col_nm, XML_COL_NM=xml_col_nm
+                )
+            return True
+
+    def delete_column_mappings(self, table_nm):
+        with self._lock:
+            mappings = self._tables['COL_MAPPING']
+            keys = [key for key in mappings if key[0] == table_nm]
+            for key in keys:
+                del mappings[key]
+            return len(keys)
+
+    # ============================================================
+    # 파일 정보/전송 상태
+    # ============================================================
+    def register_files(self, table_nm, file_names):
+        now = time.time()
+        count = 0
+        with self._lock:
+            files = self._tables['FILE_INFO']
+            # 같은 파일명은 한 번만 등록 (다른 저장소와 같은 행 수 반환)
+            for file_nm in dict.fromkeys(file_names):
+                files[file_nm] = self._row(
+                    'FILE_INFO', TABLE_NM=table_nm, FILE_NM=file_nm, COPY_YN='N', DELETE_YN='N',
+                    TRANSFER_STATE=FILE_STATE_DISCOVERED, STATE_TIME=now, BYTE_OFFSET=0, RETRY_CNT=0
+                )
+                count += 1
+        return count
+
+    def find_new_files(self, file_names):
+        with self._lock:
+            files = self._tables['FILE_INFO']
+            return sorted({file_nm for file_nm in file_names if file_nm not in files})
+
+    def get_file_watermark(self, table_nm):
+        # '0' ~ '9' 다음 문자(':') 범위로 접두어 뒤가 숫자인 파일만 조회
+        # (범위에 다른 테이블 파일이 섞일 수 있어 TABLE_NM으로 다시 거른다)
+        low, high = f"{table_nm}_0", f"{table_nm}_:"
+        with self._lock:
+            return max((name for name, row in self._tables['FILE_INFO'].items()
+                        if low <= name < high and row['TABLE_NM'] == table_nm), default=None)
+
+    def get_existing_files(self, table_nm):
+        with self._lock:
+            return {row['FILE_NM'] for row in self._tables['FILE_INFO'].values() if row['TABLE_NM'] == table_nm}
+
+    def get_pending_files_count(self, table_nm):
+        with self._lock:
+            return sum(1 for row in self._tables['FILE_INFO'].values()
+                       if row['TABLE_NM'] == table_nm and row['COPY_YN'] == 'N')
+
+    def get_pending_transfers(self, table_nm):
+        with self._lock:
+            config = self._tables['AUTO_CONFIG'].get(table_nm)
+            if not config or config['USE_YN'] != 'Y':
+                return []
+            return sorted(
+                (row['FILE_NM'], row['TRANSFER_STATE'] or FILE_STATE_DISCOVERED,
+                 row['BYTE_OFFSET'] or 0, row['FILE_SIZE'], row['RETRY_CNT'] or 0)
+                for row in self._tables['FILE_INFO'].values()
+                if row['TABLE_NM'] == table_nm and row['COPY_YN'] in (None, 'N')
+            )
+
+    def get_files_to_delete(self, table_nm):
+        with self._lock:
+            config = self._tables['AUTO_CONFIG'].get(table_nm)
+            if not config:
+                return []
+            return [(row['FILE_NM'], config['DEST_PATH'])
+                    for row in self._tables['FILE_INFO'].values()
+                    if row['TABLE_NM'] == table_nm and row['COPY_YN'] == 'Y' and row['DELETE_YN'] == 'N']
+
+    def update_transfer_state(self, file_name, state, byte_offset=0, file_size=None, wait=True):
+        with self._lock:
+            row = self._tables['FILE_INFO'].get(file_name)
+            if not row:
+                return 0
+            row.update(TRANSFER_STATE=state, STATE_TIME=time.time(), BYTE_OFFSET=byte_offset,
+                       COPY_YN='Y' if state == FILE_STATE_VERIFIED else 'N')
+            if file_size is not None:
+                row['FILE_SIZE'] = file_size
+            if state == FILE_STATE_FAILED:
+                row['RETRY_CNT'] = (row['RETRY_CNT'] or 0) + 1
+            return 1
+
+    def update_files_transfer_state(self, file_names, state):
+        now = time.time()
+        count = 0
+        with self._lock:
+            files = self._tables['FILE_INFO']
+            for file_nm in set(file_names):
+                row = files.get(file_nm)
+                if row:
+                    row.update(TRANSFER_STATE=state, STATE_TIME=now, BYTE_OFFSET=0,
+                               COPY_YN='Y' if state == FILE_STATE_VERIFIED else 'N')
+                    count += 1
+        return count
+
+    def update_file_status(self, file_name, copy_status='Y'):
+        with self._lock:
+            row = self._tables['FILE_INFO'].get(file_name)
+            if row:
+                row['COPY_YN'] = copy_status
+            return completed_future(1 if row else 0)
+
+    def update_file_delete_status(self, file_name):
+        with self._lock:
+            row = self._tables['FILE_INFO'].get(file_name)
+            if row:
+                row['DELETE_YN'] = 'Y'
+            return 1 if row else 0
+
+    # ============================================================
+    # 작업 로그
+    # ============================================================
+    def log_task(self, table_nm, file_name, start_time, error_msg=None, metrics=None):
+        metrics = metrics or {}
+        end_ts = metrics.get('end_ts') or time.time()
+        start_ts = metrics.get('start_ts')
+        if start_ts is None:
+            try:
+                start_ts = datetime.datetime.strptime(start_time, '%Y-%m-%d %H:%M:%S').timestamp()
+            except (TypeError, ValueError):
+                start_ts = None
+
+        row = self._row(
+            'TASK_LOG', TABLE_NM=table_nm, FILE_NM=file_name, START_TIME=start_time,
+            END_TIME=datetime.datetime.fromtimestamp(end_ts).strftime('%Y-%m-%d %H:%M:%S'),
+            ERROR_MSG=error_msg, ROLLED_UP=0, BYTES=metrics.get('bytes'), LIST_MS=metrics.get('list_ms'),
+            DOWNLOAD_MS=metrics.get('download_ms'), UPLOAD_MS=metrics.get('upload_ms'),
+            DB_MS=metrics.get('db_ms'), RETRY_CNT=metrics.get('retry_cnt', 0),
+            STRATEGY=metrics.get('strategy'), START_TS=start_ts, END_TS=end_ts
+        )
+        with self._lock:
+            self._tables['TASK_LOG'][next(self._log_ids)] = row
+        return completed_future(1)
+
+    def get_transfer_stats(self, start_ts=None, end_ts=None, table_nm=None):
+        end_ts = time.time() if end_ts is None else end_ts
+        start_ts = end_ts - 86400 if start_ts is None else start_ts
+        with self._lock:
+            rows = [
+                (row['TABLE_NM'], row['ERROR_MSG'], row['BYTES'], row['DOWNLOAD_MS'], row['UPLOAD_MS'],
+                 row['DB_MS'], row['RETRY_CNT'], row['START_TS'], row['END_TS'])
+                for row in self._tables['TASK_LOG'].values()
+                if row['START_TS'] is not None and start_ts <= row['START_TS'] < end_ts
+                and (table_nm is None or row['TABLE_NM'] == table_nm)
+            ]
+        return summarize_transfer_stats(rows)
+
+    def search_task_log(self, text, start_ts=None, end_ts=None, table_nm=None, limit=100):
+        terms = [term.lower() for term in text.split()]
+        with self._lock:
+            matches = []
+            for row in self._tables['TASK_LOG'].values():
+                if table_nm and row['TABLE_NM'] != table_nm:
+                    continue
+                if start_ts is not None and (row['START_TS'] is None or row['START_TS'] < start_ts):
+                    continue
+                if end_ts is not None and (row['START_TS'] is None or row['START_TS'] >= end_ts):
+                    continue
+                fields = [(row['FILE_NM'] or '').lower(), (row['ERROR_MSG'] or '').lower()]
+                if all(any(term in field for field in fields) for term in terms):
+                    matches.append(row)
+        # 인덱스가 없으므로 최근 순
+        matches.sort(key=lambda row: row['START_TS'] or 0, reverse=True)
+        return [
+            {'table_nm': row['TABLE_NM'], 'file_nm': row['FILE_NM'], 'start_time': row['START_TIME'],
+             'end_time': row['END_TIME'], 'error_msg': row['ERROR_MSG']}
+            for row in matches[:limit]
+        ]
+
+    def search_files(self, text, table_nm=None, limit=100):
+        terms = [term.lower() for term in text.split()]
+        with self._lock:
+            matches = [
+                row for row in self._tables['FILE_INFO'].values()
+                if (not table_nm or row['TABLE_NM'] == table_nm)
+                and all(term in row['FILE_NM'].lower() for term in terms)
+            ]
+        matches.sort(key=lambda row: row['FILE_NM'], reverse=True)
+        return [
+            {'table_nm': row['TABLE_NM'], 'file_nm': row['FILE_NM'],
+             'copy_yn': row['COPY_YN'], 'transfer_state': row['TRANSFER_STATE']}
+            for row in matches[:limit]
+        ]
+
+    def rollup_task_log(self, batch_size=1000):
+        with self._lock:
+            rows = list(itertools.islice(
+                (row for row in self._tables['TASK_LOG'].values() if row['ROLLED_UP'] == 0), batch_size
+            ))
+            files = self._tables['FILE_INFO']
+            daily = summarize_daily(
+                (row['TABLE_NM'], row['START_TIME'], row['END_TIME'], row['ERROR_MSG'], row['BYTES'],
+                 row['START_TS'], row['END_TS'], (files.get(row['FILE_NM']) or {}).get('FILE_SIZE'))
+                for row in rows
+            )
+            for (table_nm, log_date), (task_cnt, fail_cnt, total_bytes, total_sec, max_sec) in daily.items():
+                item = self._tables['TASK_LOG_DAILY'].setdefault((table_nm, log_date), self._row(
+                    'TASK_LOG_DAILY', TABLE_NM=table_nm, LOG_DATE=log_date, TASK_CNT=0, FAIL_CNT=0,
+                    TOTAL_BYTES=0, TOTAL_DURATION_SEC=0, MAX_DURATION_SEC=0
+                ))
+                item['TASK_CNT'] += task_cnt
+                item['FAIL_CNT'] += fail_cnt
+                item['TOTAL_BYTES'] += total_bytes
+                item['TOTAL_DURATION_SEC'] += total_sec
+                item['MAX_DURATION_SEC'] = max(item['MAX_DURATION_SEC'], max_sec)
+            for row in rows:
+                row['ROLLED_UP'] = 1
+            return len(rows)
+
+    def purge_task_log(self, before_time, batch_size=1000):
+        with self._lock:
+            logs = self._tables['TASK_LOG']
+            keys = list(itertools.islice(
+                (key for key, row in logs.items()
+                 if row['ROLLED_UP'] == 1 and row['START_TIME'] is not None and row['START_TIME'] < before_time),
+                batch_size
+            ))
+            for key in keys:
+                del logs[key]
+            return len(keys)
+
+    def get_task_log_daily(self, table_nm=None, start_date=None, end_date=None):
+        with self._lock:
+            rows = [
+                tuple(row.values()) for row in self._tables['TASK_LOG_DAILY'].values()
+                if (table_nm is None or row['TABLE_NM'] == table_nm)
+                and (start_date is None or row['LOG_DATE'] >= start_date)
+                and (end_date is None or row['LOG_DATE'] <= end_date)
+            ]
+        return sorted(rows, key=lambda row: (row[1], row[0]))
+
+    # ============================================================
+    # 다중 인스턴스 하트비트/테이블 임대
+    # ============================================================
+    def update_instance_heartbeat(self, instance_id, now):
+        with self._lock:
+            self._tables['SCHEDULER_INSTANCE'][instance_id] = self._row(
+                'SCHEDULER_INSTANCE', INSTANCE_ID=instance_id, HEARTBEAT=now
+            )
+            return 1
+
+    def get_live_instances(self, min_heartbeat):
+        with self._lock:
+            return sorted(instance_id for instance_id, row in self._tables['SCHEDULER_INSTANCE'].items()
+                          if row['HEARTBEAT'] >= min_heartbeat)
+
+    def delete_stale_instances(self, min_heartbeat):
+        with self._lock:
+            instances = self._tables['SCHEDULER_INSTANCE']
+            stale = [key for key, row in instances.items() if row['HEARTBEAT'] < min_heartbeat]
+            for key in stale:
+                del instances[key]
+            return len(stale)
+
+    def delete_instance(self, instance_id):
+        with self._lock:
+            return 1 if self._tables['SCHEDULER_INSTANCE'].pop(instance_id, None) else 0
+
+    def try_acquire_table_lease(self, table_nm, owner_id, now, lease_ttl):
+        with self._lock:
+            leases = self._tables['TABLE_LEASE']
+            lease = leases.get(table_nm)
+            if lease and lease['OWNER_ID'] != owner_id and lease['EXPIRES_AT'] >= now:
+                return False
+            leases[table_nm] = self._row('TABLE_LEASE', TABLE_NM=table_nm, OWNER_ID=owner_id,
+                                         EXPIRES_AT=now + lease_ttl)
+            return True
+
+    def release_table_lease(self, table_nm, owner_id):
+        with self._lock:
+            leases = self._tables['TABLE_LEASE']
+            lease = leases.get(table_nm)
+            if lease and lease['OWNER_ID'] == owner_id:
+                del leases[table_nm]
+                return 1
+            return 0
+
+    def release_all_table_leases(self, owner_id):
+        with self._lock:
+            leases = self._tables['TABLE_LEASE']
+            owned = [key for key, row in leases.items() if row['OWNER_ID'] == owner_id]
+            for key in owned:
+                del leases[key]
+            return len(owned)
+
+    def get_owned_tables(self, owner_id, now):
+        with self._lock:
+            return {key for key, row in self._tables['TABLE_LEASE'].items()
+                    if row['OWNER_ID'] == owner_id and row['EXPIRES_AT'] >= now}
+
+    # ============================================================
+    # 관리 테이블 조회
+    # ============================================================
+    def _check_browsable(self, table_name):
+        if table_name not in self.BROWSABLE_TABLES:
+            raise ValueError(f"조회할 수 없는 테이블입니다: {table_name}")
+
+    def get_table_list(self):
+        return sorted(self.BROWSABLE_TABLES)
+
+    def get_table_columns(self, table_name):
+        return list(STATE_TABLE_COLUMNS.get(table_name, ()))
+
+    def count_table_rows(self, table_name):
+        self._check_browsable(table_name)
+        with self._lock:
+            return len(self._tables[table_name])
+
+    def iter_table_rows(self, table_name, batch_size=1000):
+        self._check_browsable(table_name)
+        # 잠금을 오래 잡지 않도록 행 목록을 복사한 뒤 나눠서 반환
+        with self._lock:
+            rows = [tuple(row.values()) for row in self._tables[table_name].values()]
+        for index in range(0, len(rows), batch_size):
+            yield rows[index:index + batch_size]
+
+    def get_table_page(self, table_name, cursor=None, page_size=100, sort_column=None,
+                       descending=False, filters=None):
+        """관리 테이블 한 페이지 조회 (커서: (정렬 컬럼 값, 기본키))
+
+        정렬 순서는 DatabaseManager와 같다 (NULL은 오름차순에서 가장 앞, 정렬 값이 같으면 기본키 순).
+        """
+        self._check_browsable(table_name)
+        columns = [col[0] for col in self.get_table_columns(table_name)]
+        for column in [sort_column, *(filters or {})]:
+            if column is not None and column not in columns:
+                raise ValueError(f"{table_name} 테이블에 없는 컬럼입니다: {column}")
+
+        conditions = []
+        for column, value in (filters or {}).items():
+            if isinstance(value, str) and '%' in value:
+                regex = _like_pattern(value)
+                conditions.append(lambda row, c=column, r=regex: row[c] is not None and r.match(str(row[c])))
+            else:
+                conditions.append(lambda row, c=column, v=value: row[c] == v)
+
+        def sort_key(item):
+            key, row = item
+            value = row[sort_column] if sort_column else None
+            return (value is not None, value, key)
+
+        with self._lock:
+            items = [(key, row) for key, row in self._tables[table_name].items()
+                     if all(condition(row) for condition in conditions)]
+            items.sort(key=sort_key, reverse=descending)
+            if cursor is not None:
+                value, last_key = cursor
+                position = (value is not None, value, last_key)
+                items = [item for item in items
+                         if (sort_key(item) < position if descending else sort_key(item) > position)]
+            page = items[:page_size]
+            rows = [tuple(row.values()) for _, row in page]
+
+        next_cursor = None
+        if len(page) == page_size:
+            last_key, last_row = page[-1]
+            next_cursor = (last_row[sort_column] if sort_column else None, last_key)
+        return rows, next_cursor
@@ -0,0 +1,235 @@
+import os
+import re
+import sys
+import time
+import json
+import logging
+import datetime
+import threading
+import collections
+from functools import lru_cache
+
+
+# 쿼리 형태 정규화 (리터럴/IN 목록/공백을 통일해 같은 형태로 집계)
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def normalize_query(query):
+    """SQL 문을 쿼리 형태로 정규화
+
+    Args:
+        query (str): SQL 문
+
+    Returns:
+        str: 리터럴을 ?로, IN 목록을 (...)로 바꾸고 공백을 정리한 문자열
+    """
+    shape = _STRING_LITERAL.sub('?', query)
+    shape = _NUMBER_LITERAL.sub('?', shape)
+    shape = _IN_LIST.sub('(...)', shape)
+    return _WHITESPACE.sub(' ', shape).strip()
+
+
+class QueryStats:
+    """쿼리 실행 계측 클래스
+
+    DatabaseManager의 쿼리마다 실행 시간, 행 수, 호출한 메서드를 쿼리 형태별로 누적하고,
+    slow_query_ms보다 느린 쿼리는 EXPLAIN QUERY PLAN 결과와 함께 SlowQuery 로거에 기록한다.
+    실행 계획은 쿼리 형태별로 한 번만 조회하므로 운영 중에 켜 두어도 부담이 적다.
+    """
+
+    # 호출 메서드를 찾을 때 건너뛸 DatabaseManager 내부 실행 함수
+    _INTERNAL_CALLERS = frozenset((
+        'execute_query', 'execute_non_select_query', 'execute_many',
+        '_cached_query', 'submit_write', '_record_query',
+    ))
+
+    def __init__(self, slow_query_ms=200, max_slow_entries=100):
+        """쿼리 계측 초기화
+
+        Args:
+            slow_query_ms (float, optional): 느린 쿼리 기준 시간(ms). Defaults to 200.
+            max_slow_entries (int, optional): 보관할 최근 느린 쿼리 수. Defaults to 100.
+        """
+        self.enabled = True
+        self.slow_query_ms = slow_query_ms
+
+        # 쿼리 형태별 누적 통계 ({형태: dict})
+        self._stats = {}
+        # 쿼리 형태별 실행 계획 (처음 느려졌을 때 조회)
+        self._plans = {}
+        # 최근 느린 쿼리
+        self._slow_entries = collections.deque(maxlen=max_slow_entries)
+        self._lock = threading.Lock()
+        self.started_at = datetime.datetime.now()
+
+        self.logger = logging.getLogger('SlowQuery')
+
+    def find_caller(self):
+        """쿼리를 실행한 DatabaseManager 메서드명 (내부 실행 함수 제외)"""
+        frame = sys._getframe(2)
+        while frame is not None and frame.f_code.co_name in self._INTERNAL_CALLERS:
+            frame = frame.f_back
+        return frame.f_code.co_name if frame is not None else '?'
+
+    def record(self, query, elapsed_ms, rows, caller, conn=None, params=None):
+        """쿼리 실행 결과 누적
+
+        Args:
+            query (str): 실행한 SQL 문
+            elapsed_ms (float): 실행 시간(ms)
+            rows (int): 조회/영향받은 행 수 (알 수 없으면 -1)
+            caller (str): 호출한 메서드명
+            conn (sqlite3.Connection, optional): 실행 계획 조회용 연결. Defaults to None.
+            params (tuple, optional): 실행 계획 조회용 파라미터. Defaults to None.
+        """
+        shape = normalize_query(query)
+        with self._lock:
+            stat = self._stats.get(shape)
+            if stat is None:
+                stat = self._stats[shape] = {
+                    'count': 0,
+                    'total_ms': 0.0,
+                    'max_ms': 0.0,
+                    'rows': 0,
+                    'slow_count': 0,
+                    'callers': collections.Counter(),
+                }
+            stat['count'] += 1
+            stat['total_ms'] += elapsed_ms
+            if elapsed_ms > stat['max_ms']:
+                stat['max_ms'] = elapsed_ms
+            if rows > 0:
+                stat['rows'] += rows
+            stat['callers'][caller] += 1
+
+            is_slow = elapsed_ms >= self.slow_query_ms
+            if is_slow:
+                stat['slow_count'] += 1
+
+        if is_slow:
+            self._record_slow(shape, query, elapsed_ms, rows, caller, conn, params)
+
+    def _record_slow(self, shape, query, elapsed_ms, rows, caller, conn, params):
+        """느린 쿼리 기록 (실행 계획은 형태별로 한 번 조회)"""
+        plan = self._plans.get(shape)
+        if plan is None and conn is not None:
+            plan = self._explain(conn, query, params)
+            self._plans[shape] = plan
+
+        entry = {
+            'time': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'elapsed_ms': round(elapsed_ms, 1),
+            'rows': rows,
+            'caller': caller,
+            'query': shape,
+            'plan': plan or [],
+        }
+        with self._lock:
+            self._slow_entries.append(entry)
+
+        plan_text = '\n'.join(f"    {line}" for line in entry['plan'])
+        self.logger.warning(
+            f"느린 쿼리 {entry['elapsed_ms']}ms ({caller}, {rows}행): {shape}"
+            + (f"\n{plan_text}" if plan_text else "")
+        )
+
+    def _explain(self, conn, query, params):
+        """EXPLAIN QUERY PLAN 결과 조회 (실패 시 빈 목록)"""
+        try:
+            cursor = conn.execute(f"EXPLAIN QUERY PLAN {query}", params or ())
+            try:
+                return [row[-1] for row in cursor.fetchall()]
+            finally:
+                cursor.close()
+        except Exception:
+            # PRAGMA 등 실행 계획이 없는 문장
+            return []
+
+    def get_report(self, sort_by='total_ms', limit=None):
+        """쿼리 형태별 집계 보고서
+
+        Args:
+            sort_by (str, optional): 정렬 기준 (total_ms, max_ms, avg_ms, count, rows). Defaults to 'total_ms'.
+            limit (int, optional): 최대 항목 수. Defaults to None.
+
+        Returns:
+            list: 쿼리 형태별 통계 dict 목록 (정렬 기준 내림차순)
+        """
+        with self._lock:
+            report = []
+            for shape, stat in self._stats.items():
+                report.append({
+                    'query': shape,
+                    'count': stat['count'],
+                    'total_ms': round(stat['total_ms'], 1),
+                    'avg_ms': round(stat['total_ms'] / stat['count'], 3),
+                    'max_ms': round(stat['max_ms'], 1),
+                    'rows': stat['rows'],
+                    'slow_count': stat['slow_count'],
+                    'callers': dict(stat['callers'].most_common()),
+                    'plan': self._plans.get(shape),
+                })
+
+        report.sort(key=lambda item: item[sort_by], reverse=True)
+        return report[:limit] if limit else report
+
+    def get_slow_queries(self):
+        """최근 느린 쿼리 목록 (오래된 순)"""
+        with self._lock:
+            return list(self._slow_entries)
+
+    def format_report(self, sort_by='total_ms', limit=30):
+        """집계 보고서를 텍스트로 변환
+
+        Returns:
+            str: 쿼리 형태별 한 줄 요약 (실행 계획이 있으면 다음 줄에 표시)
+        """
+        lines = [
+            f"쿼리 통계 ({self.started_at.strftime('%Y-%m-%d %H:%M:%S')} 이후, 느린 쿼리 기준 {self.slow_query_ms}ms)",
+            f"{'횟수':>8} {'합계(ms)':>12} {'평균(ms)':>10} {'최대(ms)':>10} {'행 수':>10} {'느림':>6}  쿼리",
+        ]
+        for item in self.get_report(sort_by, limit):
+            callers = ', '.join(item['callers'])
+            lines.append(
+                f"{item['count']:>8} {item['total_ms']:>12.1f} {item['avg_ms']:>10.3f} "
+                f"{item['max_ms']:>10.1f} {item['rows']:>10} {item['slow_count']:>6}  "
+                f"{item['query']}  [{callers}]"
+            )
+            for plan_line in item['plan'] or []:
+                lines.append(f"{'':>62}  > {plan_line}")
+        return '\n'.join(lines)
+
+    def dump_report(self, file_path, sort_by='total_ms'):
+        """집계 보고서와 최근 느린 쿼리를 JSON 파일로 저장 (임시 파일 후 교체)
+
+        Args:
+            file_path (str): 저장할 파일 경로
+            sort_by (str, optional): 정렬 기준. Defaults to 'total_ms'.
+        """
+        data = {
+            'started_at': self.started_at.strftime('%Y-%m-%d %H:%M:%S'),
+            'dumped_at': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'slow_query_ms': self.slow_query_ms,
+            'queries': self.get_report(sort_by),
+            'slow_queries': self.get_slow_queries(),
+        }
+        tmp_file = file_path + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, file_path)
+
+    def reset(self):
+        """누적 통계 초기화"""
+        with self._lock:
+            self._stats.clear()
+            self._plans.clear()
+            self._slow_entries.clear()
+            self.started_at = datetime.datetime.now()
+
+    def timer(self):
+        """시작 시각 (계측이 꺼져 있으면 None)"""
+        return time.perf_counter() if self.enabled else None
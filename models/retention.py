@@ -0,0 +1,130 @@
+import time
+import datetime
+import logging
+
+
+class RetentionManager:
+    """TASK_LOG 보존 관리 클래스
+
+    원본 작업 로그를 테이블별 일간 집계(TASK_LOG_DAILY)에 누적한 뒤,
+    보존 기간이 지난 원본 행을 작은 배치로 삭제하고 (월별 분할 시 지난 월은 닫은 뒤 파일 단위로 만료),
+    복사 작업이 없는 유휴 시간에 PRAGMA incremental_vacuum으로 빈 페이지를 반환한다.
+    """
+
+    def __init__(self, db_manager, retention_days=90, batch_size=1000,
+                 batch_pause=0.05, vacuum_pages=1000):
+        """보존 관리자 초기화
+
+        Args:
+            db_manager: 상태 저장소 객체 (StateStore 구현)
+            retention_days (int, optional): 원본 로그 보존 일수. Defaults to 90.
+            batch_size (int, optional): 한 트랜잭션에서 집계/삭제하는 행 수. Defaults to 1000.
+            batch_pause (float, optional): 배치 사이 대기 시간(초, 다른 쓰기에 잠금 양보). Defaults to 0.05.
+            vacuum_pages (int, optional): incremental_vacuum 한 번에 반환하는 페이지 수. Defaults to 1000.
+        """
+        self.db_manager = db_manager
+        self.retention_days = retention_days
+        self.batch_size = batch_size
+        self.batch_pause = batch_pause
+        self.vacuum_pages = vacuum_pages
+
+        # 기존 데이터베이스(auto_vacuum 미설정)를 유휴 시간에 INCREMENTAL로 전환할지 여부 (전체 VACUUM 1회)
+        self.convert_auto_vacuum = False
+
+        self.logger = logging.getLogger('RetentionManager')
+
+    def rollup(self):
+        """집계되지 않은 원본 로그를 일간 집계에 누적
+
+        Returns:
+            int: 집계한 행 수
+        """
+        total = 0
+        while True:
+            count = self.db_manager.rollup_task_log(self.batch_size)
+            total += count
+            if count < self.batch_size:
+                return total
+            time.sleep(self.batch_pause)
+
+    def purge(self):
+        """보존 기간이 지난 (집계 완료된) 원본 로그 삭제
+
+        Returns:
+            int: 삭제한 행 수
+        """
+        cutoff = (datetime.datetime.now() - datetime.timedelta(days=self.retention_days))
+        cutoff_time = cutoff.strftime('%Y-%m-%d %H:%M:%S')
+
+        total = 0
+        while True:
+            count = self.db_manager.purge_task_log(cutoff_time, self.batch_size)
+            total += count
+            if count < self.batch_size:
+                return total
+            time.sleep(self.batch_pause)
+
+    def vacuum(self, is_idle=None):
+        """유휴 상태인 동안 빈 페이지 반환
+
+        Args:
+            is_idle (function, optional): 유휴 여부를 반환하는 함수. None이면 항상 유휴.
+
+        Returns:
+            int: 반환한 페이지 수
+        """
+        is_idle = is_idle or (lambda: True)
+        if not is_idle():
+            return 0
+
+        if not self.db_manager.is_incremental_vacuum():
+            if not self.convert_auto_vacuum:
+                return 0
+            self.logger.info("auto_vacuum을 INCREMENTAL로 전환합니다. (전체 VACUUM)")
+            self.db_manager.enable_incremental_vacuum()
+            return 0
+
+        total = 0
+        while is_idle():
+            freed = self.db_manager.incremental_vacuum(self.vacuum_pages)
+            total += freed
+            if freed < self.vacuum_pages:
+                break
+            time.sleep(self.batch_pause)
+        return total
+
+    def close_months(self):
+        """월별 분할 시 집계가 끝난 지난 월 닫기
+
+        Returns:
+            int: 닫은 월 수
+        """
+        partitions = self.db_manager.task_log_partitions
+        return partitions.close_finished_months() if partitions else 0
+
+    def expire_months(self):
+        """월별 분할 시 보존 기간이 지난 월 파일 삭제 (또는 압축 보관)
+
+        Returns:
+            int: 만료한 월 수
+        """
+        partitions = self.db_manager.task_log_partitions
+        if not partitions:
+            return 0
+        return partitions.expire_months(datetime.datetime.now() - datetime.timedelta(days=self.retention_days))
+
+    def run(self, is_idle=None):
+        """집계 → (지난 월 닫기) → 삭제 → 유휴 시 공간 반환 순서로 실행
+
+        Args:
+            is_idle (function, optional): 유휴 여부를 반환하는 함수. None이면 항상 유휴.
+
+        Returns:
+            dict: 단계별 처리 건수 (rolled_up, closed_months, purged, expired_months, vacuumed_pages)
+        """
+        result = {'rolled_up': self.rollup()}
+        result['closed_months'] = self.close_months()
+        result['purged'] = self.purge()
+        result['expired_months'] = self.expire_months()
+        result['vacuumed_pages'] = self.vacuum(is_idle)
+        return result
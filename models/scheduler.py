@@ -4,8 +4,18 @@ import datetime
 import logging
 import tempfile
 import shutil
+import time
+import re
+import hashlib
+from contextlib import contextmanager
 from apscheduler.schedulers.background import BackgroundScheduler
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from models.cancel_token import CancelToken, TransferCancelled
+from models.retention import RetentionManager
+from models.state_store import (
+    FILE_STATE_DISCOVERED, FILE_STATE_STAGED, FILE_STATE_UPLOADING,
+    FILE_STATE_UPLOADED, FILE_STATE_VERIFIED, FILE_STATE_FAILED
+)
 
 
 class SchedulerManager:
@@ -15,7 +25,7 @@ class SchedulerManager:
         """스케줄러 매니저 초기화
         
         Args:
-            db_manager: 데이터베이스 매니저 객체
+            db_manager: 상태 저장소 객체 (StateStore 구현)
             linux_ssh_client: Linux SSH 클라이언트 객체 (행안부 서버)
             was_ssh_client: WAS SSH 클라이언트 객체 (WAS 서버)
             data_processor: 데이터 프로세서 객체 (호환성용)
@@ -29,6 +39,48 @@ class SchedulerManager:
         self.scheduler = None
         self.scheduler_running = False
         
+        # 전송 취소 토큰 (스케줄러 시작 시마다 새로 생성)
+        self.cancel_token = CancelToken()
+        
+        # 중지 시 완료 직전 전송을 기다려 주는 시간(초)
+        self.drain_timeout = 10
+        
+        # 전송 중인 파일을 보관하는 임시 디렉토리 (재시작 시 이어서 전송)
+        self.staging_dir = os.path.join(tempfile.gettempdir(), 'kwater_staging')
+        
+        # 전송 위치 기록 주기 (바이트)
+        self.checkpoint_bytes = 4 * 1024 * 1024
+        
+        # 동시에 처리하는 최대 테이블 수 (SSH 세션 수 제한)
+        self.max_parallel_tables = 5
+        # 모든 테이블 작업이 공유하는 동시 실행 슬롯 (스케줄러 시작 시마다 새로 생성)
+        self.table_slots = threading.BoundedSemaphore(self.max_parallel_tables)
+        
+        # 주기 작업 실행 시각 흔들기 비율 (인터벌 대비) 및 최대값(초)
+        self.job_jitter_ratio = 0.1
+        self.max_job_jitter = 60
+        
+        # 시작 시 즉시 실행 작업 사이 간격(초)
+        self.startup_ramp_interval = 2
+        
+        # VERIFIED 상태를 모아서 기록하는 파일 수
+        self.verify_batch_size = 50
+        
+        # 타임스탬프 파일명 테이블도 전체 중복 확인을 하는 주기(초, 늦게 도착한 파일 보정)
+        self.full_dedup_interval = 86400
+        self._last_full_dedup = {}
+        
+        # 다중 인스턴스 테이블 분배 (None이면 모든 테이블 처리)
+        self.shard_coordinator = None
+        
+        # 작업 로그 보존 (None이면 사용 안 함) 및 실행 주기(분)
+        self.retention_manager = RetentionManager(db_manager) if db_manager else None
+        self.retention_interval = 60
+        
+        # 상태 데이터베이스 스냅샷 (None이면 사용 안 함) 및 실행 주기(분)
+        self.snapshot_manager = None
+        self.snapshot_interval = 360
+        
         # 처리 중인 테이블 추적 집합
         self.tables_in_process = set()
         
@@ -50,6 +102,14 @@ class SchedulerManager:
         self.status_update_callback = status_callback
         self.log_callback = log_callback
     
+    def set_shard_coordinator(self, shard_coordinator):
+        """다중 인스턴스 테이블 분배 코디네이터 설정
+        
+        Args:
+            shard_coordinator: ShardCoordinator 객체 (None이면 분배 비활성화)
+        """
+        self.shard_coordinator = shard_coordinator
+    
     def log(self, message, level='info'):
         """로그 메시지 기록"""
         if level == 'warning':
@@ -76,8 +136,41 @@ class SchedulerManager:
         try:
             # 스케줄러 상태 설정
             self.scheduler_running = True
+            self.cancel_token = CancelToken()
+            self.table_slots = threading.BoundedSemaphore(self.max_parallel_tables)
             self.scheduler = BackgroundScheduler()
             
+            # 테이블 소유권 확보 후 주기적 재분배 작업 설정
+            if self.shard_coordinator:
+                self._rebalance_shards()
+                self.scheduler.add_job(
+                    self._rebalance_shards,
+                    'interval',
+                    seconds=max(1, self.shard_coordinator.lease_ttl / 3),
+                    id="shard_rebalance",
+                    replace_existing=True
+                )
+            
+            # 작업 로그 집계/정리 작업 설정
+            if self.retention_manager:
+                self.scheduler.add_job(
+                    self._run_retention,
+                    'interval',
+                    minutes=self.retention_interval,
+                    id="task_log_retention",
+                    replace_existing=True
+                )
+            
+            # 상태 데이터베이스 스냅샷 작업 설정
+            if self.snapshot_manager:
+                self.scheduler.add_job(
+                    self._run_snapshot,
+                    'interval',
+                    minutes=self.snapshot_interval,
+                    id="db_snapshot",
+                    replace_existing=True
+                )
+            
             # 자동화 설정 조회 및 작업 설정
             self._configure_scheduler_jobs()
             
@@ -96,23 +189,34 @@ class SchedulerManager:
             self.stop_scheduler()
             return False
     
-    def stop_scheduler(self):
-        """스케줄러 중지"""
+    def stop_scheduler(self, drain_timeout=None, wait=False):
+        """스케줄러 중지
+        
+        새 파일 전송은 즉시 멈추고, 진행 중인 전송은 청크 단위로 취소한다.
+        drain_timeout 안에 끝날 것으로 예상되는 전송만 마무리하고 나머지는 중단하며,
+        중단된 파일은 COPY_YN='N'으로 남겨 다음 실행 시 다시 복사한다.
+        
+        Args:
+            drain_timeout (float, optional): 완료 직전 전송을 기다려 줄 시간(초).
+                None이면 self.drain_timeout 사용. Defaults to None.
+            wait (bool, optional): 진행 중인 작업이 정리될 때까지 대기 여부. Defaults to False.
+        """
         if self.scheduler and self.scheduler_running:
-            self.log("스케줄러 중지 요청: 진행 중인 작업을 취소합니다.")
+            if drain_timeout is None:
+                drain_timeout = self.drain_timeout
+            
+            self.log(f"스케줄러 중지 요청: 진행 중인 작업을 취소합니다. (drain {drain_timeout}초)")
             
             # 현재 처리 중인 테이블 목록 저장
             processing_tables = self.tables_in_process.copy()
             
-            # 스케줄러 상태 변경
+            # 스케줄러 상태 변경 및 전송 취소 요청
             self.scheduler_running = False
+            self.cancel_token.cancel(drain_timeout)
             
-            # 진행 중인 작업들 실패로 표시
-            if self.progress_update_callback and processing_tables:
-                for table_nm in processing_tables:
-                    file_name = self.current_processing_files.get(table_nm)
-                    self.log(f"[{table_nm}] 작업 강제 중단됨: 파일={file_name}")
-                    self.progress_update_callback(table_nm, file_name, "실패", None, None)
+            for table_nm in processing_tables:
+                file_name = self.current_processing_files.get(table_nm)
+                self.log(f"[{table_nm}] 작업 중단 요청: 파일={file_name}")
             
             # 스케줄러 종료
             if self.scheduler and self.scheduler.running:
@@ -120,6 +224,16 @@ class SchedulerManager:
                 
             self.scheduler = None
             
+            if wait:
+                self.wait_for_drain(drain_timeout + 5)
+            
+            # 테이블 소유권 반납 (다른 인스턴스가 즉시 인수)
+            if self.shard_coordinator:
+                try:
+                    self.shard_coordinator.shutdown()
+                except Exception as e:
+                    self.log(f"테이블 소유권 반납 오류: {e}", 'error')
+            
             self.log("스케줄러가 중지되었습니다.")
             
             # 상태 콜백 호출
@@ -130,45 +244,190 @@ class SchedulerManager:
         
         return False
     
+    def wait_for_drain(self, timeout):
+        """진행 중인 테이블 작업이 모두 정리될 때까지 대기
+        
+        Args:
+            timeout (float): 최대 대기 시간(초)
+            
+        Returns:
+            bool: 제한 시간 안에 모두 정리되었는지 여부
+        """
+        deadline = time.monotonic() + timeout
+        while self.tables_in_process and time.monotonic() < deadline:
+            time.sleep(0.1)
+        
+        # 작업 로그 등 쓰기 스레드에 남은 쓰기 커밋
+        self.db_manager.flush_writes(max(0, deadline - time.monotonic()))
+        return not self.tables_in_process
+    
     def is_running(self):
         """스케줄러 실행 상태 반환"""
         return self.scheduler_running
+
+    def _owns_table(self, table_nm):
+        """현재 인스턴스가 테이블을 담당하는지 여부"""
+        if not self.shard_coordinator:
+            return True
+        return self.shard_coordinator.owns(table_nm)
+    
+    def _rebalance_shards(self):
+        """테이블 소유권 재분배 (하트비트 및 임대 갱신)"""
+        try:
+            table_names = [row[0] for row in self.db_manager.get_all_auto_configs()]
+            self.shard_coordinator.rebalance(table_names)
+        except Exception as e:
+            self.log(f"테이블 소유권 재분배 오류: {e}", 'error')
+    
+    def _run_retention(self):
+        """작업 로그 집계/삭제 및 유휴 시 공간 반환"""
+        try:
+            result = self.retention_manager.run(
+                is_idle=lambda: self.scheduler_running and not self.tables_in_process
+            )
+            if any(result.values()):
+                self.log(
+                    f"작업 로그 정리: 집계 {result['rolled_up']}건, 삭제 {result['purged']}건, "
+                    f"월 닫기 {result['closed_months']}개, 월 만료 {result['expired_months']}개, "
+                    f"반환 {result['vacuumed_pages']}페이지"
+                )
+        except Exception as e:
+            self.log(f"작업 로그 정리 오류: {e}", 'error')
+    
+    def _run_snapshot(self):
+        """상태 데이터베이스 스냅샷 생성 및 오래된 스냅샷 정리"""
+        try:
+            result = self.snapshot_manager.run()
+            self.log(f"데이터베이스 스냅샷 생성: {result['path']} (삭제 {result['removed']}개)")
+        except Exception as e:
+            self.log(f"데이터베이스 스냅샷 오류: {e}", 'error')
+    
+    def get_status(self):
+        """스케줄러 상태 요약 반환 (헤드리스 모드 상태 파일용)
+
+        Returns:
+            dict: 실행 여부, 처리 중인 테이블/파일, 예약된 작업 목록
+        """
+        jobs = []
+        if self.scheduler:
+            for job in self.scheduler.get_jobs():
+                next_run = getattr(job, 'next_run_time', None)
+                jobs.append({
+                    'id': job.id,
+                    'next_run_time': next_run.strftime('%Y-%m-%d %H:%M:%S') if next_run else None
+                })
+
+        status = {
+            'running': self.scheduler_running,
+            'tables_in_process': sorted(self.tables_in_process),
+            'current_files': dict(self.current_processing_files),
+            'jobs': jobs
+        }
+        
+        if self.shard_coordinator:
+            status['instance_id'] = self.shard_coordinator.instance_id
+            status['live_instances'] = list(self.shard_coordinator.live_instances)
+            status['owned_tables'] = sorted(self.shard_coordinator.owned_tables)
+        
+        return status
+    
+    def _table_phase_seconds(self, table_nm, period_seconds):
+        """테이블별 고정 위상(초) 계산
+        
+        테이블명 해시로 인터벌 안의 시작 위치를 정해, 같은 인터벌의 테이블들이
+        같은 순간에 몰리지 않고 인터벌 전체에 고르게 퍼지도록 한다.
+        재시작해도 같은 값이 나온다.
+        """
+        digest = hashlib.md5(table_nm.encode('utf-8')).hexdigest()
+        return int(digest[:8], 16) % max(1, int(period_seconds))
     
     def _configure_scheduler_jobs(self):
-        """자동화 설정 기반으로 스케줄러 작업 구성"""
+        """자동화 설정 기반으로 스케줄러 작업 구성
+        
+        테이블마다 개별 인터벌 작업을 등록하고, 시작 시각을 테이블별 위상만큼 어긋나게
+        두어 (epoch 기준 정렬) 원격 서버 접속이 한 순간에 몰리지 않도록 한다.
+        """
         try:
             # 자동화 설정 조회
             config_data = self.db_manager.get_all_auto_configs()
             
-            copy_intervals = {}  # {인터벌: [테이블명, ...]}
-            
-            # 설정 분류
+            # 주기적 COPY 작업 예약 (테이블별)
             for row in config_data:
                 table_nm, dest_path, auto_interval, _ = row
                 
-                # COPY 작업 인터벌 설정
-                if auto_interval and auto_interval > 0:
-                    if auto_interval not in copy_intervals:
-                        copy_intervals[auto_interval] = []
-                    copy_intervals[auto_interval].append(table_nm)
-            
-            # 주기적 COPY 작업 예약
-            for auto_interval, table_list in copy_intervals.items():
-                if self.scheduler_running:
-                    self.scheduler.add_job(
-                        self.process_tables_parallel, 
-                        'interval', 
-                        minutes=auto_interval,
-                        args=[table_list],
-                        id=f"copy_interval_{auto_interval}",
-                        replace_existing=True
-                    )
-                    self.log(f"{auto_interval}분 간격 COPY 작업 설정: {', '.join(table_list)}")
+                if not auto_interval or auto_interval <= 0 or not self.scheduler_running:
+                    continue
+                
+                period = auto_interval * 60
+                phase = self._table_phase_seconds(table_nm, period)
+                jitter = min(self.max_job_jitter, int(period * self.job_jitter_ratio))
+                
+                # start_date를 epoch + 위상으로 두면 실행 시각이 항상 같은 위상에 정렬됨
+                self.scheduler.add_job(
+                    self.process_tables_parallel, 
+                    'interval', 
+                    minutes=auto_interval,
+                    start_date=datetime.datetime.fromtimestamp(phase),
+                    jitter=jitter or None,
+                    args=[[table_nm]],
+                    id=f"copy_{table_nm}",
+                    replace_existing=True
+                )
+                self.log(f"[{table_nm}] {auto_interval}분 간격 COPY 작업 설정 (위상 {phase}초, 지터 {jitter}초)")
             
         except Exception as e:
             self.log(f"스케줄러 구성 오류: {e}", 'error')
             raise
     
+    def _start_ramped(self, tasks):
+        """동시 실행 수를 제한하며 테이블 작업을 간격을 두고 순차 시작
+        
+        Args:
+            tasks (list): [(실행 함수, 테이블명), ...]
+        """
+        slots = self.table_slots
+        
+        def run(target, table_nm):
+            try:
+                target(table_nm)
+            finally:
+                slots.release()
+        
+        for index, (target, table_nm) in enumerate(tasks):
+            if index and self.startup_ramp_interval > 0:
+                time.sleep(self.startup_ramp_interval)
+            
+            # 빈 슬롯이 생길 때까지 대기 (중지 요청 시 중단)
+            if not self._acquire_table_slot(slots):
+                return
+            
+            threading.Thread(target=run, args=(target, table_nm), daemon=True).start()
+    
+    def _acquire_table_slot(self, slots):
+        """공유 동시 실행 슬롯 획득 (빈 슬롯이 생길 때까지 대기)
+        
+        Returns:
+            bool: 획득 여부 (스케줄러가 중지되면 False)
+        """
+        while not slots.acquire(timeout=1):
+            if not self.scheduler_running:
+                return False
+        
+        if not self.scheduler_running:
+            slots.release()
+            return False
+        return True
+    
+    def _copy_table_in_slot(self, table_nm):
+        """공유 슬롯을 잡은 상태에서 테이블 복사 (주기 작업끼리도 max_parallel_tables 제한)"""
+        slots = self.table_slots
+        if not self._acquire_table_slot(slots):
+            return
+        try:
+            self.copy_table_files(table_nm)
+        finally:
+            slots.release()
+    
     def _process_immediate_tasks(self):
         """즉시 실행 작업 처리"""
         try:
@@ -184,7 +443,7 @@ class SchedulerManager:
             for row in config_data:
                 table_nm, dest_path, auto_interval, last_timestamp = row
                 
-                if auto_interval and auto_interval > 0:
+                if auto_interval and auto_interval > 0 and self._owns_table(table_nm):
                     # 대기 중인 파일 확인
                     pending_files_count = self.db_manager.get_pending_files_count(table_nm)
                     
@@ -206,23 +465,16 @@ class SchedulerManager:
                     elif interval_passed:
                         copy_then_process_tables.append(table_nm)
             
-            # 즉시 COPY 작업 실행
             if immediate_copy_tables:
                 self.log(f"즉시 COPY 작업 실행: {', '.join(immediate_copy_tables)}")
-                threading.Thread(
-                    target=self.process_copy_only, 
-                    args=(immediate_copy_tables,), 
-                    daemon=True
-                ).start()
-            
-            # 파일 발견 후 COPY 작업 실행
             if copy_then_process_tables:
                 self.log(f"파일 발견 후 COPY 작업 실행: {', '.join(copy_then_process_tables)}")
-                threading.Thread(
-                    target=self.process_discover_then_copy, 
-                    args=(copy_then_process_tables,), 
-                    daemon=True
-                ).start()
+            
+            # 즉시 실행 작업을 동시 실행 수 제한 + 시작 간격을 두고 순차 시작
+            tasks = [(self.copy_table_files, table_nm) for table_nm in immediate_copy_tables]
+            tasks += [(self._discover_and_copy_independently, table_nm) for table_nm in copy_then_process_tables]
+            if tasks:
+                threading.Thread(target=self._start_ramped, args=(tasks,), daemon=True).start()
                 
         except Exception as e:
             self.log(f"즉시 실행 작업 처리 오류: {e}", 'error')
@@ -238,6 +490,8 @@ class SchedulerManager:
             return
         if table_nm in self.tables_in_process:
             return
+        if not self._owns_table(table_nm):
+            return
         self.tables_in_process.add(table_nm)
         
         try:
@@ -256,28 +510,40 @@ class SchedulerManager:
                 return
                 
             copied_any = False
-            tmp_dir = tempfile.mkdtemp(prefix=f'{table_nm}_')
+            stage_dir = os.path.join(self.staging_dir, table_nm)
             ssh_lx, sftp_lx = self.linux_ssh_client.open_sftp()
             ssh_was, sftp_was = self.was_ssh_client.open_sftp()
             
             try:
                 self.was_ssh_client.ensure_remote_dir(sftp_was, dest_path)
+                
+                list_started = time.perf_counter()
                 remote_files = self.linux_ssh_client.list_files_by_pattern(src_path, table_nm)
-                existing = self.db_manager.get_existing_files(table_nm)
+                list_ms = int((time.perf_counter() - list_started) * 1000)
                 
-                for f in remote_files:
-                    if f not in existing:
-                        self.db_manager.register_file(table_nm, f)
+                # 새 파일 계산/등록은 DB 시간 (이번 실행의 첫 파일 db_ms에 포함)
+                discovery_started = time.perf_counter()
+                new_files = self._find_new_files(table_nm, remote_files)
+                if new_files:
+                    self.db_manager.register_files(table_nm, new_files)
+                discovery_db_ms = int((time.perf_counter() - discovery_started) * 1000)
 
-                pending = self.db_manager.get_pending_files(table_nm)
-                total = len(pending)
-                index = 0
+                # 마지막으로 기록된 전송 상태부터 이어서 처리
+                pending = self.db_manager.get_pending_transfers(table_nm)
+                
+                # 검증까지 끝나 VERIFIED 기록을 기다리는 파일과 성공 로그 (일괄 기록)
+                verified_files = []
 
-                for file_name, _ in pending:
-                    if not self.scheduler_running:
+                for file_name, state, byte_offset, file_size, retry_cnt in pending:
+                    # drain 중에도 새 파일은 시작하지 않음
+                    if not self.scheduler_running or self.cancel_token.is_cancelled():
+                        break
+                    
+                    # 소유권을 잃은 테이블은 다음 파일부터 담당 인스턴스에 넘김
+                    if not self._owns_table(table_nm):
+                        self.log(f"[{table_nm}] 테이블 소유권 이전: 복사 중단", 'warning')
                         break
 
-                    index += 1
                     self.current_processing_files[table_nm] = file_name
                     
                     if self.progress_update_callback:
@@ -287,25 +553,44 @@ class SchedulerManager:
                     error_msg = None
                     start_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                     
+                    # 작업 로그에 기록할 전송 성능 정보 (목록 조회 시간은 테이블 실행 단위)
+                    metrics = {
+                        'start_ts': time.time(), 'bytes': file_size, 'list_ms': list_ms,
+                        'download_ms': 0, 'upload_ms': 0, 'db_ms': discovery_db_ms,
+                        'retry_cnt': retry_cnt, 'strategy': None
+                    }
+                    discovery_db_ms = 0
+                    
                     try:
-                        # 잘 되던 방식 그대로
-                        dl = self.linux_ssh_client.download_with_sftp(sftp_lx, src_path, tmp_dir, file_name)
-                        if not dl:
-                            raise Exception('download failed')
-
-                        up = self.was_ssh_client.upload_with_sftp(sftp_was, tmp_dir, dest_path, file_name)
-                        if not up:
-                            raise Exception('upload failed')
-
-                        self.db_manager.update_file_status(file_name, 'Y')
-                        self.db_manager.log_task(table_nm, file_name, start_time, None)  # 성공시 error_msg=None
+                        if state != FILE_STATE_DISCOVERED or byte_offset:
+                            self.log(f"[{table_nm}] 전송 재개: {file_name} ({state}, {byte_offset} bytes)")
+                        
+                        self._transfer_file(
+                            table_nm, file_name, state, byte_offset, file_size,
+                            src_path, dest_path, stage_dir, sftp_lx, sftp_was, metrics
+                        )
+                        # 성공 로그는 _mark_verified()에서 VERIFIED 커밋 후 기록
+                        metrics['end_ts'] = time.time()
                         copied_any = True
                         
+                        verified_files.append((file_name, start_time, metrics))
+                        if len(verified_files) >= self.verify_batch_size:
+                            self._mark_verified(table_nm, stage_dir, verified_files)
+                            verified_files = []
+                        
+                    except TransferCancelled as e:
+                        # 중단 위치는 _transfer_file에서 기록됨 → 다음 실행 시 이어서 전송
+                        status = '중단'
+                        error_msg = f"스케줄러 중지로 인한 전송 중단 ({e.transferred}/{e.total} bytes)"
+                        self.db_manager.log_task(table_nm, file_name, start_time, error_msg, metrics)
+                        self.log(f"[{table_nm}] 파일 전송 중단: {file_name}", 'warning')
+                        
                     except Exception as e:
                         status = '실패'
                         error_msg = str(e)
-                        self.db_manager.update_file_status(file_name, 'N')
-                        self.db_manager.log_task(table_nm, file_name, start_time, error_msg)
+                        self.db_manager.update_transfer_state(file_name, FILE_STATE_FAILED)
+                        self._remove_staged_file(stage_dir, file_name)
+                        self.db_manager.log_task(table_nm, file_name, start_time, error_msg, metrics)
                         self.log(f"[{table_nm}] 파일 복사 오류: {e}", 'error')
                         
                     finally:
@@ -315,11 +600,12 @@ class SchedulerManager:
                         # 현재 처리 중인 파일 정보 제거
                         if table_nm in self.current_processing_files:
                             del self.current_processing_files[table_nm]
+                
+                self._mark_verified(table_nm, stage_dir, verified_files)
                             
             finally:
                 self.linux_ssh_client.close_sftp(ssh_lx, sftp_lx)
                 self.was_ssh_client.close_sftp(ssh_was, sftp_was)
-                shutil.rmtree(tmp_dir, ignore_errors=True)
                 
             if self.scheduler_running and copied_any:
                 self.db_manager.update_auto_config_timestamp(table_nm)
@@ -330,6 +616,212 @@ class SchedulerManager:
             if table_nm in self.tables_in_process:
                 self.tables_in_process.remove(table_nm)
     
+    def _find_new_files(self, table_nm, remote_files):
+        """원격 파일 목록에서 등록되지 않은 파일 계산
+        
+        파일명이 모두 '테이블명_고정 길이 숫자' 형식이면 (정렬 가능한 타임스탬프)
+        등록된 가장 큰 타임스탬프(워터마크) 이상인 파일만 DB와 비교한다.
+        워터마크보다 늦게 도착한 이전 파일은 full_dedup_interval마다 전체 비교로 찾는다.
+        
+        Args:
+            table_nm (str): 테이블명
+            remote_files (iterable): 원격 파일명 목록
+            
+        Returns:
+            list: 새 파일명 목록 (정렬)
+        """
+        candidates = list(remote_files)
+        now = time.monotonic()
+        last_full = self._last_full_dedup.get(table_nm)
+        
+        keys = self._timestamp_keys(table_nm, candidates)
+        if keys and last_full is not None and now - last_full < self.full_dedup_interval:
+            watermark = self.db_manager.get_file_watermark(table_nm)
+            watermark_key = self._timestamp_keys(table_nm, [watermark]) if watermark else None
+            key_length = len(next(iter(keys.values())))
+            if watermark_key and len(watermark_key[watermark]) == key_length:
+                candidates = [f for f in candidates if keys[f] >= watermark_key[watermark]]
+        else:
+            self._last_full_dedup[table_nm] = now
+        
+        if not candidates:
+            return []
+        return self.db_manager.find_new_files(candidates)
+    
+    def _timestamp_keys(self, table_nm, file_names):
+        """파일명별 타임스탬프 키 추출
+        
+        Returns:
+            dict: {파일명: 숫자 키}. 형식이 다르거나 숫자 길이가 다른 파일이 있으면 None
+        """
+        pattern = re.compile(rf"{re.escape(table_nm)}_(\d{{8,}})(?!\d)")
+        keys = {}
+        for file_name in file_names:
+            match = pattern.match(file_name)
+            if not match:
+                return None
+            keys[file_name] = match.group(1)
+        if len({len(key) for key in keys.values()}) > 1:
+            return None
+        return keys
+    
+    def _transfer_file(self, table_nm, file_name, state, byte_offset, file_size,
+                       src_path, dest_path, stage_dir, sftp_lx, sftp_was, metrics=None):
+        """파일 하나를 마지막 전송 상태부터 이어서 복사
+        
+        DISCOVERED → STAGED → UPLOADING → UPLOADED → VERIFIED 순서로 상태를 기록하며,
+        각 단계의 전송 위치는 checkpoint_bytes마다 BYTE_OFFSET에 기록한다.
+        다운로드는 같은 간격으로 임시 파일을 fsync한 뒤 콜백을 호출하므로 기록된 위치는 항상 디스크에 있다.
+        검증이 끝난 파일은 UPLOADED 상태로 반환하며, VERIFIED 기록은 호출자가
+        _mark_verified()로 모아서 한다 (기록 전 중단되면 재시작 시 다시 검증).
+        
+        metrics가 주어지면 단계별 소요 시간(download_ms, upload_ms, db_ms), 파일 크기(bytes),
+        전송 방식(strategy: full/resume/retry/verify)을 기록한다.
+        
+        Raises:
+            TransferCancelled: 스케줄러 중지로 전송이 중단된 경우 (중단 위치 기록 후)
+            Exception: 전송 또는 검증 실패 시
+        """
+        local_file = os.path.join(stage_dir, file_name)
+        staged_ok = (file_size is not None and os.path.exists(local_file)
+                     and os.path.getsize(local_file) == file_size)
+        
+        if metrics is None:
+            metrics = {'download_ms': 0, 'upload_ms': 0, 'db_ms': 0}
+        
+        # 업로드 완료 후 기록 전에 중단된 경우: 원격 파일 크기만 검증
+        if state == FILE_STATE_UPLOADED:
+            remote_size = self.was_ssh_client.get_remote_file_size(sftp_was, dest_path, file_name)
+            if file_size is not None and remote_size == file_size:
+                metrics['strategy'] = 'verify'
+                return
+            state, byte_offset = (FILE_STATE_STAGED, 0) if staged_ok else (FILE_STATE_DISCOVERED, 0)
+        
+        # 업로드 단계인데 임시 파일이 없으면 다운로드부터 다시
+        if state in (FILE_STATE_STAGED, FILE_STATE_UPLOADING) and not staged_ok:
+            state, byte_offset = FILE_STATE_DISCOVERED, 0
+        
+        # 실패한 파일은 처음부터 다시
+        if state == FILE_STATE_FAILED:
+            metrics['strategy'] = 'retry'
+            state, byte_offset = FILE_STATE_DISCOVERED, 0
+        elif state == FILE_STATE_DISCOVERED and not byte_offset:
+            metrics['strategy'] = 'full'
+        else:
+            metrics['strategy'] = 'resume'
+        
+        # Step 1: Linux 서버에서 임시 디렉토리로 다운로드
+        if state == FILE_STATE_DISCOVERED:
+            file_size = self._run_transfer_phase(
+                table_nm, file_name, FILE_STATE_DISCOVERED, byte_offset, 0,
+                lambda offset, callback: self.linux_ssh_client.download_resumable(
+                    sftp_lx, src_path, stage_dir, file_name, offset, self.cancel_token, callback,
+                    checkpoint_bytes=self.checkpoint_bytes
+                ),
+                metrics, 'download_ms'
+            )
+            metrics['bytes'] = file_size
+            with self._measure(metrics, 'db_ms'):
+                self.db_manager.update_transfer_state(file_name, FILE_STATE_STAGED, 0, file_size)
+            state, byte_offset = FILE_STATE_STAGED, 0
+        
+        # Step 2: 임시 디렉토리에서 WAS 서버로 업로드
+        self._run_transfer_phase(
+            table_nm, file_name, FILE_STATE_UPLOADING,
+            byte_offset if state == FILE_STATE_UPLOADING else 0, 50,
+            lambda offset, callback: self.was_ssh_client.upload_resumable(
+                sftp_was, stage_dir, dest_path, file_name, offset, self.cancel_token, callback
+            ),
+            metrics, 'upload_ms'
+        )
+        with self._measure(metrics, 'db_ms'):
+            self.db_manager.update_transfer_state(file_name, FILE_STATE_UPLOADED)
+        
+        # Step 3: 원격 파일 크기 검증
+        remote_size = self.was_ssh_client.get_remote_file_size(sftp_was, dest_path, file_name)
+        if remote_size != file_size:
+            raise IOError(f"업로드 크기 불일치: {remote_size}/{file_size} bytes")
+    
+    def _run_transfer_phase(self, table_nm, file_name, state, offset, base_progress, transfer,
+                            metrics, phase_key):
+        """전송 단계 실행 및 전송 위치 주기적 기록
+        
+        Args:
+            table_nm (str): 테이블명
+            file_name (str): 파일명
+            state (str): 단계 상태 (DISCOVERED: 다운로드, UPLOADING: 업로드)
+            offset (int): 시작 위치
+            base_progress (int): 단계 시작 진행률 (다운로드 0, 업로드 50)
+            transfer (function): (offset, progress_callback)을 받아 전체 크기를 반환하는 전송 함수
+            metrics (dict): 전송 성능 정보 (DB 기록 시간은 db_ms, 나머지는 phase_key에 누적)
+            phase_key (str): 단계 소요 시간 키 ('download_ms' 또는 'upload_ms')
+            
+        Returns:
+            int: 전체 파일 크기
+        """
+        with self._measure(metrics, 'db_ms'):
+            self.db_manager.update_transfer_state(file_name, state, offset)
+        last_checkpoint = [offset]
+        
+        def on_progress(transferred, total):
+            if transferred - last_checkpoint[0] < self.checkpoint_bytes:
+                return
+            last_checkpoint[0] = transferred
+            with self._measure(metrics, 'db_ms'):
+                # 주기적 위치 기록은 커밋을 기다리지 않음 (다른 쓰기와 모아서 커밋)
+                self.db_manager.update_transfer_state(file_name, state, transferred, wait=False)
+            if self.progress_update_callback and total:
+                progress = base_progress + int(50 * transferred / total)
+                self.progress_update_callback(table_nm, file_name, '진행 중', progress, 100)
+        
+        db_ms_before = metrics['db_ms']
+        started = time.perf_counter()
+        try:
+            return transfer(offset, on_progress)
+        except TransferCancelled as e:
+            with self._measure(metrics, 'db_ms'):
+                self.db_manager.update_transfer_state(file_name, state, e.transferred)
+            raise
+        finally:
+            # 체크포인트 기록 시간은 db_ms에만 포함
+            elapsed_ms = int((time.perf_counter() - started) * 1000)
+            metrics[phase_key] += max(0, elapsed_ms - (metrics['db_ms'] - db_ms_before))
+    
+    @contextmanager
+    def _measure(self, metrics, key):
+        """블록 실행 시간을 metrics[key]에 누적 (밀리초)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            metrics[key] += int((time.perf_counter() - started) * 1000)
+    
+    def _mark_verified(self, table_nm, stage_dir, verified_files):
+        """검증 완료 일괄 기록 후 성공 로그 기록 및 임시 파일 삭제
+        
+        Args:
+            table_nm (str): 테이블명
+            stage_dir (str): 임시 디렉토리
+            verified_files (list): [(파일명, 시작 시간, 전송 성능 정보), ...]
+        """
+        if not verified_files:
+            return
+        file_names = [file_name for file_name, _, _ in verified_files]
+        # VERIFIED가 커밋된 뒤에만 성공 로그를 남김 (그 전에 중단되면 재검증 후 한 번만 기록)
+        self.db_manager.update_files_transfer_state(file_names, FILE_STATE_VERIFIED)
+        for file_name, start_time, metrics in verified_files:
+            self.db_manager.log_task(table_nm, file_name, start_time, None, metrics)  # 성공시 error_msg=None
+            self._remove_staged_file(stage_dir, file_name)
+    
+    def _remove_staged_file(self, stage_dir, file_name):
+        """임시 디렉토리의 파일 삭제"""
+        local_file = os.path.join(stage_dir, file_name)
+        if os.path.exists(local_file):
+            try:
+                os.remove(local_file)
+            except OSError:
+                pass
+    
     def _process_single_file_with_sessions(self, table_nm, file_name, src_path, dest_path, tmp_dir, 
                                          sftp_lx, sftp_was, current_index, total_files):
         """단일 파일 처리 (전용 SFTP 세션 사용)"""
@@ -451,11 +943,8 @@ class SchedulerManager:
                 self.log(f"[{table_nm}] 원격 디렉토리에 XML 파일이 없습니다.")
                 return
             
-            # 이미 등록된 파일 목록 조회
-            existing_files_in_db = self.db_manager.get_existing_files(table_nm)
-            
-            # 새로 발견된 파일 계산
-            new_files = xml_files_in_remote - existing_files_in_db
+            # 새로 발견된 파일 계산 (DB에서 비교)
+            new_files = self._find_new_files(table_nm, xml_files_in_remote)
             
             if not new_files:
                 self.log(f"[{table_nm}] 새로 발견된 XML 파일이 없습니다.")
@@ -463,15 +952,13 @@ class SchedulerManager:
             
             self.log(f"[{table_nm}] 새로 발견된 파일 수: {len(new_files)}")
             
-            # 파일별 DB 등록
-            for file_name in sorted(new_files):  # 정렬하여 순서대로 처리
-                if not self.scheduler_running:
-                    self.log(f"[{table_nm}] 스케줄러 중지됨: 파일 발견 중단", 'warning')
-                    break
-                
-                # 파일 정보 DB 등록
-                self.db_manager.register_file(table_nm, file_name)
-                self.log(f"[{table_nm}] FILE_INFO 테이블 업데이트 완료: {file_name}")
+            if not self.scheduler_running:
+                self.log(f"[{table_nm}] 스케줄러 중지됨: 파일 발견 중단", 'warning')
+                return
+            
+            # 파일 정보 DB 일괄 등록 (정렬된 순서대로 처리)
+            self.db_manager.register_files(table_nm, new_files)
+            self.log(f"[{table_nm}] FILE_INFO 테이블 업데이트 완료: {len(new_files)}개 파일")
             
         except Exception as e:
             self.log(f"[{table_nm}] 파일 발견 중 오류 발생: {e}", 'error')
@@ -486,6 +973,7 @@ class SchedulerManager:
             tables_to_process = [
                 table_nm for table_nm in table_names 
                 if table_nm not in self.tables_in_process and self.scheduler_running
+                and self._owns_table(table_nm)
             ]
             
             if not tables_to_process:
@@ -495,9 +983,9 @@ class SchedulerManager:
             self.log(f"실제 처리할 테이블: {tables_to_process}")
             
             # 스레드풀을 사용한 병렬 처리 (잘 되던 방식)
-            with ThreadPoolExecutor(max_workers=min(5, len(tables_to_process))) as executor:
+            with ThreadPoolExecutor(max_workers=min(self.max_parallel_tables, len(tables_to_process))) as executor:
                 future_to_table = {
-                    executor.submit(self.copy_table_files, table_nm): table_nm 
+                    executor.submit(self._copy_table_in_slot, table_nm): table_nm 
                     for table_nm in tables_to_process
                 }
                 
@@ -531,17 +1019,10 @@ class SchedulerManager:
         try:
             self.log(f"[파일 발견 후 복사] 작업 시작: {table_names}")
             
-            # 테이블별 병렬 처리
-            for table_nm in table_names:
-                if not self.scheduler_running:
-                    break
-                
-                # 각 테이블을 개별적으로 처리
-                threading.Thread(
-                    target=self._discover_and_copy_independently,
-                    args=(table_nm,),
-                    daemon=True
-                ).start()
+            # 테이블별 병렬 처리 (동시 실행 수 제한 + 시작 간격)
+            self._start_ramped([
+                (self._discover_and_copy_independently, table_nm) for table_nm in table_names
+            ])
                 
         except Exception as e:
             self.log(f"[파일 발견 후 복사] 오류 발생: {e}", 'error')
@@ -553,7 +1034,7 @@ class SchedulerManager:
             
             # 테이블 설정 조회
             config = self.db_manager.get_auto_config_details(table_nm)
-            if not config or not self.scheduler_running:
+            if not config or not self.scheduler_running or not self._owns_table(table_nm):
                 return
             
             # config 튜플의 길이에 따라 안전하게 처리
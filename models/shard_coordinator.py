@@ -0,0 +1,119 @@
+import os
+import time
+import socket
+import bisect
+import hashlib
+import logging
+
+
+class ShardCoordinator:
+    """다중 스케줄러 인스턴스 간 테이블 분배 클래스
+
+    공유 상태 저장소(DatabaseManager)에 하트비트와 테이블 임대(lease)를 기록한다.
+    살아 있는 인스턴스들로 일관 해시 링을 만들어 테이블별 담당 인스턴스를 정하고,
+    담당 인스턴스만 임대를 획득하여 해당 테이블을 발견/복사한다.
+    인스턴스가 추가되거나 하트비트가 끊기면 다음 rebalance()에서 소유권이 재분배된다.
+    """
+
+    def __init__(self, db_manager, instance_id=None, lease_ttl=30, virtual_nodes=64):
+        """분배 코디네이터 초기화
+
+        Args:
+            db_manager: 공유 상태 저장소 객체 (StateStore 구현)
+            instance_id (str, optional): 인스턴스 ID. 기본값은 '호스트명-PID'.
+            lease_ttl (float, optional): 하트비트/임대 유효 시간(초). Defaults to 30.
+            virtual_nodes (int, optional): 인스턴스당 해시 링 가상 노드 수. Defaults to 64.
+        """
+        self.db_manager = db_manager
+        self.instance_id = instance_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_ttl = lease_ttl
+        self.virtual_nodes = virtual_nodes
+
+        # 마지막 rebalance 결과
+        self.live_instances = []
+        self.owned_tables = set()
+
+        self.logger = logging.getLogger('ShardCoordinator')
+
+    @staticmethod
+    def _hash(key):
+        """문자열을 링 위치(정수)로 변환"""
+        return int(hashlib.md5(key.encode('utf-8')).hexdigest()[:16], 16)
+
+    def _build_ring(self, instances):
+        """인스턴스 목록으로 일관 해시 링 생성
+
+        Returns:
+            tuple: (정렬된 링 위치 목록, 위치별 인스턴스 ID 목록)
+        """
+        ring = sorted(
+            (self._hash(f"{instance_id}#{i}"), instance_id)
+            for instance_id in instances
+            for i in range(self.virtual_nodes)
+        )
+        return [point for point, _ in ring], [instance_id for _, instance_id in ring]
+
+    def assign_owner(self, table_nm, instances):
+        """테이블의 담당 인스턴스 계산
+
+        Args:
+            table_nm (str): 테이블명
+            instances (list): 살아 있는 인스턴스 ID 목록
+
+        Returns:
+            str: 담당 인스턴스 ID (인스턴스가 없으면 None)
+        """
+        if not instances:
+            return None
+        points, owners = self._build_ring(instances)
+        index = bisect.bisect(points, self._hash(table_nm)) % len(points)
+        return owners[index]
+
+    def heartbeat(self):
+        """하트비트 갱신 및 끊긴 인스턴스 정리
+
+        Returns:
+            list: 살아 있는 인스턴스 ID 목록
+        """
+        now = time.time()
+        self.db_manager.update_instance_heartbeat(self.instance_id, now)
+        self.db_manager.delete_stale_instances(now - self.lease_ttl)
+        self.live_instances = self.db_manager.get_live_instances(now - self.lease_ttl)
+        return self.live_instances
+
+    def rebalance(self, table_names):
+        """하트비트 후 담당 테이블 임대 획득/갱신, 담당이 아닌 테이블 반납
+
+        Args:
+            table_names (list): 분배 대상 테이블명 목록
+
+        Returns:
+            set: 현재 소유한 테이블 집합
+        """
+        instances = self.heartbeat()
+        now = time.time()
+
+        for table_nm in table_names:
+            owner = self.assign_owner(table_nm, instances)
+            if owner == self.instance_id:
+                self.db_manager.try_acquire_table_lease(table_nm, self.instance_id, now, self.lease_ttl)
+            else:
+                self.db_manager.release_table_lease(table_nm, self.instance_id)
+
+        owned = self.db_manager.get_owned_tables(self.instance_id, now)
+        if owned != self.owned_tables:
+            self.logger.info(
+                f"[{self.instance_id}] 담당 테이블 변경: {sorted(owned)} (인스턴스 {len(instances)}개)"
+            )
+        self.owned_tables = owned
+        return owned
+
+    def owns(self, table_nm):
+        """테이블 소유 여부 (마지막 rebalance 기준)"""
+        return table_nm in self.owned_tables
+
+    def shutdown(self):
+        """모든 임대 반납 및 인스턴스 등록 해제"""
+        self.db_manager.release_all_table_leases(self.instance_id)
+        self.db_manager.delete_instance(self.instance_id)
+        self.owned_tables = set()
@@ -0,0 +1,131 @@
+import os
+import re
+import datetime
+import logging
+
+
+class SnapshotManager:
+    """상태 데이터베이스 스냅샷 관리 클래스
+
+    스케줄러가 쓰는 중에도 SQLite backup API로 작은 단계씩 복사해 일관된 스냅샷을 만들고,
+    임시 파일을 검사한 뒤 이름을 바꿔 저장한다. 보관 개수를 넘는 오래된 스냅샷은 삭제한다.
+    """
+
+    SNAPSHOT_PATTERN = re.compile(r'^(?P<base>.+)_(?P<stamp>\d{8}_\d{6})\.db$')
+
+    def __init__(self, db_manager, snapshot_dir, keep=14, pages=256, pause=0.005):
+        """스냅샷 관리자 초기화
+
+        Args:
+            db_manager: 데이터베이스 매니저 객체
+            snapshot_dir (str): 스냅샷 저장 디렉토리
+            keep (int, optional): 보관할 스냅샷 수. Defaults to 14.
+            pages (int, optional): 백업 한 단계에서 복사할 페이지 수. Defaults to 256.
+            pause (float, optional): 백업 단계 사이 대기 시간(초). Defaults to 0.005.
+        """
+        self.db_manager = db_manager
+        self.snapshot_dir = snapshot_dir
+        self.keep = keep
+        self.pages = pages
+        self.pause = pause
+
+        # 스냅샷 파일명 접두어 (데이터베이스 파일명)
+        self.base_name = os.path.splitext(os.path.basename(db_manager.db_path))[0]
+
+        self.logger = logging.getLogger('SnapshotManager')
+
+    def take_snapshot(self, suffix=None):
+        """스냅샷 생성
+
+        Args:
+            suffix (str, optional): 파일명 접미어 (예: 'pre_restore', 보관 개수 계산에서 제외). Defaults to None.
+
+        Returns:
+            str: 스냅샷 파일 경로
+
+        Raises:
+            ValueError: 생성한 스냅샷이 검사를 통과하지 못한 경우
+        """
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+
+        stamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+        name = f"{self.base_name}_{stamp}.db" if not suffix else f"{self.base_name}_{stamp}_{suffix}.db"
+        path = os.path.join(self.snapshot_dir, name)
+        part_path = path + '.part'
+
+        try:
+            pages = self.db_manager.backup_to(part_path, self.pages, self.pause)
+            ok, message = self.db_manager.validate_backup(part_path)
+            if not ok:
+                raise ValueError(f"스냅샷 검사 실패: {message}")
+            os.replace(part_path, path)
+        finally:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+
+        self.logger.info(f"스냅샷 생성: {path} ({pages}페이지)")
+        return path
+
+    def list_snapshots(self):
+        """정기 스냅샷 목록 (최신 순, 접미어가 있는 스냅샷 제외)
+
+        Returns:
+            list: 스냅샷 파일 경로 목록
+        """
+        if not os.path.isdir(self.snapshot_dir):
+            return []
+
+        snapshots = []
+        for name in os.listdir(self.snapshot_dir):
+            match = self.SNAPSHOT_PATTERN.match(name)
+            if match and match.group('base') == self.base_name:
+                snapshots.append((match.group('stamp'), os.path.join(self.snapshot_dir, name)))
+        return [path for _, path in sorted(snapshots, reverse=True)]
+
+    def rotate(self):
+        """보관 개수를 넘는 오래된 스냅샷 삭제
+
+        Returns:
+            int: 삭제한 스냅샷 수
+        """
+        removed = 0
+        for path in self.list_snapshots()[self.keep:]:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError as e:
+                self.logger.warning(f"스냅샷 삭제 실패: {path} ({e})")
+        return removed
+
+    def run(self):
+        """스냅샷 생성 후 오래된 스냅샷 정리
+
+        Returns:
+            dict: 생성한 스냅샷 경로와 삭제한 스냅샷 수 (path, removed)
+        """
+        path = self.take_snapshot()
+        return {'path': path, 'removed': self.rotate()}
+
+    def restore(self, snapshot_path):
+        """스냅샷 검사 후 현재 데이터베이스를 스냅샷 내용으로 교체
+
+        교체 전 현재 데이터베이스를 '_pre_restore' 스냅샷으로 남긴다.
+        스케줄러가 중지된 상태에서 호출해야 한다.
+
+        Args:
+            snapshot_path (str): 복원할 스냅샷 경로
+
+        Returns:
+            str: 교체 전 데이터베이스 스냅샷 경로
+
+        Raises:
+            ValueError: 스냅샷이 검사를 통과하지 못한 경우
+        """
+        ok, message = self.db_manager.validate_backup(snapshot_path)
+        if not ok:
+            raise ValueError(f"스냅샷을 복원할 수 없습니다: {message}")
+
+        before_path = self.take_snapshot(suffix='pre_restore')
+        self.db_manager.restore_from(snapshot_path)
+        self.logger.info(f"스냅샷 복원: {snapshot_path} (이전 상태: {before_path})")
+        return before_path
@@ -0,0 +1,707 @@
+import time
+import uuid
+import logging
+import datetime
+import threading
+from contextlib import contextmanager
+
+from models.state_store import (
+    StateStore, STATE_TABLE_COLUMNS, STATE_TABLE_KEYS, completed_future,
+    summarize_transfer_stats, summarize_daily,
+    FILE_STATE_DISCOVERED, FILE_STATE_VERIFIED, FILE_STATE_FAILED
+)
+
+
+class _RollupConflict(Exception):
+    """다른 인스턴스가 같은 작업 로그를 먼저 집계함 (rollup_task_log 내부용)"""
+
+
+class SqlStateStore(StateStore):
+    """공유 SQL 서버 상태 저장소 (DB-API 2.0 연결)
+
+    여러 인스턴스가 같은 서버(PostgreSQL, MySQL 등)를 상태 저장소로 쓸 때 사용한다.
+    서버 종류에 따라 달라지는 UPSERT, json_each, FTS5, rowid를 쓰지 않고
+    UPDATE 후 INSERT, IN 목록 분할, LIKE 검색, LOG_ID(UUID) 기본키만 사용한다.
+    테스트에서는 connect에 sqlite3 연결 함수를 넘겨 서버 없이 실행할 수 있다.
+    """
+
+    # 긴 문자열 컬럼 (나머지 TEXT 컬럼은 인덱스를 걸 수 있도록 VARCHAR(255))
+    LONG_TEXT_COLUMNS = ('TABLE_DC', 'SRC_PATH', 'DEST_PATH', 'ERROR_MSG')
+    COLUMN_TYPES = {'TEXT': 'VARCHAR(255)', 'INTEGER': 'BIGINT', 'REAL': 'DOUBLE PRECISION'}
+
+    # 조회용 인덱스 ((인덱스명, 테이블, 컬럼), ...)
+    INDEXES = (
+        ('IDX_FILE_INFO_TABLE_COPY', 'FILE_INFO', 'TABLE_NM, COPY_YN, FILE_NM'),
+        ('IDX_TASK_LOG_START_TS', 'TASK_LOG', 'START_TS'),
+        ('IDX_TASK_LOG_ROLLED_UP', 'TASK_LOG', 'ROLLED_UP, START_TIME'),
+    )
+
+    # IN 목록 한 번에 넘기는 최대 파라미터 수
+    IN_CHUNK_SIZE = 500
+
+    def __init__(self, connect, paramstyle='qmark', initialize=True):
+        """공유 SQL 상태 저장소 초기화
+
+        Args:
+            connect (callable): 새 DB-API 연결을 반환하는 함수 (스레드마다 한 번 호출)
+            paramstyle (str, optional): 드라이버 파라미터 형식 (qmark, format, pyformat). Defaults to 'qmark'.
+            initialize (bool, optional): 테이블이 없으면 생성. Defaults to True.
+
+        Raises:
+            ValueError: 지원하지 않는 paramstyle인 경우
+        """
+        if paramstyle not in ('qmark', 'format', 'pyformat'):
+            raise ValueError(f"지원하지 않는 paramstyle입니다: {paramstyle}")
+        self._connect = connect
+        self.paramstyle = paramstyle
+
+        # 스레드별 장기 연결 ({스레드 객체: 연결})
+        self._local = threading.local()
+        self._connections = {}
+        self._connections_lock = threading.Lock()
+        # 변환한 SQL 문 ({원본: 드라이버 형식})
+        self._sql_cache = {}
+
+        self.logger = logging.getLogger('SqlStateStore')
+
+        if initialize:
+            self.initialize_schema()
+
+    # ============================================================
+    # 연결/실행
+    # ============================================================
+    def get_connection(self):
+        """현재 스레드의 연결 반환 (없으면 생성, 종료된 스레드의 연결은 닫음)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._connections_lock:
+                for thread in [t for t in self._connections if not t.is_alive()]:
+                    try:
+                        self._connections.pop(thread).close()
+                    except Exception:
+                        pass
+                self._connections[threading.current_thread()] = conn
+        return conn
+
+    def close_all_connections(self):
+        with self._connections_lock:
+            for conn in self._connections.values():
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
+
+    def test_connection(self):
+        try:
+            self._execute("SELECT 1", fetch=True)
+            return True, ""
+        except Exception as e:
+            return False, str(e)
+
+    def _sql(self, query):
+        """'?' 자리표시자를 드라이버 형식으로 변환"""
+        if self.paramstyle == 'qmark':
+            return query
+        converted = self._sql_cache.get(query)
+        if converted is None:
+            converted = self._sql_cache[query] = query.replace('%', '%%').replace('?', '%s')
+        return converted
+
+    def _integrity_error(self):
+        """드라이버의 IntegrityError (연결 속성이 없으면 Exception)"""
+        return getattr(self.get_connection(), 'IntegrityError', Exception)
+
+    @contextmanager
+    def _transaction(self):
+        """한 트랜잭션으로 실행 (예외 시 롤백)
+
+        Yields:
+            cursor: 커서
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+            conn.commit()
+        except BaseException:
+            # 끝까지 읽지 않은 제너레이터(GeneratorExit)도 롤백
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def _run(self, cursor, query, params=()):
+        """커서로 한 문장 실행 (영향받은 행 수 반환)"""
+        cursor.execute(self._sql(query), params)
+        return cursor.rowcount
+
+    def _execute(self, query, params=(), fetch=False):
+        """한 문장을 한 트랜잭션으로 실행
+
+        Returns:
+            list 또는 int: fetch=True면 조회 결과, 아니면 영향받은 행 수
+        """
+        with self._transaction() as cursor:
+            cursor.execute(self._sql(query), params)
+            return cursor.fetchall() if fetch else cursor.rowcount
+
+    def _chunks(self, values):
+        """IN 목록용 분할"""
+        values = list(values)
+        for index in range(0, len(values), self.IN_CHUNK_SIZE):
+            yield values[index:index + self.IN_CHUNK_SIZE]
+
+    @staticmethod
+    def _placeholders(values):
+        return ', '.join('?' * len(values))
+
+    def _upsert(self, table_name, key, values):
+        """UPDATE 후 없으면 INSERT (다른 인스턴스가 먼저 INSERT하면 UPDATE 재시도)
+
+        Args:
+            table_name (str): 테이블명
+            key (dict): 기본키 {컬럼명: 값}
+            values (dict): 변경할 {컬럼명: 값}
+
+        Returns:
+            int: 영향받은 행 수
+        """
+        update = (f"UPDATE {table_name} SET {', '.join(f'{c} = ?' for c in values)} "
+                  f"WHERE {' AND '.join(f'{c} = ?' for c in key)}")
+        update_params = (*values.values(), *key.values())
+        count = self._execute(update, update_params)
+        if count > 0:
+            return count
+
+        columns = (*key, *values)
+        try:
+            return self._execute(
+                f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({self._placeholders(columns)})",
+                (*key.values(), *values.values())
+            )
+        except self._integrity_error():
+            return self._execute(update, update_params)
+
+    # ============================================================
+    # 스키마
+    # ============================================================
+    def initialize_schema(self):
+        """관리 테이블과 인덱스 생성 (이미 있으면 건너뜀)"""
+        for table_name, columns in STATE_TABLE_COLUMNS.items():
+            column_defs = []
+            if table_name == 'TASK_LOG':
+                column_defs.append("LOG_ID VARCHAR(36) NOT NULL")
+            for name, col_type in columns:
+                sql_type = 'TEXT' if name in self.LONG_TEXT_COLUMNS else self.COLUMN_TYPES[col_type]
+                column_defs.append(f"{name} {sql_type}")
+            key = STATE_TABLE_KEYS[table_name] or ('LOG_ID',)
+            column_defs.append(f"PRIMARY KEY ({', '.join(key)})")
+            self._execute(f"CREATE TABLE IF NOT EXISTS {table_name} ({', '.join(column_defs)})")
+
+        # CREATE INDEX IF NOT EXISTS를 지원하지 않는 서버가 있으므로 실패(이미 있음)는 무시
+        for index_name, table_name, columns in self.INDEXES:
+            try:
+                self._execute(f"CREATE INDEX {index_name} ON {table_name} ({columns})")
+            except Exception:
+                pass
+
+    # ============================================================
+    # 테이블 정보/자동화 설정/컬럼 매핑
+    # ============================================================
+    def get_table_info_list(self):
+        return [row[0] for row in self._execute("SELECT TABLE_NM FROM TABLE_INFO ORDER BY TABLE_NM", fetch=True)]
+
+    def get_table_details(self, table_nm):
+        result = self._execute(
+            "SELECT TABLE_NM, TABLE_DC, TABLE_OWNERSHIP FROM TABLE_INFO WHERE TABLE_NM = ?", (table_nm,), fetch=True
+        )
+        return tuple(result[0]) if result else None
+
+    def save_table_info(self, table_nm, table_dc, table_ownership):
+        return self._upsert('TABLE_INFO', {'TABLE_NM': table_nm},
+                            {'TABLE_DC': table_dc, 'TABLE_OWNERSHIP': table_ownership})
+
+    def delete_table_info(self, table_nm):
+        return self._execute("DELETE FROM TABLE_INFO WHERE TABLE_NM = ?", (table_nm,))
+
+    def get_auto_config_list(self):
+        return [row[0] for row in self._execute("SELECT TABLE_NM FROM AUTO_CONFIG ORDER BY TABLE_NM", fetch=True)]
+
+    def get_auto_config_details(self, table_nm):
+        result = self._execute(
+            "SELECT SRC_PATH, DEST_PATH, AUTO_INTERVAL, USE_YN FROM AUTO_CONFIG WHERE TABLE_NM = ?",
+            (table_nm,), fetch=True
+        )
+        return tuple(result[0]) if result else None
+
+    def save_auto_config(self, table_nm, src_path, dest_path, auto_interval, use_yn):
+        return self._upsert('AUTO_CONFIG', {'TABLE_NM': table_nm}, {
+            'SRC_PATH': src_path, 'DEST_PATH': dest_path, 'AUTO_INTERVAL': auto_interval, 'USE_YN': use_yn,
+        })
+
+    def delete_auto_config(self, table_nm):
+        return self._execute("DELETE FROM AUTO_CONFIG WHERE TABLE_NM = ?", (table_nm,))
+
+    def update_auto_config_timestamp(self, table_nm):
+        current_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        return self._execute("UPDATE AUTO_CONFIG SET LAST_TIMESTAMP = ? WHERE TABLE_NM = ?", (current_time, table_nm))
+
+    def get_all_auto_configs(self):
+        query = """
+            SELECT TABLE_NM, DEST_PATH, AUTO_INTERVAL, LAST_TIMESTAMP
+            FROM AUTO_CONFIG
+            WHERE AUTO_INTERVAL IS NOT NULL AND AUTO_INTERVAL > 0
+        """
+        return [tuple(row) for row in self._execute(query, fetch=True)]
+
+    def get_col_mapping_tables(self):
+        query = "SELECT DISTINCT TABLE_NM FROM COL_MAPPING ORDER BY TABLE_NM"
+        return [row[0] for row in self._execute(query, fetch=True)]
+
+    def get_column_mappings(self, table_nm):
+        query = "SELECT DB_COL_NM, XML_COL_NM FROM COL_MAPPING WHERE TABLE_NM = ?"
+        return [tuple(row) for row in self._execute(query, (table_nm,), fetch=True)]
+
+    def save_column_mappings(self, table_nm, mappings):
+        with self._transaction() as cursor:
+            self._run(cursor, "DELETE FROM COL_MAPPING WHERE TABLE_NM = ?", (table_nm,))
+            if mappings:
+                cursor.executemany(
+                    self._sql("INSERT INTO COL_MAPPING (TABLE_NM, DB_COL_NM, XML_COL_NM) VALUES (?, ?, ?)"),
+                    [(table_nm, db_col_nm, xml_col_nm) for db_col_nm, xml_col_nm, _ in mappings]  # dup_check_yn 무시
+                )
+        return True
+
+    def delete_column_mappings(self, table_nm):
+        return self._execute("DELETE FROM COL_MAPPING WHERE TABLE_NM = ?", (table_nm,))
+
+    # ============================================================
+    # 파일 정보/전송 상태
+    # ============================================================
+    def _select_existing(self, cursor, file_names):
+        """등록된 파일명 집합 (IN 목록 분할 조회)"""
+        existing = set()
+        for chunk in self._chunks(file_names):
+            self._run(cursor, f"SELECT FILE_NM FROM FILE_INFO WHERE FILE_NM IN ({self._placeholders(chunk)})", chunk)
+            existing.update(row[0] for row in cursor.fetchall())
+        return existing
+
+    def register_files(self, table_nm, file_names):
+        file_names = list(dict.fromkeys(file_names))
+        if not file_names:
+            return 0
+        now = time.time()
+        reset = ('N', 'N', FILE_STATE_DISCOVERED, now, 0, None, 0)
+        try:
+            with self._transaction() as cursor:
+                existing = self._select_existing(cursor, file_names)
+                if existing:
+                    cursor.executemany(self._sql("""
+                        UPDATE FILE_INFO SET TABLE_NM = ?, COPY_YN = ?, DELETE_YN = ?, TRANSFER_STATE = ?,
+                               STATE_TIME = ?, BYTE_OFFSET = ?, FILE_SIZE = ?, RETRY_CNT = ?
+                        WHERE FILE_NM = ?
+                    """), [(table_nm, *reset, file_nm) for file_nm in existing])
+                new_files = [file_nm for file_nm in file_names if file_nm not in existing]
+                if new_files:
+                    cursor.executemany(self._sql("""
+                        INSERT INTO FILE_INFO (TABLE_NM, FILE_NM, COPY_YN, DELETE_YN, TRANSFER_STATE,
+                                               STATE_TIME, BYTE_OFFSET, FILE_SIZE, RETRY_CNT)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """), [(table_nm, file_nm, *reset) for file_nm in new_files])
+        except self._integrity_error():
+            # 다른 인스턴스가 같은 파일을 먼저 등록함 → 파일별로 다시 등록
+            columns = ('TABLE_NM', 'COPY_YN', 'DELETE_YN', 'TRANSFER_STATE', 'STATE_TIME',
+                       'BYTE_OFFSET', 'FILE_SIZE', 'RETRY_CNT')
+            for file_nm in file_names:
+                self._upsert('FILE_INFO', {'FILE_NM': file_nm}, dict(zip(columns, (table_nm, *reset))))
+        return len(file_names)
+
+    def find_new_files(self, file_names):
+        file_names = set(file_names)
+        with self._transaction() as cursor:
+            existing = self._select_existing(cursor, file_names)
+        return sorted(file_names - existing)
+
+    def get_file_watermark(self, table_nm):
+        # '0' ~ '9' 다음 문자(':') 범위로 접두어 뒤가 숫자인 파일만 조회
+        # (범위에 'A_1'과 'A_1_B_...'처럼 다른 테이블 파일이 섞일 수 있어 TABLE_NM으로 다시 거른다)
+        query = """
+            SELECT MAX(FILE_NM) FROM FILE_INFO
+            WHERE FILE_NM >= ? AND FILE_NM < ? AND TABLE_NM = ?
+        """
+        result = self._execute(query, (f"{table_nm}_0", f"{table_nm}_:", table_nm), fetch=True)
+        return result[0][0] if result else None
+
+    def get_existing_files(self, table_nm):
+        query = "SELECT FILE_NM FROM FILE_INFO WHERE TABLE_NM = ?"
+        return {row[0] for row in self._execute(query, (table_nm,), fetch=True)}
+
+    def get_pending_files_count(self, table_nm):
+        query = "SELECT COUNT(*) FROM FILE_INFO WHERE TABLE_NM = ? AND COPY_YN = 'N'"
+        result = self._execute(query, (table_nm,), fetch=True)
+        return result[0][0] if result else 0
+
+    def get_pending_transfers(self, table_nm):
+        query = f"""
+            SELECT fi.FILE_NM, COALESCE(fi.TRANSFER_STATE, '{FILE_STATE_DISCOVERED}'),
+                   COALESCE(fi.BYTE_OFFSET, 0), fi.FILE_SIZE, COALESCE(fi.RETRY_CNT, 0)
+            FROM FILE_INFO fi
+            JOIN AUTO_CONFIG ac ON fi.TABLE_NM = ac.TABLE_NM
+            WHERE ac.TABLE_NM = ?
+            AND ac.USE_YN = 'Y'
+            AND (fi.COPY_YN IS NULL OR fi.COPY_YN = 'N')
+            ORDER BY fi.FILE_NM ASC
+        """
+        return [tuple(row) for row in self._execute(query, (table_nm,), fetch=True)]
+
+    def get_files_to_delete(self, table_nm):
+        query = """
+            SELECT fi.FILE_NM, ac.DEST_PATH
+            FROM FILE_INFO fi
+            JOIN AUTO_CONFIG ac ON fi.TABLE_NM = ac.TABLE_NM
+            WHERE fi.TABLE_NM = ?
+            AND fi.COPY_YN = 'Y'
+            AND fi.DELETE_YN = 'N'
+        """
+        return [tuple(row) for row in self._execute(query, (table_nm,), fetch=True)]
+
+    def update_transfer_state(self, file_name, state, byte_offset=0, file_size=None, wait=True):
+        # 서버마다 파라미터 타입 추론이 다르므로 CASE/COALESCE 대신 문장을 나눠 만듦
+        sets = ["TRANSFER_STATE = ?", "STATE_TIME = ?", "BYTE_OFFSET = ?", "COPY_YN = ?"]
+        params = [state, time.time(), byte_offset, 'Y' if state == FILE_STATE_VERIFIED else 'N']
+        if file_size is not None:
+            sets.append("FILE_SIZE = ?")
+            params.append(file_size)
+        if state == FILE_STATE_FAILED:
+            sets.append("RETRY_CNT = COALESCE(RETRY_CNT, 0) + 1")
+        params.append(file_name)
+        return self._execute(f"UPDATE FILE_INFO SET {', '.join(sets)} WHERE FILE_NM = ?", tuple(params))
+
+    def update_files_transfer_state(self, file_names, state):
+        count = 0
+        now = time.time()
+        copy_yn = 'Y' if state == FILE_STATE_VERIFIED else 'N'
+        with self._transaction() as cursor:
+            for chunk in self._chunks(dict.fromkeys(file_names)):
+                count += self._run(cursor, f"""
+                    UPDATE FILE_INFO SET TRANSFER_STATE = ?, STATE_TIME = ?, BYTE_OFFSET = 0, COPY_YN = ?
+                    WHERE FILE_NM IN ({self._placeholders(chunk)})
+                """, (state, now, copy_yn, *chunk))
+        return count
+
+    def update_file_status(self, file_name, copy_status='Y'):
+        return completed_future(
+            self._execute("UPDATE FILE_INFO SET COPY_YN = ? WHERE FILE_NM = ?", (copy_status, file_name))
+        )
+
+    def update_file_delete_status(self, file_name):
+        return self._execute("UPDATE FILE_INFO SET DELETE_YN = 'Y' WHERE FILE_NM = ?", (file_name,))
+
+    # ============================================================
+    # 작업 로그
+    # ============================================================
+    def log_task(self, table_nm, file_name, start_time, error_msg=None, metrics=None):
+        metrics = metrics or {}
+        end_ts = metrics.get('end_ts') or time.time()
+        start_ts = metrics.get('start_ts')
+        if start_ts is None:
+            try:
+                start_ts = datetime.datetime.strptime(start_time, '%Y-%m-%d %H:%M:%S').timestamp()
+            except (TypeError, ValueError):
+                start_ts = None
+
+        query = """
+            INSERT INTO TASK_LOG (LOG_ID, TABLE_NM, FILE_NM, START_TIME, END_TIME, ERROR_MSG, ROLLED_UP,
+                                  BYTES, LIST_MS, DOWNLOAD_MS, UPLOAD_MS, DB_MS,
+                                  RETRY_CNT, STRATEGY, START_TS, END_TS)
+            VALUES (?, ?, ?, ?, ?, ?, 0, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        return completed_future(self._execute(query, (
+            uuid.uuid4().hex, table_nm, file_name, start_time,
+            datetime.datetime.fromtimestamp(end_ts).strftime('%Y-%m-%d %H:%M:%S'), error_msg,
+            metrics.get('bytes'), metrics.get('list_ms'), metrics.get('download_ms'),
+            metrics.get('upload_ms'), metrics.get('db_ms'), metrics.get('retry_cnt', 0),
+            metrics.get('strategy'), start_ts, end_ts
+        )))
+
+    def get_transfer_stats(self, start_ts=None, end_ts=None, table_nm=None):
+        """테이블별 전송 통계 (백분위수는 서버마다 함수가 달라 조회한 행으로 계산)"""
+        end_ts = time.time() if end_ts is None else end_ts
+        start_ts = end_ts - 86400 if start_ts is None else start_ts
+        query = """
+            SELECT TABLE_NM, ERROR_MSG, BYTES, DOWNLOAD_MS, UPLOAD_MS, DB_MS, RETRY_CNT, START_TS, END_TS
+            FROM TASK_LOG WHERE START_TS >= ? AND START_TS < ?
+        """
+        params = [start_ts, end_ts]
+        if table_nm is not None:
+            query += " AND TABLE_NM = ?"
+            params.append(table_nm)
+        return summarize_transfer_stats(self._execute(query, tuple(params), fetch=True))
+
+    def _like_conditions(self, columns, text):
+        """검색어별 대소문자 무시 LIKE 조건 (이스케이프 문자 '!')
+
+        Returns:
+            tuple: (조건 목록, 파라미터 목록)
+        """
+        conditions, params = [], []
+        for term in text.lower().split():
+            pattern = '%' + term.replace('!', '!!').replace('%', '!%').replace('_', '!_') + '%'
+            conditions.append('(' + ' OR '.join(f"LOWER({col}) LIKE ? ESCAPE '!'" for col in columns) + ')')
+            params.extend([pattern] * len(columns))
+        return conditions, params
+
+    def search_task_log(self, text, start_ts=None, end_ts=None, table_nm=None, limit=100):
+        conditions, params = self._like_conditions(('FILE_NM', 'ERROR_MSG'), text)
+        if start_ts is not None:
+            conditions.append("START_TS >= ?")
+            params.append(start_ts)
+        if end_ts is not None:
+            conditions.append("START_TS < ?")
+            params.append(end_ts)
+        if table_nm:
+            conditions.append("TABLE_NM = ?")
+            params.append(table_nm)
+
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        query = f"""
+            SELECT TABLE_NM, FILE_NM, START_TIME, END_TIME, ERROR_MSG
+            FROM TASK_LOG{where}
+            ORDER BY START_TS DESC
+            LIMIT ?
+        """
+        params.append(limit)
+        return [
+            {'table_nm': row[0], 'file_nm': row[1], 'start_time': row[2], 'end_time': row[3], 'error_msg': row[4]}
+            for row in self._execute(query, tuple(params), fetch=True)
+        ]
+
+    def search_files(self, text, table_nm=None, limit=100):
+        conditions, params = self._like_conditions(('FILE_NM',), text)
+        if table_nm:
+            conditions.append("TABLE_NM = ?")
+            params.append(table_nm)
+
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        query = f"""
+            SELECT TABLE_NM, FILE_NM, COPY_YN, TRANSFER_STATE
+            FROM FILE_INFO{where}
+            ORDER BY FILE_NM DESC
+            LIMIT ?
+        """
+        params.append(limit)
+        return [
+            {'table_nm': row[0], 'file_nm': row[1], 'copy_yn': row[2], 'transfer_state': row[3]}
+            for row in self._execute(query, tuple(params), fetch=True)
+        ]
+
+    def rollup_task_log(self, batch_size=1000):
+        """집계되지 않은 작업 로그를 TASK_LOG_DAILY에 누적 (한 트랜잭션)
+
+        먼저 ROLLED_UP = 0인 행만 1로 바꿔 선점하고, 다른 인스턴스가 일부를 먼저 선점했으면
+        롤백 후 0을 반환한다(다음 실행 때 다시 시도). 같은 (테이블, 날짜) 행을 동시에 처음 만들어
+        충돌해도 롤백 후 0을 반환한다.
+        """
+        try:
+            with self._transaction() as cursor:
+                self._run(cursor, """
+                    SELECT LOG_ID, TABLE_NM, FILE_NM, START_TIME, END_TIME, ERROR_MSG, BYTES, START_TS, END_TS
+                    FROM TASK_LOG WHERE ROLLED_UP = 0
+                    ORDER BY START_TIME, LOG_ID
+                    LIMIT ?
+                """, (batch_size,))
+                rows = cursor.fetchall()
+                if not rows:
+                    return 0
+
+                claimed = 0
+                for chunk in self._chunks(row[0] for row in rows):
+                    claimed += self._run(
+                        cursor,
+                        f"UPDATE TASK_LOG SET ROLLED_UP = 1 WHERE ROLLED_UP = 0 AND LOG_ID IN ({self._placeholders(chunk)})",
+                        chunk
+                    )
+                if claimed != len(rows):
+                    raise _RollupConflict()
+
+                file_sizes = {}
+                need_sizes = {row[2] for row in rows if row[5] is None and row[6] is None}
+                for chunk in self._chunks(need_sizes):
+                    self._run(cursor, f"SELECT FILE_NM, FILE_SIZE FROM FILE_INFO WHERE FILE_NM IN ({self._placeholders(chunk)})", chunk)
+                    file_sizes.update(cursor.fetchall())
+
+                daily = summarize_daily(
+                    (row[1], row[3], row[4], row[5], row[6], row[7], row[8], file_sizes.get(row[2]))
+                    for row in rows
+                )
+                for (table_nm, log_date), (task_cnt, fail_cnt, total_bytes, total_sec, max_sec) in daily.items():
+                    updated = self._run(cursor, """
+                        UPDATE TASK_LOG_DAILY SET
+                            TASK_CNT = TASK_CNT + ?,
+                            FAIL_CNT = FAIL_CNT + ?,
+                            TOTAL_BYTES = TOTAL_BYTES + ?,
+                            TOTAL_DURATION_SEC = TOTAL_DURATION_SEC + ?,
+                            MAX_DURATION_SEC = CASE WHEN MAX_DURATION_SEC < ? THEN ? ELSE MAX_DURATION_SEC END
+                        WHERE TABLE_NM = ? AND LOG_DATE = ?
+                    """, (task_cnt, fail_cnt, total_bytes, total_sec, max_sec, max_sec, table_nm, log_date))
+                    if updated == 0:
+                        self._run(cursor, """
+                            INSERT INTO TASK_LOG_DAILY (TABLE_NM, LOG_DATE, TASK_CNT, FAIL_CNT, TOTAL_BYTES,
+                                                        TOTAL_DURATION_SEC, MAX_DURATION_SEC)
+                            VALUES (?, ?, ?, ?, ?, ?, ?)
+                        """, (table_nm, log_date, task_cnt, fail_cnt, total_bytes, total_sec, max_sec))
+                return claimed
+        except _RollupConflict:
+            self.logger.info("다른 인스턴스가 집계 중이라 다음에 다시 집계합니다.")
+            return 0
+        except self._integrity_error():
+            self.logger.info("일간 집계 행 생성이 충돌해 다음에 다시 집계합니다.")
+            return 0
+
+    def purge_task_log(self, before_time, batch_size=1000):
+        with self._transaction() as cursor:
+            self._run(cursor, """
+                SELECT LOG_ID FROM TASK_LOG
+                WHERE ROLLED_UP = 1 AND START_TIME < ?
+                ORDER BY START_TIME
+                LIMIT ?
+            """, (before_time, batch_size))
+            log_ids = [row[0] for row in cursor.fetchall()]
+            count = 0
+            for chunk in self._chunks(log_ids):
+                count += self._run(cursor, f"DELETE FROM TASK_LOG WHERE LOG_ID IN ({self._placeholders(chunk)})", chunk)
+            return count
+
+    def get_task_log_daily(self, table_nm=None, start_date=None, end_date=None):
+        conditions, params = [], []
+        for condition, value in (("TABLE_NM = ?", table_nm), ("LOG_DATE >= ?", start_date),
+                                 ("LOG_DATE <= ?", end_date)):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        query = f"""
+            SELECT TABLE_NM, LOG_DATE, TASK_CNT, FAIL_CNT, TOTAL_BYTES,
+                   TOTAL_DURATION_SEC, MAX_DURATION_SEC
+            FROM TASK_LOG_DAILY{where}
+            ORDER BY LOG_DATE, TABLE_NM
+        """
+        return [tuple(row) for row in self._execute(query, tuple(params), fetch=True)]
+
+    # ============================================================
+    # 다중 인스턴스 하트비트/테이블 임대
+    # ============================================================
+    def update_instance_heartbeat(self, instance_id, now):
+        return self._upsert('SCHEDULER_INSTANCE', {'INSTANCE_ID': instance_id}, {'HEARTBEAT': now})
+
+    def get_live_instances(self, min_heartbeat):
+        query = "SELECT INSTANCE_ID FROM SCHEDULER_INSTANCE WHERE HEARTBEAT >= ? ORDER BY INSTANCE_ID"
+        return [row[0] for row in self._execute(query, (min_heartbeat,), fetch=True)]
+
+    def delete_stale_instances(self, min_heartbeat):
+        return self._execute("DELETE FROM SCHEDULER_INSTANCE WHERE HEARTBEAT < ?", (min_heartbeat,))
+
+    def delete_instance(self, instance_id):
+        return self._execute("DELETE FROM SCHEDULER_INSTANCE WHERE INSTANCE_ID = ?", (instance_id,))
+
+    def try_acquire_table_lease(self, table_nm, owner_id, now, lease_ttl):
+        """테이블 소유권 획득 또는 갱신 (조건부 UPDATE, 임대가 없으면 INSERT)
+
+        두 인스턴스가 동시에 INSERT하면 기본키 충돌로 한쪽만 성공한다.
+        """
+        updated = self._execute("""
+            UPDATE TABLE_LEASE SET OWNER_ID = ?, EXPIRES_AT = ?
+            WHERE TABLE_NM = ? AND (OWNER_ID = ? OR EXPIRES_AT < ?)
+        """, (owner_id, now + lease_ttl, table_nm, owner_id, now))
+        if updated > 0:
+            return True
+
+        try:
+            self._execute(
+                "INSERT INTO TABLE_LEASE (TABLE_NM, OWNER_ID, EXPIRES_AT) VALUES (?, ?, ?)",
+                (table_nm, owner_id, now + lease_ttl)
+            )
+            return True
+        except self._integrity_error():
+            return False
+
+    def release_table_lease(self, table_nm, owner_id):
+        return self._execute("DELETE FROM TABLE_LEASE WHERE TABLE_NM = ? AND OWNER_ID = ?", (table_nm, owner_id))
+
+    def release_all_table_leases(self, owner_id):
+        return self._execute("DELETE FROM TABLE_LEASE WHERE OWNER_ID = ?", (owner_id,))
+
+    def get_owned_tables(self, owner_id, now):
+        query = "SELECT TABLE_NM FROM TABLE_LEASE WHERE OWNER_ID = ? AND EXPIRES_AT >= ?"
+        return {row[0] for row in self._execute(query, (owner_id, now), fetch=True)}
+
+    # ============================================================
+    # 관리 테이블 조회
+    # ============================================================
+    def _check_browsable(self, table_name):
+        if table_name not in self.BROWSABLE_TABLES:
+            raise ValueError(f"조회할 수 없는 테이블입니다: {table_name}")
+
+    def _order_columns(self, table_name):
+        """전체 조회 순서 (기본키, TASK_LOG는 기록 순서)"""
+        return STATE_TABLE_KEYS[table_name] or ('START_TS', 'LOG_ID')
+
+    def get_table_list(self):
+        return sorted(self.BROWSABLE_TABLES)
+
+    def get_table_columns(self, table_name):
+        return list(STATE_TABLE_COLUMNS.get(table_name, ()))
+
+    def count_table_rows(self, table_name):
+        self._check_browsable(table_name)
+        return self._execute(f"SELECT COUNT(*) FROM {table_name}", fetch=True)[0][0]
+
+    def iter_table_rows(self, table_name, batch_size=1000):
+        self._check_browsable(table_name)
+        columns = ', '.join(col[0] for col in self.get_table_columns(table_name))
+        query = f"SELECT {columns} FROM {table_name} ORDER BY {', '.join(self._order_columns(table_name))}"
+        with self._transaction() as cursor:
+            cursor.execute(query)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [tuple(row) for row in rows]
+
+    def get_table_page(self, table_name, cursor=None, page_size=100, sort_column=None,
+                       descending=False, filters=None):
+        """관리 테이블 한 페이지 조회 (커서: 다음 페이지 OFFSET)
+
+        NULL 정렬 위치와 행 값 비교 문법이 서버마다 달라 keyset 대신 OFFSET을 사용한다.
+        """
+        self._check_browsable(table_name)
+        columns = [col[0] for col in self.get_table_columns(table_name)]
+        for column in [sort_column, *(filters or {})]:
+            if column is not None and column not in columns:
+                raise ValueError(f"{table_name} 테이블에 없는 컬럼입니다: {column}")
+
+        conditions, params = [], []
+        for column, value in (filters or {}).items():
+            if value is None:
+                conditions.append(f"{column} IS NULL")
+            elif isinstance(value, str) and '%' in value:
+                conditions.append(f"{column} LIKE ?")
+                params.append(value)
+            else:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+
+        direction = 'DESC' if descending else 'ASC'
+        order_by = [f"{column} {direction}" for column in
+                    ([sort_column] if sort_column else []) + list(self._order_columns(table_name))]
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        offset = cursor or 0
+        query = (f"SELECT {', '.join(columns)} FROM {table_name}{where} "
+                 f"ORDER BY {', '.join(order_by)} LIMIT ? OFFSET ?")
+        rows = [tuple(row) for row in self._execute(query, (*params, page_size, offset), fetch=True)]
+        return rows, (offset + page_size if len(rows) == page_size else None)
+
@@ -3,6 +3,7 @@ import paramiko
 import time
 import threading
 from pathlib import Path
+from models.cancel_token import TransferCancelled
 
 
 class SSHClient:
@@ -105,28 +106,181 @@ class SSHClient:
     # ============================================================
     # 파일 전송 메서드들 (잘 되던 버전 - 단순함)
     # ============================================================
-    def download_with_sftp(self, sftp, remote_path, local_path, file_name):
-        """기존 SFTP 세션을 사용한 파일 다운로드 (잘 되던 단순 버전)"""
+    def download_with_sftp(self, sftp, remote_path, local_path, file_name, cancel_token=None):
+        """기존 SFTP 세션을 사용한 파일 다운로드 (잘 되던 단순 버전)
+
+        cancel_token이 주어지면 청크마다 취소 여부를 확인하고,
+        중단 시 받다 만 로컬 파일을 삭제한 뒤 TransferCancelled를 다시 발생시킨다.
+        """
         os.makedirs(local_path, exist_ok=True)
         # 원격 경로는 항상 Unix 스타일 슬래시 사용
         remote_file = remote_path.rstrip('/') + '/' + file_name
         local_file = os.path.join(local_path, file_name)
         if os.path.exists(local_file):
             return False
-        sftp.get(remote_file, local_file)
+        callback = cancel_token.make_sftp_callback() if cancel_token else None
+        try:
+            sftp.get(remote_file, local_file, callback=callback)
+        except TransferCancelled:
+            if os.path.exists(local_file):
+                os.remove(local_file)
+            raise
         return True
 
-    def upload_with_sftp(self, sftp, local_path, remote_path, file_name):
-        """기존 SFTP 세션을 사용한 파일 업로드 (잘 되던 단순 버전)"""
+    def upload_with_sftp(self, sftp, local_path, remote_path, file_name, cancel_token=None):
+        """기존 SFTP 세션을 사용한 파일 업로드 (잘 되던 단순 버전)
+
+        cancel_token이 주어지면 청크마다 취소 여부를 확인하고,
+        중단 시 올리다 만 원격 파일을 삭제한 뒤 TransferCancelled를 다시 발생시킨다.
+        """
         local_file = os.path.join(local_path, file_name)
         # 원격 경로는 항상 Unix 스타일 슬래시 사용
         remote_file = remote_path.rstrip('/') + '/' + file_name
         if not os.path.exists(local_file):
             return False
         self.ensure_remote_dir(sftp, remote_path)
-        sftp.put(local_file, remote_file)
+        callback = cancel_token.make_sftp_callback() if cancel_token else None
+        try:
+            sftp.put(local_file, remote_file, callback=callback)
+        except TransferCancelled:
+            try:
+                sftp.remove(remote_file)
+            except Exception:
+                pass
+            raise
         return True
 
+    # ============================================================
+    # 이어받기/이어올리기 전송 메서드들 (청크 단위)
+    # ============================================================
+    TRANSFER_CHUNK_SIZE = 32768
+
+    def download_resumable(self, sftp, remote_path, local_path, file_name, offset=0,
+                           cancel_token=None, progress_callback=None, checkpoint_bytes=0):
+        """offset 위치부터 파일 이어받기
+
+        로컬 파일을 offset 길이로 자른 뒤 원격 파일의 나머지를 청크 단위로 받는다.
+        중단(TransferCancelled 포함) 시 받은 부분은 남겨 두어 다음에 이어받을 수 있다.
+        checkpoint_bytes를 지정하면 그만큼 받을 때마다 로컬 파일을 fsync한 뒤 콜백을 호출하므로,
+        콜백이 그 시점에 기록한 위치까지는 디스크에 남아 있음이 보장된다.
+
+        Args:
+            sftp: SFTP 세션
+            remote_path (str): 원격 디렉토리
+            local_path (str): 로컬 디렉토리
+            file_name (str): 파일명
+            offset (int, optional): 이어받을 시작 위치. Defaults to 0.
+            cancel_token (CancelToken, optional): 취소 토큰. Defaults to None.
+            progress_callback (function, optional): (전송 바이트, 전체 바이트) 콜백. Defaults to None.
+            checkpoint_bytes (int, optional): fsync 간격 (0이면 종료 시에만). Defaults to 0.
+
+        Returns:
+            int: 전체 파일 크기
+        """
+        os.makedirs(local_path, exist_ok=True)
+        remote_file = remote_path.rstrip('/') + '/' + file_name
+        local_file = os.path.join(local_path, file_name)
+
+        total = sftp.stat(remote_file).st_size
+        if offset > 0 and os.path.exists(local_file):
+            # 기록된 위치와 실제 받은 크기 중 작은 쪽부터 이어받기
+            offset = min(offset, os.path.getsize(local_file), total)
+        else:
+            offset = 0
+
+        started_at = time.monotonic()
+        with open(local_file, 'r+b' if offset else 'wb') as lf:
+            lf.truncate(offset)
+            lf.seek(offset)
+            with sftp.open(remote_file, 'rb') as rf:
+                rf.seek(offset)
+                rf.prefetch(total)
+                transferred = offset
+                last_synced = offset
+                try:
+                    while transferred < total:
+                        data = rf.read(self.TRANSFER_CHUNK_SIZE)
+                        if not data:
+                            break
+                        lf.write(data)
+                        transferred += len(data)
+                        if checkpoint_bytes and transferred - last_synced >= checkpoint_bytes:
+                            # 콜백이 위치를 기록하기 전에 받은 데이터를 디스크에 반영
+                            lf.flush()
+                            os.fsync(lf.fileno())
+                            last_synced = transferred
+                        if progress_callback:
+                            progress_callback(transferred, total)
+                        if cancel_token:
+                            cancel_token.check(transferred, total, started_at, offset)
+                finally:
+                    lf.flush()
+                    os.fsync(lf.fileno())
+
+        if transferred != total:
+            raise IOError(f"다운로드 크기 불일치: {transferred}/{total} bytes")
+        return total
+
+    def upload_resumable(self, sftp, local_path, remote_path, file_name, offset=0,
+                         cancel_token=None, progress_callback=None):
+        """offset 위치부터 파일 이어올리기
+
+        원격 파일이 offset보다 짧으면 원격 파일 크기부터 다시 올린다.
+        중단(TransferCancelled 포함) 시 올린 부분은 남겨 두어 다음에 이어올릴 수 있다.
+
+        Args:
+            sftp: SFTP 세션
+            local_path (str): 로컬 디렉토리
+            remote_path (str): 원격 디렉토리
+            file_name (str): 파일명
+            offset (int, optional): 이어올릴 시작 위치. Defaults to 0.
+            cancel_token (CancelToken, optional): 취소 토큰. Defaults to None.
+            progress_callback (function, optional): (전송 바이트, 전체 바이트) 콜백. Defaults to None.
+
+        Returns:
+            int: 전체 파일 크기
+        """
+        local_file = os.path.join(local_path, file_name)
+        remote_file = remote_path.rstrip('/') + '/' + file_name
+        total = os.path.getsize(local_file)
+        self.ensure_remote_dir(sftp, remote_path)
+
+        if offset > 0:
+            try:
+                offset = min(offset, sftp.stat(remote_file).st_size)
+            except IOError:
+                offset = 0
+
+        started_at = time.monotonic()
+        with open(local_file, 'rb') as lf:
+            lf.seek(offset)
+            with sftp.open(remote_file, 'r+b' if offset else 'wb') as rf:
+                rf.set_pipelined(True)
+                if offset:
+                    rf.truncate(offset)
+                    rf.seek(offset)
+                transferred = offset
+                while transferred < total:
+                    data = lf.read(self.TRANSFER_CHUNK_SIZE)
+                    if not data:
+                        break
+                    rf.write(data)
+                    transferred += len(data)
+                    if progress_callback:
+                        progress_callback(transferred, total)
+                    if cancel_token:
+                        cancel_token.check(transferred, total, started_at, offset)
+
+        return total
+
+    def get_remote_file_size(self, sftp, remote_path, file_name):
+        """원격 파일 크기 조회 (파일이 없으면 None)"""
+        remote_file = remote_path.rstrip('/') + '/' + file_name
+        try:
+            return sftp.stat(remote_file).st_size
+        except IOError:
+            return None
+
     # ============================================================
     # 단일 연결 편의 메서드들 (잘 되던 버전)
     # ============================================================
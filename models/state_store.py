@@ -0,0 +1,460 @@
+import abc
+import math
+import datetime
+from concurrent.futures import Future
+
+
+# 파일 전송 상태 (FILE_INFO.TRANSFER_STATE)
+FILE_STATE_DISCOVERED = 'DISCOVERED'  # 발견됨 (BYTE_OFFSET: 다운로드 위치)
+FILE_STATE_STAGED = 'STAGED'          # 임시 디렉토리에 다운로드 완료
+FILE_STATE_UPLOADING = 'UPLOADING'    # 업로드 중 (BYTE_OFFSET: 업로드 위치)
+FILE_STATE_UPLOADED = 'UPLOADED'      # 업로드 완료, 검증 전
+FILE_STATE_VERIFIED = 'VERIFIED'      # 원격 크기 검증 완료 (COPY_YN = 'Y')
+FILE_STATE_FAILED = 'FAILED'          # 실패 (처음부터 다시 전송)
+
+# 관리 테이블 컬럼 ({테이블: ((컬럼명, 타입), ...)}, DatabaseManager 마이그레이션 후 컬럼 순서)
+STATE_TABLE_COLUMNS = {
+    'TABLE_INFO': (('TABLE_NM', 'TEXT'), ('TABLE_DC', 'TEXT'), ('TABLE_OWNERSHIP', 'TEXT')),
+    'FILE_INFO': (('TABLE_NM', 'TEXT'), ('FILE_NM', 'TEXT'), ('COPY_YN', 'TEXT'), ('DELETE_YN', 'TEXT'),
+                  ('TRANSFER_STATE', 'TEXT'), ('STATE_TIME', 'REAL'), ('BYTE_OFFSET', 'INTEGER'),
+                  ('FILE_SIZE', 'INTEGER'), ('RETRY_CNT', 'INTEGER')),
+    'AUTO_CONFIG': (('TABLE_NM', 'TEXT'), ('SRC_PATH', 'TEXT'), ('DEST_PATH', 'TEXT'),
+                    ('AUTO_INTERVAL', 'INTEGER'), ('LAST_TIMESTAMP', 'TEXT'), ('USE_YN', 'TEXT')),
+    'COL_MAPPING': (('TABLE_NM', 'TEXT'), ('DB_COL_NM', 'TEXT'), ('XML_COL_NM', 'TEXT')),
+    'TASK_LOG': (('TABLE_NM', 'TEXT'), ('FILE_NM', 'TEXT'), ('START_TIME', 'TEXT'), ('END_TIME', 'TEXT'),
+                 ('ERROR_MSG', 'TEXT'), ('ROLLED_UP', 'INTEGER'), ('BYTES', 'INTEGER'),
+                 ('LIST_MS', 'INTEGER'), ('DOWNLOAD_MS', 'INTEGER'), ('UPLOAD_MS', 'INTEGER'),
+                 ('DB_MS', 'INTEGER'), ('RETRY_CNT', 'INTEGER'), ('STRATEGY', 'TEXT'),
+                 ('START_TS', 'REAL'), ('END_TS', 'REAL')),
+    'TASK_LOG_DAILY': (('TABLE_NM', 'TEXT'), ('LOG_DATE', 'TEXT'), ('TASK_CNT', 'INTEGER'),
+                       ('FAIL_CNT', 'INTEGER'), ('TOTAL_BYTES', 'INTEGER'),
+                       ('TOTAL_DURATION_SEC', 'REAL'), ('MAX_DURATION_SEC', 'REAL')),
+    'SCHEDULER_INSTANCE': (('INSTANCE_ID', 'TEXT'), ('HEARTBEAT', 'REAL')),
+    'TABLE_LEASE': (('TABLE_NM', 'TEXT'), ('OWNER_ID', 'TEXT'), ('EXPIRES_AT', 'REAL')),
+}
+
+# 관리 테이블 기본키 (TASK_LOG는 구현별 내부 ID 사용)
+STATE_TABLE_KEYS = {
+    'TABLE_INFO': ('TABLE_NM',),
+    'FILE_INFO': ('FILE_NM',),
+    'AUTO_CONFIG': ('TABLE_NM',),
+    'COL_MAPPING': ('TABLE_NM', 'DB_COL_NM'),
+    'TASK_LOG': (),
+    'TASK_LOG_DAILY': ('TABLE_NM', 'LOG_DATE'),
+    'SCHEDULER_INSTANCE': ('INSTANCE_ID',),
+    'TABLE_LEASE': ('TABLE_NM',),
+}
+
+
+def completed_future(value):
+    """결과가 정해진 Future (쓰기 스레드가 없는 저장소의 log_task/update_file_status 반환값)"""
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+def summarize_transfer_stats(rows):
+    """작업 로그 행으로 테이블별 전송 통계 계산 (DatabaseManager.get_transfer_stats와 같은 결과)
+
+    Args:
+        rows (iterable): (TABLE_NM, ERROR_MSG, BYTES, DOWNLOAD_MS, UPLOAD_MS, DB_MS,
+                          RETRY_CNT, START_TS, END_TS) 목록
+
+    Returns:
+        list: 테이블별 dict (테이블명 순)
+    """
+    tables = {}
+    for table_nm, error_msg, size, download_ms, upload_ms, db_ms, retry_cnt, start_ts, end_ts in rows:
+        item = tables.setdefault(table_nm, {
+            'count': 0, 'failures': 0, 'retries': 0, 'bytes': 0, 'durations': [],
+            'download': [], 'upload': [], 'db': [],
+        })
+        item['count'] += 1
+        item['retries'] += retry_cnt or 0
+        if error_msg is not None:
+            item['failures'] += 1
+        else:
+            item['bytes'] += size or 0
+            if start_ts is not None and end_ts is not None:
+                item['durations'].append((end_ts - start_ts) * 1000.0)
+        for key, value in (('download', download_ms), ('upload', upload_ms), ('db', db_ms)):
+            if value is not None:
+                item[key].append(value)
+
+    stats = []
+    for table_nm in sorted(tables):
+        item = tables[table_nm]
+        durations = sorted(item['durations'])
+        total_ms = sum(durations)
+
+        def percentile(p):
+            # nearest-rank (순위 >= p * 건수인 첫 값)
+            return durations[max(math.ceil(p * len(durations)), 1) - 1] if durations else None
+
+        def average(values):
+            return sum(values) / len(values) if values else None
+
+        stats.append({
+            'table_nm': table_nm,
+            'count': item['count'],
+            'failures': item['failures'],
+            'retries': item['retries'],
+            'bytes': item['bytes'],
+            'mb_per_sec': (item['bytes'] / 1048576) / (total_ms / 1000) if total_ms else None,
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95),
+            'p99_ms': percentile(0.99),
+            'avg_download_ms': average(item['download']),
+            'avg_upload_ms': average(item['upload']),
+            'avg_db_ms': average(item['db']),
+        })
+    return stats
+
+
+def summarize_daily(rows):
+    """작업 로그 행을 (테이블, 날짜)별로 집계 (DatabaseManager.rollup_task_log와 같은 규칙)
+
+    바이트 수는 성공한 행의 BYTES(없으면 파일 크기)를, 소요 시간은 END_TS - START_TS
+    (없으면 문자열 시각 차이, 음수는 0)를 사용한다.
+
+    Args:
+        rows (iterable): (TABLE_NM, START_TIME, END_TIME, ERROR_MSG, BYTES, START_TS, END_TS, 파일 크기) 목록
+
+    Returns:
+        dict: {(테이블명, 'YYYY-MM-DD'): [작업 수, 실패 수, 바이트, 총 소요(초), 최대 소요(초)]}
+    """
+    daily = {}
+    for table_nm, start_time, end_time, error_msg, size, start_ts, end_ts, file_size in rows:
+        if start_ts is not None and end_ts is not None:
+            duration = end_ts - start_ts
+        else:
+            try:
+                duration = (datetime.datetime.strptime(end_time, '%Y-%m-%d %H:%M:%S')
+                            - datetime.datetime.strptime(start_time, '%Y-%m-%d %H:%M:%S')).total_seconds()
+            except (TypeError, ValueError):
+                duration = 0
+        duration = max(0, duration)
+
+        item = daily.setdefault((table_nm, start_time[:10] if start_time else None), [0, 0, 0, 0.0, 0.0])
+        item[0] += 1
+        if error_msg is not None:
+            item[1] += 1
+        else:
+            item[2] += size if size is not None else (file_size or 0)
+        item[3] += duration
+        item[4] = max(item[4], duration)
+    return daily
+
+
+class StateStore(abc.ABC):
+    """상태 저장소 인터페이스
+
+    컨트롤러, SchedulerManager, ShardCoordinator, RetentionManager는 이 인터페이스의
+    메서드만 사용한다. 구현은 다음과 같다.
+
+    - DatabaseManager: SQLite 파일 (기본)
+    - MemoryStateStore: 프로세스 메모리 (벤치마크/디스크 없는 실행용)
+    - SqlStateStore: DB-API 2.0 연결을 쓰는 공유 SQL 서버 (테스트에서는 sqlite3로 대체 가능)
+
+    반환 형식(튜플 순서, Future 여부)은 DatabaseManager를 기준으로 한다.
+    """
+
+    # 화면에서 조회 가능한 관리 테이블
+    BROWSABLE_TABLES = ('TABLE_INFO', 'FILE_INFO', 'AUTO_CONFIG', 'COL_MAPPING', 'TASK_LOG', 'TASK_LOG_DAILY')
+
+    # TASK_LOG 월별 분할 (SQLite 파일 저장소 전용, 다른 저장소는 None)
+    task_log_partitions = None
+
+    # ============================================================
+    # 연결/수명
+    # ============================================================
+    @abc.abstractmethod
+    def test_connection(self):
+        """저장소 연결 테스트
+
+        Returns:
+            tuple: (연결 성공 여부, 오류 메시지)
+        """
+
+    def flush_writes(self, timeout=None):
+        """대기 중인 비동기 쓰기가 모두 커밋될 때까지 대기 (바로 쓰는 저장소는 즉시 True)"""
+        return True
+
+    def close_all_connections(self):
+        """모든 연결 닫기 (애플리케이션 종료 시 호출)"""
+
+    # ============================================================
+    # 테이블 정보/자동화 설정/컬럼 매핑
+    # ============================================================
+    @abc.abstractmethod
+    def get_table_info_list(self):
+        """TABLE_INFO 테이블명 목록"""
+
+    @abc.abstractmethod
+    def get_table_details(self, table_nm):
+        """(TABLE_NM, TABLE_DC, TABLE_OWNERSHIP) (없으면 None)"""
+
+    @abc.abstractmethod
+    def save_table_info(self, table_nm, table_dc, table_ownership):
+        """테이블 정보 저장 (없으면 생성, 있으면 변경)"""
+
+    @abc.abstractmethod
+    def delete_table_info(self, table_nm):
+        """테이블 정보 삭제"""
+
+    @abc.abstractmethod
+    def get_auto_config_list(self):
+        """자동화 설정 테이블명 목록"""
+
+    @abc.abstractmethod
+    def get_auto_config_details(self, table_nm):
+        """(SRC_PATH, DEST_PATH, AUTO_INTERVAL, USE_YN) (없으면 None)"""
+
+    @abc.abstractmethod
+    def save_auto_config(self, table_nm, src_path, dest_path, auto_interval, use_yn):
+        """자동화 설정 저장 (없으면 생성, 있으면 변경, LAST_TIMESTAMP 유지)"""
+
+    @abc.abstractmethod
+    def delete_auto_config(self, table_nm):
+        """자동화 설정 삭제"""
+
+    @abc.abstractmethod
+    def update_auto_config_timestamp(self, table_nm):
+        """마지막 실행 시간을 현재 시각으로 변경"""
+
+    @abc.abstractmethod
+    def get_all_auto_configs(self):
+        """주기가 설정된 자동화 설정 [(table_nm, dest_path, auto_interval, last_timestamp), ...]"""
+
+    @abc.abstractmethod
+    def get_col_mapping_tables(self):
+        """컬럼 매핑이 설정된 테이블명 목록"""
+
+    @abc.abstractmethod
+    def get_column_mappings(self, table_nm):
+        """[(DB_COL_NM, XML_COL_NM), ...]"""
+
+    @abc.abstractmethod
+    def save_column_mappings(self, table_nm, mappings):
+        """테이블의 컬럼 매핑 교체 (mappings: [(DB 컬럼, XML 컬럼, 중복 확인 여부), ...])"""
+
+    @abc.abstractmethod
+    def delete_column_mappings(self, table_nm):
+        """테이블의 컬럼 매핑 삭제"""
+
+    # ============================================================
+    # 파일 정보/전송 상태
+    # ============================================================
+    @abc.abstractmethod
+    def register_files(self, table_nm, file_names):
+        """파일을 DISCOVERED 상태로 등록 (이미 있으면 처음 상태로 초기화)
+
+        Returns:
+            int: 영향받은 행 수 (중복 파일명은 한 번만 셈)
+        """
+
+    @abc.abstractmethod
+    def find_new_files(self, file_names):
+        """등록되지 않은 파일명 목록 (정렬)"""
+
+    @abc.abstractmethod
+    def get_file_watermark(self, table_nm):
+        """'테이블명_숫자...' 형식으로 등록된 파일 중 가장 큰 파일명 (없으면 None)"""
+
+    @abc.abstractmethod
+    def get_existing_files(self, table_nm):
+        """테이블에 등록된 파일명 집합"""
+
+    @abc.abstractmethod
+    def get_pending_files_count(self, table_nm):
+        """COPY_YN = 'N'인 파일 수"""
+
+    @abc.abstractmethod
+    def get_pending_transfers(self, table_nm):
+        """사용 중인 자동화 설정의 미완료 파일 (파일명 순)
+
+        Returns:
+            list: [(파일명, 전송 상태, 전송 위치, 파일 크기, 재시도 횟수), ...]
+        """
+
+    @abc.abstractmethod
+    def get_files_to_delete(self, table_nm):
+        """복사 완료 후 삭제되지 않은 파일 [(파일명, 목적지 경로), ...]"""
+
+    @abc.abstractmethod
+    def update_transfer_state(self, file_name, state, byte_offset=0, file_size=None, wait=True):
+        """파일 전송 상태 전이 (커밋 후 반환)
+
+        COPY_YN은 VERIFIED일 때만 'Y', FAILED이면 RETRY_CNT 1 증가,
+        file_size가 None이면 기존 크기를 유지한다. wait가 False이면 커밋을 기다리지 않아도 된다
+        (주기적 전송 위치 기록용, 반환값은 사용하지 않음).
+
+        Returns:
+            int: 영향받은 행 수
+        """
+
+    @abc.abstractmethod
+    def update_files_transfer_state(self, file_names, state):
+        """여러 파일의 전송 상태 전이 (전송 위치 0, 파일 크기 유지, 커밋 후 반환)
+
+        Returns:
+            int: 영향받은 행 수
+        """
+
+    @abc.abstractmethod
+    def update_file_status(self, file_name, copy_status='Y'):
+        """COPY_YN 변경
+
+        Returns:
+            Future: 커밋 후 영향받은 행 수
+        """
+
+    @abc.abstractmethod
+    def update_file_delete_status(self, file_name):
+        """DELETE_YN = 'Y'로 변경"""
+
+    # ============================================================
+    # 작업 로그
+    # ============================================================
+    @abc.abstractmethod
+    def log_task(self, table_nm, file_name, start_time, error_msg=None, metrics=None):
+        """작업 로그 저장 (metrics 키는 DatabaseManager.log_task 참고)
+
+        Returns:
+            Future: 커밋 후 영향받은 행 수
+        """
+
+    @abc.abstractmethod
+    def get_transfer_stats(self, start_ts=None, end_ts=None, table_nm=None):
+        """테이블별 전송 처리량 및 소요 시간 백분위수 (dict 목록, DatabaseManager.get_transfer_stats 참고)"""
+
+    @abc.abstractmethod
+    def search_task_log(self, text, start_ts=None, end_ts=None, table_nm=None, limit=100):
+        """작업 로그 파일명/오류 메시지 검색
+
+        Returns:
+            list: dict 목록 (table_nm, file_nm, start_time, end_time, error_msg)
+        """
+
+    @abc.abstractmethod
+    def search_files(self, text, table_nm=None, limit=100):
+        """등록 파일명 검색
+
+        Returns:
+            list: dict 목록 (table_nm, file_nm, copy_yn, transfer_state)
+        """
+
+    @abc.abstractmethod
+    def rollup_task_log(self, batch_size=1000):
+        """집계되지 않은 작업 로그를 TASK_LOG_DAILY에 누적 (중복 집계 없음)
+
+        Returns:
+            int: 집계한 행 수
+        """
+
+    @abc.abstractmethod
+    def purge_task_log(self, before_time, batch_size=1000):
+        """집계 완료된 작업 로그 중 before_time('YYYY-MM-DD HH:MM:SS') 이전 행 삭제 (한 배치)
+
+        Returns:
+            int: 삭제한 행 수
+        """
+
+    @abc.abstractmethod
+    def get_task_log_daily(self, table_nm=None, start_date=None, end_date=None):
+        """[(테이블명, 날짜, 작업 수, 실패 수, 바이트, 총 소요(초), 최대 소요(초)), ...]"""
+
+    def is_incremental_vacuum(self):
+        """공간 반환 준비 여부 (파일 공간 반환이 없는 저장소는 항상 True, incremental_vacuum은 0)"""
+        return True
+
+    def enable_incremental_vacuum(self):
+        """공간 반환 방식 전환 (파일 공간 반환이 없는 저장소는 아무 작업도 하지 않음)"""
+
+    def incremental_vacuum(self, pages):
+        """빈 공간 반환
+
+        Returns:
+            int: 반환한 페이지 수
+        """
+        return 0
+
+    # ============================================================
+    # 다중 인스턴스 하트비트/테이블 임대
+    # ============================================================
+    @abc.abstractmethod
+    def update_instance_heartbeat(self, instance_id, now):
+        """인스턴스 하트비트 갱신"""
+
+    @abc.abstractmethod
+    def get_live_instances(self, min_heartbeat):
+        """하트비트가 min_heartbeat 이후인 인스턴스 ID 목록 (정렬)"""
+
+    @abc.abstractmethod
+    def delete_stale_instances(self, min_heartbeat):
+        """하트비트가 끊긴 인스턴스 삭제"""
+
+    @abc.abstractmethod
+    def delete_instance(self, instance_id):
+        """인스턴스 등록 해제"""
+
+    @abc.abstractmethod
+    def try_acquire_table_lease(self, table_nm, owner_id, now, lease_ttl):
+        """비어 있거나, 자신이 소유했거나, 만료된 임대만 획득/갱신
+
+        Returns:
+            bool: 소유권 획득 여부
+        """
+
+    @abc.abstractmethod
+    def release_table_lease(self, table_nm, owner_id):
+        """테이블 소유권 반납"""
+
+    @abc.abstractmethod
+    def release_all_table_leases(self, owner_id):
+        """인스턴스가 가진 모든 테이블 소유권 반납"""
+
+    @abc.abstractmethod
+    def get_owned_tables(self, owner_id, now):
+        """유효한 임대를 가진 테이블명 집합"""
+
+    # ============================================================
+    # 관리 테이블 조회
+    # ============================================================
+    @abc.abstractmethod
+    def get_table_list(self):
+        """조회 가능한 테이블명 목록"""
+
+    @abc.abstractmethod
+    def get_table_columns(self, table_name):
+        """[(컬럼명, 타입), ...]"""
+
+    @abc.abstractmethod
+    def get_table_page(self, table_name, cursor=None, page_size=100, sort_column=None,
+                       descending=False, filters=None):
+        """관리 테이블 한 페이지 조회
+
+        커서 형식은 구현마다 다르며 호출자는 이전 페이지가 반환한 값을 그대로 넘긴다.
+
+        Returns:
+            tuple: (행 목록, 다음 페이지 커서 (마지막 페이지면 None))
+        """
+
+    @abc.abstractmethod
+    def count_table_rows(self, table_name):
+        """관리 테이블 전체 행 수"""
+
+    @abc.abstractmethod
+    def iter_table_rows(self, table_name, batch_size=1000):
+        """관리 테이블 전체 행을 배치(행 목록) 단위로 반환하는 제너레이터"""
+
+    def get_table_data_sample(self, table_name, limit=10):
+        """관리 테이블 데이터 샘플 (조회할 수 없는 테이블이면 빈 목록)"""
+        if table_name not in self.BROWSABLE_TABLES:
+            return []
+        try:
+            rows, _ = self.get_table_page(table_name, page_size=limit)
+            return rows
+        except Exception as e:
+            print(f"테이블 {table_name} 데이터 조회 오류: {e}")
+            return []
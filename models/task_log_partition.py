@@ -0,0 +1,306 @@
+import os
+import re
+import gzip
+import stat
+import time
+import shutil
+import sqlite3
+import datetime
+import logging
+import threading
+from contextlib import contextmanager
+
+
+class TaskLogPartitions:
+    """TASK_LOG 월별 분할 관리 클래스
+
+    새 작업 로그는 월별 파일(<DB명>_task_log_YYYYMM.db)의 TASK_LOG에 기록한다.
+    쓰는 중인 월(현재 월과 아직 닫지 않은 이전 월)만 각 연결에 ATTACH해 두고(TL_YYYYMM),
+    지난 월은 조회할 때만 ATTACH한다(TLQ_YYYYMM). 집계가 끝난 지난 월은 닫아서
+    (롤백 저널 모드, 읽기 전용 파일) 보존 기간이 지나면 삭제하거나 압축 보관한다.
+    분할 사용 전의 로그는 main.TASK_LOG에 남는다.
+    """
+
+    HOT_PREFIX = 'TL_'
+    QUERY_PREFIX = 'TLQ_'
+
+    def __init__(self, db_manager, partition_dir=None, archive_dir=None):
+        """월별 분할 관리자 초기화
+
+        Args:
+            db_manager: 데이터베이스 매니저 객체
+            partition_dir (str, optional): 월별 파일 디렉토리. None이면 DB 파일과 같은 디렉토리.
+            archive_dir (str, optional): 보존 기간이 지난 월의 압축 보관 디렉토리. None이면 삭제.
+        """
+        self.db_manager = db_manager
+        db_path = os.path.abspath(db_manager.db_path)
+        self.partition_dir = partition_dir or os.path.dirname(db_path)
+        self.archive_dir = archive_dir
+        self.base_name = os.path.splitext(os.path.basename(db_path))[0]
+        self._pattern = re.compile(rf'^{re.escape(self.base_name)}_task_log_(\d{{6}})\.db$')
+
+        # 쓰는 중인 월 목록이 바뀔 때 증가 (연결별 ATTACH 재동기화 기준)
+        self.generation = 0
+        self._hot_months = None
+        self._current_month = None
+        # 닫는 중인 월 (ATTACH 해제 대기, 쓰는 중인 월에서 제외)
+        self._closing = set()
+        self._lock = threading.RLock()
+
+        self.logger = logging.getLogger('TaskLogPartitions')
+
+    # ============================================================
+    # 월별 파일
+    # ============================================================
+    @staticmethod
+    def month_key(ts=None):
+        """epoch 초가 속한 월 ('YYYYMM', None이면 현재)"""
+        return datetime.datetime.fromtimestamp(time.time() if ts is None else ts).strftime('%Y%m')
+
+    def schema_name(self, month, prefix=HOT_PREFIX):
+        """ATTACH 스키마명"""
+        return f"{prefix}{month}"
+
+    def partition_path(self, month):
+        """월별 파일 경로"""
+        return os.path.join(self.partition_dir, f"{self.base_name}_task_log_{month}.db")
+
+    def list_months(self):
+        """월별 파일이 있는 월 목록 (오래된 순)"""
+        if not os.path.isdir(self.partition_dir):
+            return []
+        months = []
+        for name in os.listdir(self.partition_dir):
+            match = self._pattern.match(name)
+            if match:
+                months.append(match.group(1))
+        return sorted(months)
+
+    def is_closed(self, month):
+        """닫힌 월인지 여부 (읽기 전용 파일)"""
+        return not os.stat(self.partition_path(month)).st_mode & stat.S_IWUSR
+
+    def hot_months(self):
+        """쓰는 중인 월 목록 (각 연결에 ATTACH 유지)"""
+        with self._lock:
+            if self._hot_months is None:
+                self._hot_months = [m for m in self.list_months()
+                                    if m not in self._closing and not self.is_closed(m)]
+            return list(self._hot_months)
+
+    def current_schema(self):
+        """현재 월 스키마명 (월이 바뀌면 새 파일 생성)"""
+        month = self.month_key()
+        if month != self._current_month:
+            with self._lock:
+                if month != self._current_month:
+                    self._create_partition(month)
+                    self._current_month = month
+                    self._invalidate()
+        return self.schema_name(month)
+
+    def _invalidate(self):
+        """쓰는 중인 월 목록 변경 (_lock 보유 상태에서 호출)"""
+        self._hot_months = None
+        self.generation += 1
+
+    def _create_partition(self, month):
+        """월별 파일 생성 (main.TASK_LOG와 같은 컬럼, 인덱스, 검색 인덱스)"""
+        path = self.partition_path(month)
+        if os.path.exists(path):
+            return
+
+        os.makedirs(self.partition_dir, exist_ok=True)
+        column_defs = []
+        for _, name, col_type, notnull, default, _ in self.db_manager.execute_query("PRAGMA main.table_info(TASK_LOG)"):
+            column_def = f"{name} {col_type}"
+            if notnull:
+                column_def += " NOT NULL"
+            if default is not None:
+                column_def += f" DEFAULT {default}"
+            column_defs.append(column_def)
+
+        conn = sqlite3.connect(path)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            cursor = conn.cursor()
+            cursor.execute(f"CREATE TABLE IF NOT EXISTS TASK_LOG ({', '.join(column_defs)})")
+            cursor.execute("CREATE INDEX IF NOT EXISTS IDX_TASK_LOG_TABLE_TIME ON TASK_LOG (TABLE_NM, START_TIME)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS IDX_TASK_LOG_START_TS ON TASK_LOG (START_TS)")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS IDX_TASK_LOG_PENDING_ROLLUP "
+                "ON TASK_LOG (ROLLED_UP) WHERE ROLLED_UP = 0"
+            )
+            self.db_manager._create_search_index(cursor, 'TASK_LOG_FTS', 'TASK_LOG', ('FILE_NM', 'ERROR_MSG'))
+            conn.commit()
+        finally:
+            conn.close()
+        self.logger.info(f"작업 로그 월별 파일 생성: {path}")
+
+    # ============================================================
+    # 연결별 ATTACH
+    # ============================================================
+    def sync_connection(self, conn):
+        """쓰는 중인 월을 연결에 ATTACH하고 닫힌 월은 DETACH
+
+        Returns:
+            bool: 동기화 완료 여부 (사용 중이라 DETACH하지 못하면 False, 다음 호출 시 재시도)
+        """
+        hot = {self.schema_name(m): self.partition_path(m) for m in self.hot_months()}
+        attached = {row[1] for row in conn.execute("PRAGMA database_list")
+                    if row[1].startswith(self.HOT_PREFIX)}
+
+        synced = True
+        for schema in attached - set(hot):
+            try:
+                conn.execute(f"DETACH DATABASE {schema}")
+            except sqlite3.OperationalError:
+                synced = False
+        for schema in set(hot) - attached:
+            conn.execute(f"ATTACH DATABASE ? AS {schema}", (hot[schema],))
+        return synced
+
+    @contextmanager
+    def attached_range(self, conn, start_ts=None, end_ts=None):
+        """기간에 해당하는 월을 연결에 ATTACH한 상태로 실행 (쓰는 중인 월은 기존 ATTACH 사용)
+
+        Args:
+            conn: 데이터베이스 연결 (sync_connection 완료 상태)
+            start_ts (float, optional): 시작 epoch 초. None이면 처음부터.
+            end_ts (float, optional): 종료 epoch 초. None이면 현재까지.
+
+        Yields:
+            list: 조회할 스키마명 목록 (오래된 순)
+
+        Raises:
+            ValueError: ATTACH 가능한 데이터베이스 수를 넘는 경우
+        """
+        first = self.month_key(start_ts) if start_ts is not None else None
+        last = self.month_key(end_ts) if end_ts is not None else None
+        months = [m for m in self.list_months()
+                  if (first is None or m >= first) and (last is None or m <= last)]
+
+        hot = set(self.hot_months())
+        cold = [m for m in months if m not in hot]
+        attached = {row[1] for row in conn.execute("PRAGMA database_list")}
+        limit = conn.getlimit(sqlite3.SQLITE_LIMIT_ATTACHED) if hasattr(conn, 'getlimit') else 10
+        if len(attached) - 2 + len(cold) > limit:
+            raise ValueError(f"조회 기간의 월이 너무 많습니다 ({len(months)}개월). 기간을 줄여주세요.")
+
+        schemas = []
+        temporary = []
+        try:
+            for month in months:
+                if month in hot:
+                    schemas.append(self.schema_name(month))
+                    continue
+                schema = self.schema_name(month, self.QUERY_PREFIX)
+                if schema not in attached:
+                    conn.execute(f"ATTACH DATABASE ? AS {schema}", (self.partition_path(month),))
+                    temporary.append(schema)
+                schemas.append(schema)
+            yield schemas
+        finally:
+            for schema in temporary:
+                try:
+                    conn.execute(f"DETACH DATABASE {schema}")
+                except sqlite3.OperationalError as e:
+                    self.logger.warning(f"{schema} DETACH 실패: {e}")
+
+    # ============================================================
+    # 월 닫기/만료
+    # ============================================================
+    def close_finished_months(self):
+        """지난 월 닫기 (체크포인트 후 롤백 저널 모드, 읽기 전용 파일)
+
+        집계(rollup)가 끝난 뒤 호출한다. 다른 연결이 아직 ATTACH하고 있으면
+        다음 호출 때 다시 시도한다.
+
+        Returns:
+            int: 닫은 월 수
+        """
+        current = self.month_key()
+        closed = 0
+        for month in self.list_months():
+            if month >= current or self.is_closed(month):
+                continue
+
+            # 쓰는 중인 월 목록에서 제외 (각 연결이 다음 조회 시 DETACH)
+            with self._lock:
+                if month not in self._closing:
+                    self._closing.add(month)
+                    self._invalidate()
+            self.db_manager.get_connection()
+
+            path = self.partition_path(month)
+            conn = sqlite3.connect(path, timeout=0.1)
+            try:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                mode = conn.execute("PRAGMA journal_mode=DELETE").fetchone()[0]
+            except sqlite3.OperationalError:
+                mode = None
+            finally:
+                conn.close()
+
+            if mode != 'delete':
+                self.logger.info(f"{month} 작업 로그가 사용 중이라 다음에 닫습니다.")
+                continue
+
+            os.chmod(path, stat.S_IREAD | stat.S_IRGRP | stat.S_IROTH)
+            with self._lock:
+                self._closing.discard(month)
+            closed += 1
+            self.logger.info(f"{month} 작업 로그를 닫았습니다. (읽기 전용)")
+        return closed
+
+    def expire_months(self, before_time):
+        """보존 기간이 지난 닫힌 월 삭제 (archive_dir이 있으면 gzip 압축 보관)
+
+        Args:
+            before_time (datetime.datetime): 이 시각 이전에 끝난 월 만료
+
+        Returns:
+            int: 만료한 월 수
+        """
+        # 월의 마지막 날도 기준 이전이어야 함
+        cutoff = before_time.strftime('%Y%m')
+        expired = 0
+        for month in self.list_months():
+            if month >= cutoff or not self.is_closed(month):
+                continue
+            path = self.partition_path(month)
+            if self.archive_dir:
+                self.archive_month(month)
+            else:
+                os.chmod(path, stat.S_IREAD | stat.S_IWRITE)
+                os.remove(path)
+                self.logger.info(f"{month} 작업 로그 파일을 삭제했습니다.")
+            expired += 1
+        return expired
+
+    def archive_month(self, month):
+        """닫힌 월 파일을 archive_dir에 gzip으로 압축 보관 후 원본 삭제
+
+        Returns:
+            str: 압축 파일 경로
+
+        Raises:
+            ValueError: 닫히지 않은 월이거나 archive_dir이 없는 경우
+        """
+        if not self.archive_dir:
+            raise ValueError("압축 보관 디렉토리가 설정되지 않았습니다.")
+        if not self.is_closed(month):
+            raise ValueError(f"{month} 작업 로그가 아직 닫히지 않았습니다.")
+
+        path = self.partition_path(month)
+        os.makedirs(self.archive_dir, exist_ok=True)
+        archive_path = os.path.join(self.archive_dir, os.path.basename(path) + '.gz')
+        part_path = archive_path + '.part'
+        with open(path, 'rb') as src, gzip.open(part_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        os.replace(part_path, archive_path)
+
+        os.chmod(path, stat.S_IREAD | stat.S_IWRITE)
+        os.remove(path)
+        self.logger.info(f"{month} 작업 로그를 압축 보관했습니다: {archive_path}")
+        return archive_path
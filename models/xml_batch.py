@@ -0,0 +1,477 @@
+import io
+import os
+import csv
+import glob
+import time
+import queue
+import shutil
+import logging
+import multiprocessing
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from models.data_processor import DataProcessor
+
+
+# 작업 프로세스 전역 상태 (_init_worker에서 설정)
+_worker_cancel_event = None
+_worker_progress_queue = None
+
+
+def _init_worker(cancel_event, progress_queue):
+    """작업 프로세스 초기화 (중단 이벤트와 진행률 큐 설정)"""
+    global _worker_cancel_event, _worker_progress_queue
+    _worker_cancel_event = cancel_event
+    _worker_progress_queue = progress_queue
+
+
+def _convert_worker(index, xml_path, csv_path, xml_backend):
+    """작업 프로세스에서 XML 파일 하나를 CSV로 변환
+
+    Args:
+        index (int): 파일 순번
+        xml_path (str): XML 파일 경로
+        csv_path (str): 저장할 CSV 파일 경로
+        xml_backend (str): XML 파서 백엔드
+
+    Returns:
+        dict: 변환 결과 (status, records, columns, elapsed)
+    """
+    started = time.perf_counter()
+
+    def report(current, total, progress):
+        _worker_progress_queue.put((index, progress))
+
+    result = DataProcessor(xml_backend=xml_backend).convert_xml_to_csv(
+        xml_path,
+        csv_path,
+        progress_callback=report,
+        is_cancelled=_worker_cancel_event.is_set
+    )
+    elapsed = time.perf_counter() - started
+
+    if result is None:
+        return {'status': '중단', 'records': 0, 'columns': 0, 'elapsed': elapsed}
+    columns, count, _ = result
+    return {'status': '완료', 'records': count, 'columns': len(columns), 'elapsed': elapsed}
+
+
+def _discover_shard_worker(index, xml_path, shard, xml_backend):
+    """작업 프로세스에서 구간 하나의 컬럼 목록 수집
+
+    Returns:
+        tuple: (정렬된 컬럼 목록, 레코드 수). 중단되면 None.
+    """
+    def report(current, total, progress):
+        _worker_progress_queue.put((index, progress))
+
+    return DataProcessor(xml_backend=xml_backend).discover_xml_columns(
+        xml_path, report, _worker_cancel_event.is_set, shard
+    )
+
+
+def _convert_shard_worker(index, xml_path, part_path, columns, shard, preview_count, xml_backend):
+    """작업 프로세스에서 구간 하나를 헤더 없는 CSV 조각 파일로 변환
+
+    Returns:
+        tuple: (컬럼 목록, 레코드 수, 미리보기 행 목록). 중단되면 None.
+    """
+    def report(current, total, progress):
+        _worker_progress_queue.put((index, progress))
+
+    return DataProcessor(xml_backend=xml_backend).convert_xml_to_csv(
+        xml_path,
+        part_path,
+        columns=columns,
+        progress_callback=report,
+        is_cancelled=_worker_cancel_event.is_set,
+        preview_count=preview_count,
+        shard=shard,
+        header=False
+    )
+
+
+class XmlBatchConverter:
+    """여러 XML 파일을 프로세스 풀에서 동시에 CSV로 변환하는 클래스
+
+    ElementTree 파싱은 GIL에 묶이므로 파일 단위로 작업 프로세스에 나누어 CPU 코어 수만큼
+    동시에 변환한다. 각 파일은 DataProcessor.convert_xml_to_csv로 변환하므로 결과는
+    한 파일씩 변환한 것과 같다. 중단 요청 시 대기 중인 파일은 시작하지 않고, 변환 중인
+    파일은 다음 배치 경계에서 멈춘다 (임시 파일만 지우고 CSV는 남기지 않음).
+    """
+
+    # 결과 상태
+    STATUS_DONE = '완료'
+    STATUS_ERROR = '오류'
+    STATUS_CANCELLED = '중단'
+
+    def __init__(self, max_workers=None, callback=None, xml_backend=None):
+        """일괄 변환기 초기화
+
+        Args:
+            max_workers (int, optional): 작업 프로세스 수. 기본값은 CPU 코어 수.
+            callback (function, optional): 로그 메시지 콜백. Defaults to None.
+            xml_backend (str, optional): XML 파서 백엔드 ('lxml' 또는 'etree'). 기본값은 DataProcessor 기본값.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.callback = callback
+        self.xml_backend = DataProcessor(xml_backend=xml_backend).xml_backend
+
+        self._context = multiprocessing.get_context()
+        self._cancel_event = self._context.Event()
+
+        self.logger = logging.getLogger('XmlBatchConverter')
+
+    def log(self, message):
+        """로그 메시지 출력"""
+        self.logger.info(message)
+        if self.callback:
+            self.callback(message)
+
+    @staticmethod
+    def collect_files(source):
+        """변환 대상 XML 파일 목록 수집
+
+        Args:
+            source (str): 디렉토리(바로 아래 *.xml), glob 패턴 또는 파일 경로
+
+        Returns:
+            list: 정렬된 XML 파일 경로 목록
+        """
+        if os.path.isdir(source):
+            pattern = os.path.join(source, '*.xml')
+        elif glob.has_magic(source):
+            pattern = source
+        else:
+            return [source] if os.path.isfile(source) else []
+        return sorted(path for path in glob.glob(pattern) if os.path.isfile(path))
+
+    def cancel(self):
+        """변환 중단 요청"""
+        self._cancel_event.set()
+
+    def is_cancelled(self):
+        """중단 요청 여부 반환"""
+        return self._cancel_event.is_set()
+
+    def convert(self, xml_files, save_path, file_callback=None, progress_callback=None):
+        """XML 파일 목록을 CSV로 일괄 변환
+
+        Args:
+            xml_files (list): XML 파일 경로 목록
+            save_path (str): CSV 저장 디렉토리
+            file_callback (function, optional): 파일 상태 콜백 (결과 dict). 진행 중에는
+                status가 '변환중'이고 progress(0-100)가 포함된다. Defaults to None.
+            progress_callback (function, optional): 전체 진행 콜백 (끝난 파일 수, 전체 파일 수). Defaults to None.
+
+        Returns:
+            dict: 요약 (total, succeeded, failed, cancelled, records, elapsed, results)
+        """
+        self._cancel_event.clear()
+        started = time.perf_counter()
+        os.makedirs(save_path, exist_ok=True)
+
+        results = []
+        used_names = set()
+        for xml_path in xml_files:
+            csv_name = os.path.splitext(os.path.basename(xml_path))[0] + '.csv'
+            result = {
+                'xml_path': xml_path,
+                'csv_path': os.path.join(save_path, csv_name),
+                'status': None, 'records': 0, 'columns': 0, 'elapsed': 0.0, 'error': None
+            }
+            # 다른 디렉토리의 같은 파일명은 서로 덮어쓰므로 뒤의 파일은 변환하지 않음
+            if csv_name.lower() in used_names:
+                result['status'] = self.STATUS_ERROR
+                result['error'] = f"출력 파일명 중복: {csv_name}"
+            used_names.add(csv_name.lower())
+            results.append(result)
+
+        total = len(results)
+        finished = 0
+
+        def finish(result):
+            nonlocal finished
+            finished += 1
+            if result['status'] == self.STATUS_DONE:
+                self.log(f"[{finished}/{total}] 완료: {os.path.basename(result['xml_path'])} "
+                         f"({result['records']}건, {result['elapsed']:.1f}초)")
+            elif result['status'] == self.STATUS_ERROR:
+                self.log(f"[{finished}/{total}] 오류: {os.path.basename(result['xml_path'])} - {result['error']}")
+            else:
+                self.log(f"[{finished}/{total}] 중단: {os.path.basename(result['xml_path'])}")
+            if file_callback:
+                file_callback(result)
+            if progress_callback:
+                progress_callback(finished, total)
+
+        pending = [index for index, result in enumerate(results) if result['status'] is None]
+        for result in results:
+            if result['status'] is not None:
+                finish(result)
+
+        workers = min(self.max_workers, len(pending))
+        if workers:
+            self.log(f"XML 일괄 변환 시작: {len(pending)}개 파일, 작업 프로세스 {workers}개, 파서 {self.xml_backend}")
+            self._run_pool(workers, pending, results, finish, file_callback)
+
+        summary = {
+            'total': total,
+            'succeeded': sum(1 for result in results if result['status'] == self.STATUS_DONE),
+            'failed': sum(1 for result in results if result['status'] == self.STATUS_ERROR),
+            'cancelled': sum(1 for result in results if result['status'] == self.STATUS_CANCELLED),
+            'records': sum(result['records'] for result in results),
+            'elapsed': time.perf_counter() - started,
+            'results': results
+        }
+        self.log(
+            f"XML 일괄 변환 종료: 전체 {summary['total']}개, 성공 {summary['succeeded']}개, "
+            f"실패 {summary['failed']}개, 중단 {summary['cancelled']}개, "
+            f"레코드 {summary['records']}건, {summary['elapsed']:.1f}초"
+        )
+        return summary
+
+    def _run_pool(self, workers, pending, results, finish, file_callback):
+        """프로세스 풀에서 변환 실행 및 진행률/결과 수집 (내부 함수)"""
+        progress_queue = self._context.Queue()
+
+        def drain_progress():
+            # 작업 프로세스가 보낸 파일별 진행률 전달
+            while True:
+                try:
+                    index, progress = progress_queue.get_nowait()
+                except queue.Empty:
+                    return
+                if file_callback and results[index]['status'] is None:
+                    file_callback(dict(results[index], status='변환중', progress=progress))
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=self._context,
+                                 initializer=_init_worker,
+                                 initargs=(self._cancel_event, progress_queue)) as executor:
+            futures = {
+                executor.submit(_convert_worker, index, results[index]['xml_path'],
+                                results[index]['csv_path'], self.xml_backend): index
+                for index in pending
+            }
+            remaining = set(futures)
+            while remaining:
+                done, remaining = wait(remaining, timeout=0.2, return_when=FIRST_COMPLETED)
+                drain_progress()
+
+                # 중단 요청 시 아직 시작하지 않은 파일 취소
+                if self._cancel_event.is_set():
+                    cancelled = {future for future in remaining if future.cancel()}
+                    remaining -= cancelled
+                    done |= cancelled
+
+                for future in done:
+                    result = results[futures[future]]
+                    if future.cancelled():
+                        result['status'] = self.STATUS_CANCELLED
+                    elif future.exception() is not None:
+                        result['status'] = self.STATUS_ERROR
+                        result['error'] = str(future.exception())
+                    else:
+                        result.update(future.result())
+                    finish(result)
+            drain_progress()
+
+        progress_queue.close()
+
+
+class ShardedXmlConverter:
+    """큰 XML 파일 하나를 바이트 구간으로 나누어 여러 프로세스에서 CSV로 변환하는 클래스
+
+    DataProcessor.split_xml_records로 DATA_RECORD 경계에서 파일을 나누고, 1차 패스에서
+    구간별 컬럼을 수집해 전체 컬럼 목록(합집합)을 정한 뒤 2차 패스에서 구간별 CSV 조각을
+    만든다. 헤더와 조각을 구간 순서대로 이어 붙이므로 결과는 convert_xml_to_csv와 같다.
+    분할할 수 없거나 구간 파싱이 실패하면 한 프로세스에서 변환한다.
+    """
+
+    def __init__(self, shard_count=None, callback=None, xml_backend=None):
+        """구간 분할 변환기 초기화
+
+        Args:
+            shard_count (int, optional): 구간(작업 프로세스) 수. 기본값은 CPU 코어 수.
+            callback (function, optional): 로그 메시지 콜백. Defaults to None.
+            xml_backend (str, optional): XML 파서 백엔드 ('lxml' 또는 'etree'). 기본값은 DataProcessor 기본값.
+        """
+        self.shard_count = shard_count or os.cpu_count() or 1
+        self.callback = callback
+        self.xml_backend = DataProcessor(xml_backend=xml_backend).xml_backend
+
+        self._context = multiprocessing.get_context()
+        self._cancel_event = self._context.Event()
+
+        self.logger = logging.getLogger('ShardedXmlConverter')
+
+    def log(self, message):
+        """로그 메시지 출력"""
+        self.logger.info(message)
+        if self.callback:
+            self.callback(message)
+
+    def cancel(self):
+        """변환 중단 요청"""
+        self._cancel_event.set()
+
+    def is_cancelled(self):
+        """중단 요청 여부 반환"""
+        return self._cancel_event.is_set()
+
+    def convert(self, xml_path, csv_path, progress_callback=None, preview_count=0):
+        """XML 파일을 CSV로 변환
+
+        Args:
+            xml_path (str): XML 파일 경로
+            csv_path (str): 저장할 CSV 파일 경로
+            progress_callback (function, optional): 진행률 콜백 (처리량, 전체량, 진행률). Defaults to None.
+            preview_count (int, optional): 반환할 앞쪽 행 수 (미리보기). Defaults to 0.
+
+        Returns:
+            tuple: (컬럼 목록, 레코드 수, 미리보기 행 목록). 중단되면 None.
+        """
+        self._cancel_event.clear()
+        processor = DataProcessor(xml_backend=self.xml_backend)
+
+        shards = processor.split_xml_records(xml_path, self.shard_count) if self.shard_count > 1 else None
+        if shards and len(shards) > 1:
+            try:
+                return self._convert_shards(xml_path, csv_path, shards, progress_callback, preview_count)
+            except ET.ParseError as e:
+                self.log(f"구간 분할 파싱 실패, 단일 프로세스로 변환합니다: {str(e)}")
+
+        return processor.convert_xml_to_csv(
+            xml_path,
+            csv_path,
+            callback=self.callback,
+            progress_callback=progress_callback,
+            is_cancelled=self.is_cancelled,
+            preview_count=preview_count
+        )
+
+    def _convert_shards(self, xml_path, csv_path, shards, progress_callback, preview_count):
+        """구간별 2단계 변환 후 조각 파일 병합 (내부 함수)"""
+        self.log(f"XML 구간 분할 변환 시작: {len(shards)}개 구간, 파서 {self.xml_backend}")
+        file_size = os.path.getsize(xml_path)
+        shard_sizes = [end - start for _, start, end, _ in shards]
+        part_paths = [f"{csv_path}.shard{index}" for index in range(len(shards))]
+        progress_queue = self._context.Queue()
+
+        try:
+            with ProcessPoolExecutor(max_workers=len(shards), mp_context=self._context,
+                                     initializer=_init_worker,
+                                     initargs=(self._cancel_event, progress_queue)) as executor:
+                # 1차 패스: 구간별 컬럼 수집 후 전체 컬럼 목록 결정
+                discovered = self._run_pass(
+                    executor, progress_queue, 0, shard_sizes, file_size, progress_callback,
+                    [(_discover_shard_worker, index, xml_path, shard, self.xml_backend)
+                     for index, shard in enumerate(shards)]
+                )
+                if discovered is None:
+                    return None
+                all_columns = set()
+                for shard_columns, _ in discovered:
+                    all_columns.update(shard_columns)
+                columns = sorted(all_columns)
+                total_records = sum(count for _, count in discovered)
+                if total_records == 0:
+                    self.log(f"XML 파일에 DATA_RECORD 태그가 없습니다: {xml_path}")
+                    return [], 0, []
+                self.log(f"총 {total_records}개의 DATA_RECORD 태그를 찾았습니다.")
+
+                directory = os.path.dirname(csv_path)
+                if directory and not os.path.exists(directory):
+                    os.makedirs(directory, exist_ok=True)
+                self.log(f"CSV 파일 생성 중: {csv_path}")
+
+                # 2차 패스: 구간별 헤더 없는 CSV 조각 생성
+                converted = self._run_pass(
+                    executor, progress_queue, 1, shard_sizes, file_size, progress_callback,
+                    [(_convert_shard_worker, index, xml_path, part_paths[index], columns, shard,
+                      preview_count, self.xml_backend)
+                     for index, shard in enumerate(shards)]
+                )
+                if converted is None:
+                    return None
+
+            # 헤더 + 조각 파일을 구간 순서대로 병합
+            header = io.StringIO()
+            csv.writer(header).writerow(columns)
+            merge_path = csv_path + '.part'
+            try:
+                with open(merge_path, 'wb') as merged:
+                    merged.write(header.getvalue().encode('utf-8'))
+                    for part_path in part_paths:
+                        if os.path.exists(part_path):
+                            with open(part_path, 'rb') as part:
+                                shutil.copyfileobj(part, merged, 1024 * 1024)
+                os.replace(merge_path, csv_path)
+            finally:
+                if os.path.exists(merge_path):
+                    os.remove(merge_path)
+        finally:
+            progress_queue.close()
+            for part_path in part_paths:
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+
+        preview = []
+        for _, _, shard_preview in converted:
+            preview.extend(shard_preview[:preview_count - len(preview)])
+        count = sum(shard_count for _, shard_count, _ in converted)
+        self.log(f"CSV 파일 저장 완료: {csv_path} (크기: {DataProcessor._format_file_size(csv_path)})")
+        return columns, count, preview
+
+    def _run_pass(self, executor, progress_queue, pass_index, shard_sizes, file_size,
+                  progress_callback, calls):
+        """구간별 작업을 실행하고 구간 순서대로 결과 반환 (내부 함수)
+
+        Returns:
+            list: 구간별 결과. 중단되면 None.
+
+        Raises:
+            Exception: 작업 프로세스에서 발생한 첫 번째 오류
+        """
+        shard_progress = [0.0] * len(shard_sizes)
+        record_bytes = sum(shard_sizes) or 1
+
+        def drain_progress():
+            # 구간 진행률을 바이트 가중 평균으로 합산 (2단계 전체 기준)
+            updated = False
+            while True:
+                try:
+                    index, progress = progress_queue.get_nowait()
+                except queue.Empty:
+                    break
+                shard_progress[index] = progress
+                updated = True
+            if updated and progress_callback:
+                done = sum(size * progress / 100 for size, progress in zip(shard_sizes, shard_progress))
+                progress_callback(
+                    int((pass_index * record_bytes + done) * file_size / record_bytes),
+                    2 * file_size,
+                    (pass_index * 100 + done / record_bytes * 100) / 2
+                )
+
+        futures = [executor.submit(*call) for call in calls]
+        remaining = set(futures)
+        while remaining:
+            done, remaining = wait(remaining, timeout=0.2, return_when=FIRST_COMPLETED)
+            drain_progress()
+
+            # 중단 요청 또는 오류 시 아직 시작하지 않은 구간 취소
+            failed = any(not future.cancelled() and future.exception() is not None for future in done)
+            if failed or self._cancel_event.is_set():
+                remaining -= {future for future in remaining if future.cancel()}
+        drain_progress()
+
+        for future in futures:
+            if not future.cancelled() and future.exception() is not None:
+                raise future.exception()
+        if self._cancel_event.is_set() or any(future.cancelled() for future in futures):
+            return None
+        results = [future.result() for future in futures]
+        if any(result is None for result in results):
+            return None
+        return results
@@ -0,0 +1,162 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from models.database import DatabaseManager
+from models.memory_store import MemoryStateStore
+from models.sql_store import SqlStateStore
+from models.state_store import (
+    FILE_STATE_DISCOVERED, FILE_STATE_STAGED, FILE_STATE_UPLOADING,
+    FILE_STATE_VERIFIED, FILE_STATE_FAILED
+)
+
+
+class StateStoreParityMixin:
+    """세 상태 저장소가 같은 호출에 같은 결과를 반환하는지 확인 (저장소별 하위 클래스에서 실행)"""
+
+    def make_store(self):
+        raise NotImplementedError
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.store = self.make_store()
+
+    def tearDown(self):
+        self.store.close_all_connections()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def pending(self, table_nm):
+        self.store.flush_writes()
+        return [tuple(row) for row in self.store.get_pending_transfers(table_nm)]
+
+    # ============================================================
+    # 파일 등록/새 파일/워터마크
+    # ============================================================
+    def test_register_counts_each_file_once(self):
+        count = self.store.register_files('A', ['A_20260101000000', 'A_20260101000000', 'A_20260102000000'])
+        self.assertEqual(count, 2)
+        self.assertEqual(self.store.get_existing_files('A'), {'A_20260101000000', 'A_20260102000000'})
+
+    def test_find_new_files(self):
+        self.store.register_files('A', ['A_20260101000000', 'A_20260102000000'])
+        new_files = self.store.find_new_files(['A_20260103000000', 'A_20260101000000', 'A_20260103000000'])
+        self.assertEqual(new_files, ['A_20260103000000'])
+        self.assertEqual(self.store.find_new_files([]), [])
+
+    def test_watermark_ignores_other_tables(self):
+        self.store.register_files('A', ['A_20260101000000', 'A_x'])
+        self.store.register_files('A_9', ['A_9_20260101000000'])
+        self.assertEqual(self.store.get_file_watermark('A'), 'A_20260101000000')
+        self.assertEqual(self.store.get_file_watermark('A_9'), 'A_9_20260101000000')
+        self.assertIsNone(self.store.get_file_watermark('B'))
+
+    # ============================================================
+    # 전송 상태 전이
+    # ============================================================
+    def test_transfer_state_transitions(self):
+        self.store.save_auto_config('A', '/src', '/dest', 10, 'Y')
+        self.store.register_files('A', ['A_1', 'A_2'])
+        self.assertEqual(self.pending('A'), [
+            ('A_1', FILE_STATE_DISCOVERED, 0, None, 0),
+            ('A_2', FILE_STATE_DISCOVERED, 0, None, 0),
+        ])
+
+        self.store.update_transfer_state('A_1', FILE_STATE_STAGED, 0, 100)
+        self.store.update_transfer_state('A_1', FILE_STATE_UPLOADING, 40, wait=False)
+        self.store.update_transfer_state('A_2', FILE_STATE_FAILED)
+        self.assertEqual(self.pending('A'), [
+            ('A_1', FILE_STATE_UPLOADING, 40, 100, 0),
+            ('A_2', FILE_STATE_FAILED, 0, None, 1),
+        ])
+
+        self.store.update_files_transfer_state(['A_1', 'A_1'], FILE_STATE_VERIFIED)
+        self.assertEqual(self.pending('A'), [('A_2', FILE_STATE_FAILED, 0, None, 1)])
+        self.assertEqual(self.store.get_pending_files_count('A'), 1)
+
+        # 다시 등록하면 처음 상태로 초기화 (재시도 횟수 포함)
+        self.store.register_files('A', ['A_2'])
+        self.assertEqual(self.pending('A'), [('A_2', FILE_STATE_DISCOVERED, 0, None, 0)])
+
+    def test_pending_requires_enabled_config(self):
+        self.store.save_auto_config('A', '/src', '/dest', 10, 'N')
+        self.store.register_files('A', ['A_1'])
+        self.assertEqual(self.pending('A'), [])
+
+    # ============================================================
+    # 테이블 임대
+    # ============================================================
+    def test_table_leases(self):
+        now = 1000.0
+        self.assertTrue(self.store.try_acquire_table_lease('A', 'one', now, 30))
+        self.assertFalse(self.store.try_acquire_table_lease('A', 'two', now + 10, 30))
+        self.assertTrue(self.store.try_acquire_table_lease('A', 'one', now + 20, 30))
+        self.assertEqual(self.store.get_owned_tables('one', now + 20), {'A'})
+
+        # 만료된 임대는 다른 인스턴스가 가져감
+        self.assertTrue(self.store.try_acquire_table_lease('A', 'two', now + 51, 30))
+        self.assertEqual(self.store.get_owned_tables('one', now + 51), set())
+        self.assertEqual(self.store.get_owned_tables('two', now + 51), {'A'})
+
+        self.store.release_table_lease('A', 'one')
+        self.assertEqual(self.store.get_owned_tables('two', now + 51), {'A'})
+        self.store.release_all_table_leases('two')
+        self.assertEqual(self.store.get_owned_tables('two', now + 51), set())
+
+    # ============================================================
+    # 작업 로그 집계
+    # ============================================================
+    def test_rollup_task_log(self):
+        self.store.save_auto_config('A', '/src', '/dest', 10, 'Y')
+        self.store.register_files('A', ['A_1', 'A_2', 'A_3'])
+        self.store.update_transfer_state('A_2', FILE_STATE_STAGED, 0, 700)
+
+        self.store.log_task('A', 'A_1', '2026-01-01 10:00:00', None,
+                            {'start_ts': 100.0, 'end_ts': 102.0, 'bytes': 300})
+        # 바이트 수가 없으면 FILE_INFO의 파일 크기 사용
+        self.store.log_task('A', 'A_2', '2026-01-01 11:00:00', None,
+                            {'start_ts': 200.0, 'end_ts': 205.0})
+        self.store.log_task('A', 'A_3', '2026-01-01 12:00:00', 'timeout',
+                            {'start_ts': 300.0, 'end_ts': 301.0, 'bytes': 50})
+        self.store.log_task('A', 'A_1', '2026-01-02 10:00:00', None,
+                            {'start_ts': 400.0, 'end_ts': 401.0, 'bytes': 10})
+        self.store.flush_writes()
+
+        self.assertEqual(self.store.rollup_task_log(), 4)
+        self.assertEqual(self.store.rollup_task_log(), 0)
+        self.store.log_task('A', 'A_1', '2026-01-02 11:00:00', None,
+                            {'start_ts': 500.0, 'end_ts': 503.0, 'bytes': 20})
+        self.store.flush_writes()
+        self.assertEqual(self.store.rollup_task_log(), 1)
+
+        daily = [tuple(row) for row in self.store.get_task_log_daily('A')]
+        self.assertEqual(daily, [
+            ('A', '2026-01-01', 3, 1, 1000, 8.0, 5.0),
+            ('A', '2026-01-02', 2, 0, 30, 4.0, 3.0),
+        ])
+        self.assertEqual([tuple(row) for row in self.store.get_task_log_daily('A', '2026-01-02')],
+                         daily[1:])
+
+
+class DatabaseManagerParityTest(StateStoreParityMixin, unittest.TestCase):
+
+    def make_store(self):
+        return DatabaseManager(os.path.join(self.tmp_dir, 'state.db'))
+
+
+class MemoryStateStoreParityTest(StateStoreParityMixin, unittest.TestCase):
+
+    def make_store(self):
+        return MemoryStateStore()
+
+
+class SqlStateStoreParityTest(StateStoreParityMixin, unittest.TestCase):
+
+    def make_store(self):
+        path = os.path.join(self.tmp_dir, 'shared.db')
+        return SqlStateStore(lambda: sqlite3.connect(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
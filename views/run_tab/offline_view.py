@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
+import glob
 
 
 class OfflineRunView:
@@ -74,6 +75,15 @@ class OfflineRunView:
         )
         btn_browse_select.grid(row=0, column=2, padx=5, pady=5, ipadx=5)
         
+        # 폴더 선택 (폴더 또는 glob 패턴이면 일괄 변환)
+        btn_browse_folder = ttk.Button(
+            frame_file_select, 
+            text="폴더 선택", 
+            width=10,
+            command=lambda: self.browse_path('folder')
+        )
+        btn_browse_folder.grid(row=0, column=3, padx=5, pady=5, ipadx=5)
+        
         # 저장 경로 선택
         tk.Label(frame_file_select, text="저장 경로 :").grid(row=1, column=0, sticky="w", padx=5, pady=5)
         self.entry_save_path = tk.Entry(frame_file_select, width=60)
@@ -173,7 +183,7 @@ class OfflineRunView:
         """파일 경로 선택 다이얼로그
         
         Args:
-            path_type (str): 경로 유형 ('select' 또는 'save')
+            path_type (str): 경로 유형 ('select', 'folder' 또는 'save')
         """
         if path_type == 'select':
             # XML 파일 선택 다이얼로그
@@ -184,6 +194,14 @@ class OfflineRunView:
             if file_path:
                 self.entry_select_path.delete(0, tk.END)
                 self.entry_select_path.insert(0, file_path)
+        elif path_type == 'folder':
+            # XML 파일 폴더 선택 다이얼로그 (일괄 변환)
+            dir_path = filedialog.askdirectory(
+                initialdir=self.entry_select_path.get() if self.entry_select_path.get() else "/"
+            )
+            if dir_path:
+                self.entry_select_path.delete(0, tk.END)
+                self.entry_select_path.insert(0, dir_path)
         else:
             # 저장 경로 선택 다이얼로그
             dir_path = filedialog.askdirectory(
@@ -275,7 +293,10 @@ class OfflineRunView:
             messagebox.showerror("오류", "XML 파일을 선택해주세요.")
             return
         
-        if not os.path.exists(xml_file_path):
+        # 폴더 또는 glob 패턴이면 일괄 변환
+        is_batch = os.path.isdir(xml_file_path) or glob.has_magic(xml_file_path)
+        
+        if not is_batch and not os.path.exists(xml_file_path):
             messagebox.showerror("오류", "선택한 XML 파일이 존재하지 않습니다.")
             return
         
@@ -290,7 +311,10 @@ class OfflineRunView:
             self.tree_result.delete(item)
         
         # 파싱 작업 시작
-        success = self.execution_controller.start_parse(xml_file_path, save_path)
+        if is_batch:
+            success = self.execution_controller.start_batch_parse(xml_file_path, save_path)
+        else:
+            success = self.execution_controller.start_parse(xml_file_path, save_path)
         
         if success:
             # 상태 업데이트
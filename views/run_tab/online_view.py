@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import datetime
 import os
+import threading
 
 
 class OnlineRunView:
@@ -26,6 +27,14 @@ class OnlineRunView:
         self.progress_indicators = {}
         self.progress_data = {}
         
+        # 데이터 확인 페이지 상태 (스크롤 시 다음 페이지 조회)
+        self.page_size = 100
+        self.page_table = None
+        self.page_cursor = None
+        self.page_sort_column = None
+        self.page_sort_desc = False
+        self.page_loading = False
+        
         # 콜백 설정
         self.execution_controller.set_callbacks(
             progress_callback=self.update_progress,
@@ -127,6 +136,13 @@ class OnlineRunView:
         self.lbl_excel_download.bind("<Enter>", self.on_download_hover_enter)
         self.lbl_excel_download.bind("<Leave>", self.on_download_hover_leave)
         
+        # 작업 로그 검색 (파일명/오류 메시지)
+        tk.Label(top_frame, text="작업 로그 검색").pack(side="left")
+        self.entry_search = tk.Entry(top_frame, width=30)
+        self.entry_search.pack(side="left", padx=5)
+        self.entry_search.bind("<Return>", self.search_task_log)
+        tk.Button(top_frame, text="🔍 검색", command=self.search_task_log).pack(side="left")
+        
         # 테이블 목록 및 데이터 영역
         bottom_frame = tk.Frame(frame_db)
         bottom_frame.pack(fill="both", expand=True, padx=5, pady=5)
@@ -152,9 +168,12 @@ class OnlineRunView:
         self.tree = ttk.Treeview(frame_right, show="headings", height=15)
         self.tree.grid(row=0, column=0, sticky="nsew")
         
+        self.scrollbar_y = tk.Scrollbar(frame_right, orient="vertical", command=self.tree.yview)
+        self.scrollbar_y.grid(row=0, column=1, sticky="ns")
+        
         self.scrollbar_x = tk.Scrollbar(frame_right, orient="horizontal", command=self.tree.xview)
         self.scrollbar_x.grid(row=1, column=0, sticky="ew")
-        self.tree.config(xscrollcommand=self.scrollbar_x.set)
+        self.tree.config(xscrollcommand=self.scrollbar_x.set, yscrollcommand=self.on_tree_yscroll)
         
         frame_right.columnconfigure(0, weight=1)
         frame_right.rowconfigure(0, weight=1)
@@ -452,16 +471,28 @@ class OnlineRunView:
         
         table_name = self.listbox.get(selected_index[0])
         
+        # 다른 테이블을 선택하면 정렬 초기화
+        if table_name != self.page_table:
+            self.page_sort_column = None
+            self.page_sort_desc = False
+        self.page_table = table_name
+        self.page_cursor = None
+        
         try:
-            # 테이블 데이터 조회 (SQLite 관리 테이블 데이터 표시)
-            columns, rows = self.execution_controller.load_table_data(table_name)
+            # 첫 페이지 조회 (SQLite 관리 테이블 데이터 표시)
+            columns, rows, self.page_cursor = self.execution_controller.load_table_page(
+                table_name, None, self.page_size, self.page_sort_column, self.page_sort_desc
+            )
             
             # 트리뷰 초기화 및 컬럼 설정
             self.tree["columns"] = columns
             self.tree.delete(*self.tree.get_children())
             
             for col in columns:
-                self.tree.heading(col, text=col)
+                text = col
+                if col == self.page_sort_column:
+                    text += " ▼" if self.page_sort_desc else " ▲"
+                self.tree.heading(col, text=text, command=lambda c=col: self.sort_table_data(c))
                 self.tree.column(col, anchor="center", width=150, minwidth=150, stretch=False)
             
             # 조회 데이터 트리뷰에 추가
@@ -474,12 +505,112 @@ class OnlineRunView:
         except Exception as e:
             print(f"{table_name} 데이터 불러오기 오류: {e}")
     
+    def search_task_log(self, event=None):
+        """작업 로그 검색 결과를 트리뷰에 표시
+        
+        Args:
+            event: 이벤트 객체 (None일 수 있음)
+        """
+        text = self.entry_search.get().strip()
+        if not text:
+            # 검색어를 지우면 선택된 테이블 데이터로 복귀
+            self.load_table_data(None)
+            return
+        
+        columns, rows = self.execution_controller.search_task_log(text)
+        
+        # 검색 결과는 페이지 조회 대상이 아님
+        self.page_table = None
+        self.page_cursor = None
+        self.listbox.selection_clear(0, tk.END)
+        
+        self.tree["columns"] = columns
+        self.tree.delete(*self.tree.get_children())
+        for col in columns:
+            self.tree.heading(col, text=col, command="")
+            self.tree.column(col, anchor="center", width=150, minwidth=150, stretch=False)
+        self.tree.column('ERROR_MSG', anchor="w", width=400)
+        
+        for row in rows:
+            self.tree.insert("", "end", values=row)
+        
+        if not rows:
+            messagebox.showinfo("알림", f"'{text}' 검색 결과가 없습니다.")
+    
+    def sort_table_data(self, column):
+        """컬럼 헤더 클릭 시 정렬 변경 (DB에서 정렬 후 첫 페이지부터 다시 조회)
+        
+        Args:
+            column (str): 정렬 컬럼명
+        """
+        if self.page_sort_column == column:
+            self.page_sort_desc = not self.page_sort_desc
+        else:
+            self.page_sort_column = column
+            self.page_sort_desc = False
+        self.load_table_data(None)
+    
+    def on_tree_yscroll(self, first, last):
+        """트리뷰 세로 스크롤 (끝에 가까워지면 다음 페이지 조회)
+        
+        Args:
+            first (str): 보이는 영역 시작 비율
+            last (str): 보이는 영역 끝 비율
+        """
+        self.scrollbar_y.set(first, last)
+        if float(last) > 0.9 and self.page_cursor is not None and not self.page_loading:
+            self.page_loading = True
+            self.tree.after_idle(self.load_next_page)
+    
+    def load_next_page(self):
+        """다음 페이지를 백그라운드 스레드에서 조회 (스크롤 중 UI가 멈추지 않도록)"""
+        if self.page_cursor is None or not self.page_table:
+            self.page_loading = False
+            return
+        request = (self.page_table, self.page_cursor, self.page_sort_column, self.page_sort_desc)
+        
+        def run():
+            try:
+                _, rows, next_cursor = self.execution_controller.load_table_page(
+                    request[0], request[1], self.page_size, request[2], request[3]
+                )
+            except Exception as e:
+                print(f"{request[0]} 다음 페이지 불러오기 오류: {e}")
+                rows, next_cursor = None, request[1]
+            self.parent.after(0, lambda: self.append_page(request, rows, next_cursor))
+        
+        threading.Thread(target=run, daemon=True).start()
+    
+    def append_page(self, request, rows, next_cursor):
+        """조회한 다음 페이지를 트리뷰 끝에 추가
+        
+        Args:
+            request (tuple): 조회 시점의 (테이블명, 커서, 정렬 컬럼, 내림차순 여부)
+            rows (list): 조회한 행 목록 (오류 시 None)
+            next_cursor (tuple): 다음 페이지 커서
+        """
+        self.page_loading = False
+        # 조회 중 테이블/정렬이 바뀌었으면 결과 무시
+        if request != (self.page_table, self.page_cursor, self.page_sort_column, self.page_sort_desc):
+            return
+        if rows is None:
+            return
+        self.page_cursor = next_cursor
+        for row in rows:
+            self.tree.insert("", "end", values=row)
+    
     def export_to_csv(self, event=None):
-        """테이블 데이터 CSV 내보내기
+        """테이블 데이터 CSV 내보내기 (백그라운드 실행, 진행 중 클릭 시 취소)
         
         Args:
             event: 이벤트 객체 (None일 수 있음)
         """
+        # 내보내기 진행 중이면 취소 요청
+        if self.execution_controller.export_active:
+            if messagebox.askyesno("확인", "CSV 내보내기를 취소하시겠습니까?"):
+                self.execution_controller.cancel_export()
+            return
+        
         # 선택된 테이블 확인
         selected_index = self.listbox.curselection()
         if not selected_index:
@@ -491,21 +622,56 @@ class OnlineRunView:
         # 파일 저장 경로 선택
         file_path = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            filetypes=[("CSV 파일", "*.csv"), ("모든 파일", "*.*")],
+            filetypes=[("CSV 파일", "*.csv"), ("CSV 압축 파일", "*.csv.gz"), ("모든 파일", "*.*")],
             initialfile=f"{table_name}_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         )
         
         if not file_path:
             return
         
-        try:
-            # CSV 내보내기 실행
-            success = self.execution_controller.export_to_csv(table_name, file_path)
-            
-            if success:
-                messagebox.showinfo("완료", f"{table_name} 테이블이 CSV 파일로 저장되었습니다.\n\n저장 위치 : {file_path}")
-        except Exception as e:
-            messagebox.showerror("오류", f"CSV 파일 저장 중 오류가 발생했습니다.\n{str(e)}")
+        def on_progress(written, total):
+            self.parent.after(0, lambda: self.update_export_progress(written, total))
+        
+        def on_finish(status, written):
+            self.parent.after(0, lambda: self.on_export_finished(table_name, file_path, status, written))
+        
+        # CSV 내보내기 실행 (백그라운드)
+        if self.execution_controller.start_export(table_name, file_path,
+                                                  progress_callback=on_progress,
+                                                  finish_callback=on_finish):
+            self.lbl_excel_download.config(text="⭳ 내보내는 중... (클릭 시 취소)")
+    
+    def update_export_progress(self, written, total):
+        """CSV 내보내기 진행률 표시
+        
+        Args:
+            written (int): 기록한 행 수
+            total (int): 전체 행 수
+        """
+        if not self.execution_controller.export_active:
+            return
+        percent = int(written * 100 / total) if total else 0
+        self.lbl_excel_download.config(text=f"⭳ 내보내는 중... {percent}% (클릭 시 취소)")
+    
+    def on_export_finished(self, table_name, file_path, status, written):
+        """CSV 내보내기 종료 처리
+        
+        Args:
+            table_name (str): 테이블명
+            file_path (str): 저장 파일 경로
+            status (str): 종료 상태 ("완료", "데이터 없음", "중단", "오류")
+            written (int): 기록한 행 수
+        """
+        self.lbl_excel_download.config(text="⭳ CSV로 다운로드")
+        
+        if status == "완료":
+            messagebox.showinfo("완료", f"{table_name} 테이블이 CSV 파일로 저장되었습니다. ({written:,}행)\n\n저장 위치 : {file_path}")
+        elif status == "데이터 없음":
+            messagebox.showinfo("알림", f"{table_name} 테이블에 내보낼 데이터가 없습니다.")
+        elif status == "중단":
+            messagebox.showinfo("알림", "CSV 내보내기가 취소되었습니다.")
+        else:
+            messagebox.showerror("오류", "CSV 파일 저장 중 오류가 발생했습니다.\n로그를 확인해주세요.")
     
     def on_download_hover_enter(self, event):
         """다운로드 라벨 마우스 진입 이벤트